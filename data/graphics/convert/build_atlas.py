@@ -0,0 +1,130 @@
+# data/graphics/convert/build_atlas.py
+# Packs the entity and panel icons into a few atlas pages plus a JSON index (data/graphics/atlas),
+# which the AssetManager loads at startup instead of opening every icon file.
+# Run from anywhere after adding or changing an icon:  python data/graphics/convert/build_atlas.py
+# --check only reports whether the atlas is out of date (exit code 1 if it is).
+#
+# The icons packed are the ones the game preloads: every entity _icon* and every image a panel
+# registers with asset_manager.register(), at their own size (at most MAX_IMAGE_SIZE) and at
+# each fixed size registered with them, so those are blitted without scaling at runtime.
+
+import hashlib
+import json
+import os
+import sys
+
+GAME_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+PAGE_SIZE = 1024  # Width and maximum height of an atlas page
+MAX_IMAGE_SIZE = 256  # Larger sources are scaled down, the UI never draws an icon bigger than this
+PADDING = 2  # Transparent pixels between images
+
+def collect_images(asset_manager, atlas_key):
+    """[(atlas key, source path, [(width, height)])] of every image the game preloads."""
+    images = []
+    for path in asset_manager.asset_paths():
+        source = path if os.path.isabs(path) else os.path.join(GAME_FOLDER, path)
+        if not os.path.exists(source):
+            print(f"Missing: {atlas_key(path)}, skipped")
+            continue
+        images.append((atlas_key(path), source, asset_manager.asset_sizes(path)))
+    return images
+
+def source_hash(images):
+    digest = hashlib.sha1()
+    for key, source, sizes in images:
+        digest.update(key.encode('utf-8'))
+        digest.update(repr(sizes).encode('utf-8'))
+        with open(source, 'rb') as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()
+
+def base_size(width, height):
+    scale = min(1.0, MAX_IMAGE_SIZE / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def pack(rect_sizes):
+    """
+    Shelf packing, tallest first: rows of images left to right, a new page when one is full.
+    Returns [(page, x, y)] in the order of rect_sizes.
+    """
+    order = sorted(range(len(rect_sizes)), key=lambda i: (-rect_sizes[i][1], -rect_sizes[i][0]))
+    positions = [None] * len(rect_sizes)
+    page = x = y = shelf_height = 0
+    for i in order:
+        width, height = rect_sizes[i]
+        if x + width > PAGE_SIZE:
+            x, y = 0, y + shelf_height + PADDING
+            shelf_height = 0
+        if y + height > PAGE_SIZE:
+            page, x, y, shelf_height = page + 1, 0, 0, 0
+        positions[i] = (page, x, y)
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+    return positions
+
+def build(pygame, images, atlas_folder, index_name):
+    # Every rect to pack: the image at its base size first, then its registered sizes
+    rects = []  # (image number, (width, height), source surface)
+    for number, (key, source, sizes) in enumerate(images):
+        surf = pygame.image.load(source)
+        size = base_size(*surf.get_size())
+        rects.append((number, size, surf))
+        for width, height in sizes:
+            if (width, height) != size and max(width, height) <= PAGE_SIZE:
+                rects.append((number, (width, height), surf))
+    positions = pack([size for _, size, _ in rects])
+    page_count = max(page for page, _, _ in positions) + 1 if positions else 0
+    # Pages are cut to the height they use, fewer pixels to decode at startup
+    page_heights = [0] * page_count
+    for (_, size, _), (page, _, y) in zip(rects, positions):
+        page_heights[page] = max(page_heights[page], y + size[1])
+    pages = [pygame.Surface((PAGE_SIZE, height), pygame.SRCALPHA) for height in page_heights]
+    entries = {}
+    for (number, size, surf), (page, x, y) in zip(rects, positions):
+        if surf.get_size() != size:
+            surf = pygame.transform.smoothscale(surf.convert_alpha(), size)
+        pages[page].blit(surf, (x, y))
+        key = images[number][0]
+        entry = entries.setdefault(key, {'size': list(size), 'rects': []})
+        entry['rects'].append([page, x, y, size[0], size[1]])
+
+    os.makedirs(atlas_folder, exist_ok=True)
+    for name in os.listdir(atlas_folder):
+        if name.startswith('atlas_') and name.endswith('.png'):
+            os.remove(os.path.join(atlas_folder, name))  # Pages of an earlier, bigger build
+    page_names = []
+    for number, page in enumerate(pages):
+        page_names.append(f"atlas_{number}.png")
+        pygame.image.save(page, os.path.join(atlas_folder, page_names[-1]))
+    index = {'source_hash': source_hash(images), 'pages': page_names, 'images': entries}
+    with open(os.path.join(atlas_folder, index_name), 'w', encoding='utf-8') as index_file:
+        json.dump(index, index_file, indent=1, sort_keys=True)
+    print(f"Packed {len(images)} images ({len(rects)} sizes) into {page_count} pages in {atlas_folder}")
+
+def main():
+    # The game's modules register their icons when imported, resource_path() resolves from the game folder
+    os.chdir(GAME_FOLDER)
+    sys.path.insert(0, GAME_FOLDER)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    import game_core.game_loop  # noqa: F401
+    from game_other.asset_manager import asset_manager, atlas_key, ATLAS_INDEX
+
+    images = collect_images(asset_manager, atlas_key)
+    atlas_folder = os.path.dirname(os.path.join(GAME_FOLDER, ATLAS_INDEX))
+    index_path = os.path.join(GAME_FOLDER, ATLAS_INDEX)
+    if '--check' in sys.argv:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                up_to_date = json.load(index_file).get('source_hash') == source_hash(images)
+        except (OSError, ValueError):
+            up_to_date = False
+        print("Atlas is up to date" if up_to_date else "Atlas is out of date, run build_atlas.py")
+        sys.exit(0 if up_to_date else 1)
+    build(pygame, images, atlas_folder, os.path.basename(ATLAS_INDEX))
+
+if __name__ == '__main__':
+    main()
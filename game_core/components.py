@@ -0,0 +1,174 @@
+# game_core/components.py
+# Struct-of-arrays storage for the hot per-tick fields of SatisfiableEntity.
+
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Optional, only needed for vectorized access through ComponentStore.view()
+    np = None
+
+# (field name, array typecode)
+COMPONENT_FIELDS = (
+    ('bar1_timer', 'i'),
+    ('special_timer', 'i'),
+    ('is_satisfied', 'b'),
+    ('is_initialized', 'b'),
+    ('is_broken', 'b'),
+    ('has_special', 'b'),
+    ('power_drain', 'd'),
+    ('_progress_bar_frame_counter', 'i'),
+)
+COMPONENT_FIELD_NAMES = tuple(name for name, _ in COMPONENT_FIELDS)
+NULLABLE_FIELDS = frozenset(('bar1_timer', 'special_timer'))
+NONE_SENTINEL = -1  # Stored instead of None in nullable (timer) columns
+
+_NUMPY_DTYPES = {'i': 'i4', 'b': 'i1', 'd': 'f8'}
+
+class ComponentStore:
+    """
+    One array per field in COMPONENT_FIELDS, indexed by slot. Placed entities get a slot from
+    EntityRegistry (attach) and give it back on removal (detach); until then they keep the
+    values in their own _detached dict. Column objects are never replaced, only grown in place.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ComponentStore, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.columns = {name: array(code) for name, code in COMPONENT_FIELDS}
+        self.batched = array('b')  # slot -> 1 if the entity's bars are advanced by the SatCheckScheduler
+        self.owners = []  # slot -> entity or None
+        self._free = []
+        # Held while columns grow (attach) and while NumPy views are alive, entities may be placed from other threads
+        self.lock = threading.Lock()
+        self._initialized = True
+
+    def clear(self):
+        for owner in self.owners:
+            if owner is not None:
+                self.detach(owner)
+        with self.lock:
+            for column in self.columns.values():
+                del column[:]
+            del self.batched[:]
+            self.owners.clear()
+            self._free.clear()
+
+    def __len__(self):
+        return len(self.owners)  # Number of slots, including free ones
+
+    def attach(self, entity):
+        if entity.__dict__.get('_slot', 0) != -1:
+            return  # Not a component entity, or already attached
+        with self.lock:
+            self._attach(entity)
+
+    def _attach(self, entity):
+        values = entity._detached
+        batched = 1 if getattr(entity, '_batched_update', False) else 0
+        if self._free:
+            slot = self._free.pop()
+            self.owners[slot] = entity
+            self.batched[slot] = batched
+            for name, column in self.columns.items():
+                column[slot] = _to_column(name, values[name])
+        else:
+            slot = len(self.owners)
+            self.owners.append(entity)
+            self.batched.append(batched)
+            for name, column in self.columns.items():
+                column.append(_to_column(name, values[name]))
+        entity._slot = slot
+        entity._detached = None
+
+    def detach(self, entity):
+        slot = entity.__dict__.get('_slot', -1)
+        if slot < 0:
+            return
+        entity._detached = {name: getattr(entity, name) for name in COMPONENT_FIELD_NAMES}
+        entity._slot = -1
+        self.owners[slot] = None
+        self.batched[slot] = 0
+        self._free.append(slot)
+
+    def copy_columns(self):
+        """Copies of all columns (one memcpy each), read them with column_value()."""
+        with self.lock:
+            return {name: column[:] for name, column in self.columns.items()}
+
+    def view(self, name):
+        """Zero-copy NumPy view of a column (None without NumPy). Drop it before the store grows."""
+        if np is None:
+            return None
+        column = self.batched if name == 'batched' else self.columns[name]
+        return np.frombuffer(column, dtype=_NUMPY_DTYPES[column.typecode])
+
+def column_value(name, column, slot):
+    """Value of field name at slot, as the entity property returns it (None and int conversions)."""
+    value = column[slot]
+    if name in NULLABLE_FIELDS:
+        return None if value == NONE_SENTINEL else value
+    if column.typecode == 'd':
+        return int(value) if value.is_integer() else value
+    return value
+
+def _to_column(name, value):
+    if value is None:
+        return NONE_SENTINEL
+    return value
+
+def _component_property(name, column):
+    if name in NULLABLE_FIELDS:
+        def fget(self):
+            slot = self._slot
+            if slot < 0:
+                return self._detached[name]
+            value = column[slot]
+            return None if value == NONE_SENTINEL else value
+        def fset(self, value):
+            slot = self._slot
+            if slot < 0:
+                self._detached[name] = value
+            else:
+                column[slot] = NONE_SENTINEL if value is None else value
+    elif column.typecode == 'd':
+        def fget(self):
+            slot = self._slot
+            if slot < 0:
+                return self._detached[name]
+            value = column[slot]
+            return int(value) if value.is_integer() else value
+        def fset(self, value):
+            slot = self._slot
+            if slot < 0:
+                self._detached[name] = value
+            else:
+                column[slot] = value
+    else:
+        def fget(self):
+            slot = self._slot
+            if slot < 0:
+                return self._detached[name]
+            return column[slot]
+        def fset(self, value):
+            slot = self._slot
+            if slot < 0:
+                self._detached[name] = value
+            else:
+                column[slot] = value
+    return property(fget, fset)
+
+def component_properties():
+    """Properties for COMPONENT_FIELDS, to be installed on the entity class that owns them."""
+    return {name: _component_property(name, component_store.columns[name]) for name in COMPONENT_FIELD_NAMES}
+
+# Singleton accessor
+component_store = ComponentStore()
@@ -63,7 +63,9 @@ def resource_path(relative_path):
 FONT1 = resource_path("data/fonts/font1.ttf")
 
 def get_font1(size=18):
-    return pygame.font.Font(FONT1, size)
+    # Shared font object, see game_other/asset_manager.py
+    from game_other.asset_manager import asset_manager
+    return asset_manager.font(size)
 
 MIXER_NUM_CHANNELS = 32
 
@@ -14,12 +14,20 @@ def keybinds(event, grid=None, entity_states=None):
             return 'exit'
         if event.key == pygame.K_DELETE:
             if grid is not None and entity_states is not None:
+                from game_core.game_loop import remove_entity
                 for y, row in enumerate(grid):
                     for x, entity in enumerate(row):
                         if entity is not None:
-                            entity_states.remove_entity_at(x, y)
-                            row[x] = None
+                            remove_entity(grid, entity_states, x, y)
                 return 'cleared'
+        if event.key == pygame.K_F9:
+            return 'toggle_trace'
+        if event.key == pygame.K_F10:
+            return 'dump_trace'
+        if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            return 'faster'
+        if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            return 'slower'
         if pygame.K_1 <= event.key <= pygame.K_9:
             return event.key - pygame.K_1
     return None
@@ -341,6 +349,22 @@ class GameControls:
         if global_result == 'cleared':
             GameState().current_construction_class = None
             return None, True
+        if global_result in ('faster', 'slower') and state.get('simulation') is not None:
+            getattr(state['simulation'], global_result)()
+            return None, grid_changed
+        if global_result == 'toggle_trace':
+            from game_other.trace import trace_recorder
+            if trace_recorder.enabled:
+                trace_recorder.disable()
+                print("Trace recording stopped.")
+            else:
+                trace_recorder.enable()
+                print("Trace recording started.")
+            return None, grid_changed
+        if global_result == 'dump_trace':
+            from game_other.trace import trace_recorder
+            trace_recorder.dump()
+            return None, grid_changed
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SEMICOLON:
             handle_panel_toggle_event(event)
             handle_profiler_panel_toggle()
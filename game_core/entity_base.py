@@ -1,24 +1,60 @@
 import pygame
 import re
-import random
 import time
+from collections import OrderedDict
 from .config import *
-from game_core.game_state import GameState, EntityStats
+from game_core.game_state import GameState, EntityStats, TotalsLedger, totals_ledger
+from game_core.rng import rng, input_log
+from game_core.neighbor_tables import neighbor_tables
+from game_core.entity_layer import entity_layer
+from game_core.components import component_properties, COMPONENT_FIELD_NAMES
+from game_other.profiler import profiler
+from game_other.asset_manager import asset_manager
 from game_other.audio import *
 
-# --- ICON CACHE ---
-_ICON_CACHE = {}
+_rng = rng.stream('entities')  # Simulation rolls (satisfaction checks, specials, consumption)
+_spawn_rng = rng.stream('spawn')  # Rolls made when an entity is constructed
 
+# --- ICON CACHE ---
 def get_icon_surface(path):
-    if path in _ICON_CACHE:
-        return _ICON_CACHE[path]
-    try:
-        surf = pygame.image.load(path).convert_alpha()
-        _ICON_CACHE[path] = surf
+    # Loaded once by the asset manager (preloaded at startup for every entity _icon)
+    return asset_manager.image(path)
+
+# --- SCALED ICON CACHE ---
+_SCALED_ICON_CACHE = OrderedDict()  # (path, width, height, alpha) -> surface, least recently used first
+_SCALED_ICON_CACHE_MAX = 256
+_scaled_icon_cell_size = None
+
+def get_scaled_icon_surface(path, width, height, alpha=None):
+    """Icon at path smoothscaled to (width, height), optionally alpha-multiplied. Cached, do not modify the result."""
+    key = (path, int(width), int(height), alpha)
+    surf = _SCALED_ICON_CACHE.get(key)
+    if surf is not None:
+        _SCALED_ICON_CACHE.move_to_end(key)
         return surf
-    except Exception:
-        _ICON_CACHE[path] = None
+    if alpha is None:
+        surf = asset_manager.atlas_image(path, width, height)
+        if surf is not None:
+            return surf
+    icon = get_icon_surface(path)
+    if icon is None:
         return None
+    surf = pygame.transform.smoothscale(icon, (key[1], key[2]))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    if alpha is not None:
+        surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    _SCALED_ICON_CACHE[key] = surf
+    if len(_SCALED_ICON_CACHE) > _SCALED_ICON_CACHE_MAX:
+        _SCALED_ICON_CACHE.popitem(last=False)
+    return surf
+
+def sync_scaled_icon_cache(cell_size):
+    # Scaled icons are only valid for one zoom level, drop them when cell_size changes
+    global _scaled_icon_cell_size
+    if cell_size != _scaled_icon_cell_size:
+        _SCALED_ICON_CACHE.clear()
+        _scaled_icon_cell_size = cell_size
 
 def to_type_from_classname(name):
     return name[0].lower() + name[1:]
@@ -26,6 +62,10 @@ def to_type_from_classname(name):
 def to_display_name_from_classname(name):
     return re.sub(r'([a-z])([A-Z])', r'\1 \2', name).capitalize()
 
+# Fields that change how draw_static renders an entity
+VISUAL_FIELDS = frozenset(('_icon', 'is_initialized', 'is_satisfied', 'is_broken', 'warning_hidden'))
+_WATCHED_FIELDS = TotalsLedger.LEDGER_FIELDS | VISUAL_FIELDS
+
 # region BaseEntity
 
 class BaseEntity:
@@ -42,13 +82,25 @@ class BaseEntity:
     power_drain = 0  # Intended power drain when initialized (override in subclasses)
     _intended_power_drain = None  # Store intended value for restoration
     display_name = None  # Enforce as a class attribute for all entities
+    _needs_update = False  # True for classes that override update()
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
+        cls._needs_update = cls.update is not BaseEntity.update
         # Only set display_name if not set on the class itself (not inherited)
         if 'display_name' not in cls.__dict__ or cls.display_name is None:
             cls.display_name = to_display_name_from_classname(cls.__name__)
 
+    def __setattr__(self, name, value):
+        # While the entity is on the grid, report changes of totals-relevant fields to the ledger
+        # and changes of its look to the entity layer
+        if name in _WATCHED_FIELDS and self.__dict__.get('_ledger_tracked'):
+            if name in TotalsLedger.LEDGER_FIELDS:
+                totals_ledger.on_change(self, name, value)
+            if name in VISUAL_FIELDS and getattr(self, name, None) != value:
+                entity_layer.mark_dirty(self)
+        object.__setattr__(self, name, value)
+
     def __init__(self, x, y):
         self.x, self.y = x, y
         # Always set display_name instance attribute, using class attribute
@@ -58,29 +110,36 @@ class BaseEntity:
         BaseEntity._id_counter += 1
         self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')  # Human-readable creation time       
         # Store intended power_drain and start with 0 until initialized
-        self._intended_power_drain = getattr(self.__class__, 'power_drain', 0)
+        self._intended_power_drain = self.class_default('power_drain', 0)
         self.power_drain = 0
 
     def update(self, grid):
         pass  # No-op for base class, avoids AttributeError in main loop
 
     def draw(self, surface, offset=(0, 0), cell_size=64, static_only=False):
+        if not static_only:
+            self.draw_static(surface, offset, cell_size)
+            self.draw_dynamic(surface, offset, cell_size)
+
+    def draw_static(self, surface, offset=(0, 0), cell_size=64):
+        # Icon and status highlight, only changes with VISUAL_FIELDS (cached by the entity layer)
         icon_path = self._icon if hasattr(self, '_icon') else self.__class__._icon
         if getattr(self, '_last_icon_path', None) != icon_path:
             self._icon_surface = get_icon_surface(icon_path)
             self._last_icon_path = icon_path
-        if self._icon_surface and not static_only:
+        if self._icon_surface:
             width = getattr(self, 'width', 1)
             height = getattr(self, 'height', 1)
             margin = cell_size - CELL_SIZE_INNER
             icon_w = cell_size * width - margin
             icon_h = cell_size * height - margin
-            icon = pygame.transform.smoothscale(self._icon_surface, (int(icon_w), int(icon_h)))
+            icon = get_scaled_icon_surface(icon_path, icon_w, icon_h)
             cell_x = self.x * cell_size + offset[0]
             cell_y = self.y * cell_size + offset[1]
             icon_x = cell_x + (cell_size * width - icon_w) // 2
             icon_y = cell_y + (cell_size * height - icon_h) // 2
             surface.blit(icon, (icon_x, icon_y))
+            profiler.count('blits')
         # Draw highlight overlay if initialized and unsatisfied, or if broken, and warning_hidden is 0
         highlight_color = None
         if (
@@ -89,7 +148,7 @@ class BaseEntity:
             highlight_color = STATUS_MID_COL
         if getattr(self, 'is_broken', 0):
             highlight_color = STATUS_BAD_COL
-        if highlight_color and not getattr(self, 'warning_hidden', 0) and not static_only:
+        if highlight_color and not getattr(self, 'warning_hidden', 0):
             width = getattr(self, 'width', 1)
             height = getattr(self, 'height', 1)
             margin = cell_size - CELL_SIZE_INNER
@@ -99,11 +158,13 @@ class BaseEntity:
             y = self.y * cell_size + offset[1] + (cell_size * height - rect_size_h) // 2
             border_radius = 3
             pygame.draw.rect(surface, highlight_color, (x, y, rect_size_w, rect_size_h), 3, border_radius=border_radius)
-        if not static_only:
-            if getattr(self, "has_bar1", 1) and not getattr(self, 'has_sat_check_bar_hidden', 0) and hasattr(self, 'draw_bar1'):
-                self.draw_bar1(surface, offset[0], offset[1], cell_size)
-            if getattr(self, "has_special", 0) and not getattr(self, 'special_hidden', 0) and hasattr(self, 'draw_special'):
-                self.draw_special(surface, offset[0], offset[1], cell_size)
+
+    def draw_dynamic(self, surface, offset=(0, 0), cell_size=64):
+        # Animated parts drawn every frame on top of the entity layer (progress bars)
+        if getattr(self, "has_bar1", 1) and not getattr(self, 'has_sat_check_bar_hidden', 0) and hasattr(self, 'draw_bar1'):
+            self.draw_bar1(surface, offset[0], offset[1], cell_size)
+        if getattr(self, "has_special", 0) and not getattr(self, 'special_hidden', 0) and hasattr(self, 'draw_special'):
+            self.draw_special(surface, offset[0], offset[1], cell_size)
 
     def to_dict(self):
         from game_core.entity_definitions import to_type_from_classname
@@ -116,15 +177,26 @@ class BaseEntity:
         for k in dir(self.__class__):
             if (not k.startswith('_') and k not in d and not callable(getattr(self.__class__, k))
                 and not k.startswith('$')):
-                d[k] = getattr(self.__class__, k)
+                d[k] = getattr(self, k) if isinstance(getattr(self.__class__, k), property) else getattr(self.__class__, k)
         return d
 
+    @classmethod
+    def class_default(cls, name, default=None):
+        # Class-level value of a field, including fields whose defaults moved into _component_defaults
+        defaults = getattr(cls, '_component_defaults', None)
+        if defaults is not None and name in defaults:
+            return defaults[name]
+        return getattr(cls, name, default)
+
     @classmethod
     def from_dict(cls, data):
         obj = cls(data['x'], data['y'])
         for k, v in data.items():
             if k in ('x', 'y'):
                 continue  # Already set
+            attr = getattr(cls, k, None)
+            if isinstance(attr, property) and attr.fset is None:
+                continue  # Computed from other fields (e.g. Artist.special_chance)
             setattr(obj, k, v)
         return obj
 
@@ -139,11 +211,13 @@ class BaseEntity:
                 attrs.add(k)
         d = {'type': to_type_from_classname(type(self).__name__)}
         for k in sorted(attrs):
-            d[k] = getattr(self, k, getattr(self.__class__, k, None))
+            d[k] = getattr(self, k, self.class_default(k))
         return d
 
     def on_built(self, is_move=False):
         """Call this after the entity is actually built/placed to deduct its purchase cost from total_money and add upkeep to total_upkeep. If is_move is True, do not deduct money or play purchase sound."""
+        # Logged before any roll, so a replay rebuilds this exact entity and repeats the same rolls
+        input_log.record('build', entity=self.to_dict(), is_move=is_move)
         gs = GameState()
         cost = getattr(self, 'purchase_cost', 0)
         if not is_move:
@@ -154,7 +228,7 @@ class BaseEntity:
             else:
                 play_build_sound()
         # 10% chance to increase current_lvl_experience by 1 (with level up)
-        if hasattr(gs, 'add_experience') and random.random() < 0.1:
+        if hasattr(gs, 'add_experience') and _rng.random() < 0.1:
             gs.add_experience(1)
 
     def on_initialized(self):
@@ -174,23 +248,75 @@ class SatisfiableEntity(BaseEntity):
     _BAR_HEIGHT_RATIO = 0.15
     _BAR_DURATION_FRAMES = 300
     _BAR_REFRESH_RATE = 1
+    _render_alpha = 0.0  # Fraction of the next simulation tick already elapsed, set by the render loop
     has_sat_check_bar = 1
     has_sat_check_bar_hidden = 0
-    has_special = 0
     has_special_hidden = 0  # New: allows hiding special bar
     special_chance = 1
     warning_hidden = 0
-    is_satisfied = 0
-    is_initialized = 0
     is_risky = 0
-    is_broken = 0
     state = "Init"
+    # Hot per-tick fields live in the component store, class-level values become per-class defaults
+    _component_defaults = {
+        'bar1_timer': None,
+        'special_timer': None,
+        'is_satisfied': 0,
+        'is_initialized': 0,
+        'is_broken': 0,
+        'has_special': 0,
+        'power_drain': 0,
+        '_progress_bar_frame_counter': 0,
+    }
+    _batched_update = True  # Bars advanced by the SatCheckScheduler instead of update()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Move subclass overrides (e.g. power_drain = 200) out of the way of the properties
+        defaults = dict(cls._component_defaults)
+        for name in COMPONENT_FIELD_NAMES:
+            if name in cls.__dict__ and not isinstance(cls.__dict__[name], property):
+                defaults[name] = cls.__dict__[name]
+                delattr(cls, name)
+        cls._component_defaults = defaults
+        cls._batched_update = (
+            cls.update is SatisfiableEntity.update
+            and cls._update_sat_check_bar is SatisfiableEntity._update_sat_check_bar
+            and cls._update_special_bar is SatisfiableEntity._update_special_bar
+            and cls._BAR_DURATION_FRAMES == SatisfiableEntity._BAR_DURATION_FRAMES
+            and cls._BAR_REFRESH_RATE == SatisfiableEntity._BAR_REFRESH_RATE
+        )
+
+    @property
+    def bar1(self):
+        timer = self.bar1_timer
+        return None if timer is None else timer / self._BAR_DURATION_FRAMES
+
+    @bar1.setter
+    def bar1(self, value):
+        self.bar1_timer = None if value is None else int(round(value * self._BAR_DURATION_FRAMES))
+
+    @property
+    def special(self):
+        timer = self.special_timer
+        return None if timer is None else timer / self._BAR_DURATION_FRAMES
+
+    @special.setter
+    def special(self, value):
+        self.special_timer = None if value is None else int(round(value * self._BAR_DURATION_FRAMES))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._slot >= 0:
+            state['_detached'] = {name: getattr(self, name) for name in COMPONENT_FIELD_NAMES}
+            state['_slot'] = -1
+        return state
 
     def __init__(self, x, y):
+        self._slot = -1  # Component store slot, assigned while the entity is placed
+        self._detached = dict(self._component_defaults)
         super().__init__(x, y)
-        self.bar1 = 0.0 if self.has_sat_check_bar else None
+        # bar1 and special are derived from their timers
         self.bar1_timer = 0 if self.has_sat_check_bar else None
-        self.special = 0.0 if self.has_special else None
         self.special_timer = 0 if self.has_special else None
         self._progress_bar_frame_counter = 0
         self.on_spawn()
@@ -198,43 +324,24 @@ class SatisfiableEntity(BaseEntity):
     def on_spawn(self):
         pass
 
-    def count_entities_in_proximity(self, grid, entity_type, radius, predicate=None):
+    def count_entities_in_proximity(self, grid, entity_type, radius, predicate=None, limit=None):
+        """Count entities of entity_type within Manhattan radius (via the neighbor tables). Stops early once limit is reached."""
         count = 0
-        for row in grid:
-            for entity in row:
-                if entity is not None:
-                    # Accept class or string for entity_type
-                    if isinstance(entity_type, type):
-                        match = isinstance(entity, entity_type)
-                    elif isinstance(entity_type, (list, tuple)) and all(isinstance(t, type) for t in entity_type):
-                        match = any(isinstance(entity, t) for t in entity_type)
-                    else:
-                        match = to_type_from_classname(entity.__class__.__name__) == entity_type
-                    if match:
-                        # Check all tiles occupied by the entity
-                        ex, ey = entity.x, entity.y
-                        ew = getattr(entity, 'width', 1)
-                        eh = getattr(entity, 'height', 1)
-                        found = False
-                        for dx in range(ew):
-                            for dy in range(eh):
-                                tile_x = ex + dx
-                                tile_y = ey + dy
-                                dist = abs(tile_x - self.x) + abs(tile_y - self.y)
-                                if dist <= radius:
-                                    found = True
-                                    break
-                            if found:
-                                break
-                        if found:
-                            if predicate is not None:
-                                if predicate(entity):
-                                    count += 1
-                            else:
-                                if getattr(entity, 'is_satisfied', 1) == 1:
-                                    count += 1
+        for entity in neighbor_tables.neighbors(self, entity_type, radius):
+            if predicate is not None:
+                if predicate(entity):
+                    count += 1
+            elif getattr(entity, 'is_satisfied', 1) == 1:
+                count += 1
+            if limit is not None and count >= limit:
+                break
         return count
 
+    def any_entity_in_proximity(self, grid, entity_type, radius, predicate=None):
+        if predicate is None:
+            predicate = lambda e: getattr(e, 'is_satisfied', 1) == 1
+        return any(predicate(entity) for entity in neighbor_tables.neighbors(self, entity_type, radius))
+
     def _set_status(self):
         # Set to 'Mid' if (not satisfied AND initialized AND not broken) OR risky
         if ((self.is_satisfied == 0 and self.is_initialized == 1 and self.is_broken == 0) or self.is_risky == 1):
@@ -255,54 +362,40 @@ class SatisfiableEntity(BaseEntity):
 
     def _update_sat_check_bar(self, grid):
         if self.has_sat_check_bar:
-            prev_initialized = self.is_initialized
             self.bar1_timer += self._BAR_REFRESH_RATE
             if self.bar1_timer >= self._BAR_DURATION_FRAMES:
                 self.bar1_timer = 0
-                if not self.is_initialized:
-                    self.is_initialized = 1
-                    self.on_initialized()
-                # Remove special roll logic here (now handled in satisfaction_check)
-                entity_type = getattr(self, 'satisfaction_check_type', None)
-                radius = getattr(self, 'satisfaction_check_radius', 2)
-                if entity_type:
-                    self.satisfaction_check(grid)
-                self._set_status()
-                self.on_sat_check_finish()
-            self.bar1 = self.bar1_timer / self._BAR_DURATION_FRAMES
+                self.finish_sat_check_bar(grid)
         else:
-            self.bar1 = None
+            self.bar1_timer = None
+
+    def finish_sat_check_bar(self, grid):
+        # Runs when bar1 completes, also called in batches by the SatCheckScheduler
+        if not self.is_initialized:
+            self.is_initialized = 1
+            self.on_initialized()
+        # Remove special roll logic here (now handled in satisfaction_check)
+        if getattr(self, 'satisfaction_check_type', None):
+            self.satisfaction_check(grid)
+        self._set_status()
+        self.on_sat_check_finish()
 
     def _update_special_bar(self, grid):
         if self.has_special and self.is_initialized and self.is_satisfied:
             # Only progress the special bar if it is active
-            if self.special is not None and self.special_timer is not None:
+            if self.special_timer is not None:
                 self.special_timer += self._BAR_REFRESH_RATE
                 if self.special_timer >= self._BAR_DURATION_FRAMES:
                     self.special_timer = None
-                    self.special = None
                     self.on_special_finish()  # Fire on_special when special completes
-                else:
-                    self.special = self.special_timer / self._BAR_DURATION_FRAMES
         else:
-            self.special = None
             self.special_timer = None
-            if hasattr(self, '_special_spawn_attempted'):
-                del self._special_spawn_attempted
 
     def get_icon_path(self):
         if getattr(self, 'is_broken', 0) and getattr(self, '_icon_broken', None):
             return self._icon_broken
         return self._icon
 
-    def draw(self, surface, offset=(0, 0), cell_size=64, static_only=False):
-        super().draw(surface, offset, cell_size, static_only)
-        if not static_only:
-            if getattr(self, "has_bar1", 1) and not getattr(self, 'has_sat_check_bar_hidden', 0) and hasattr(self, 'draw_bar1'):
-                self.draw_bar1(surface, offset[0], offset[1], cell_size)
-            if getattr(self, "has_special", 0) and not getattr(self, 'special_hidden', 0) and hasattr(self, 'draw_special'):
-                self.draw_special(surface, offset[0], offset[1], cell_size)
-
     def draw_bar1(self, surface, ox, oy, cell_size):
         bar_height = int(cell_size * self._BAR_HEIGHT_RATIO)
         bar_width = CELL_SIZE_INNER
@@ -314,7 +407,7 @@ class SatisfiableEntity(BaseEntity):
         else:
             bar_color = self._BAR1_COL_FILL_INIT if not self.is_initialized else self._BAR1_COL_FILL_SAT
         pygame.draw.rect(surface, self._BAR1_COL, (x, y, bar_width, bar_height))
-        fill_width = int(bar_width * self.bar1)
+        fill_width = int(bar_width * self._interpolated_bar(self.bar1))
         pygame.draw.rect(surface, bar_color, (x, y, fill_width, bar_height))
 
     def draw_special(self, surface, ox, oy, cell_size):
@@ -328,9 +421,13 @@ class SatisfiableEntity(BaseEntity):
         x = self.x * cell_size + ox + (cell_size - bar_width) // 2
         y = self.y * cell_size + oy + cell_size - 2 * bar_height
         pygame.draw.rect(surface, self._SPECIAL_COL_BG, (x, y, bar_width, bar_height))
-        fill_width = int(bar_width * self.special)
+        fill_width = int(bar_width * self._interpolated_bar(self.special))
         pygame.draw.rect(surface, self._SPECIAL_COL_FILL, (x, y, fill_width, bar_height))
 
+    def _interpolated_bar(self, value):
+        # Bars advance by _BAR_REFRESH_RATE / _BAR_DURATION_FRAMES per tick, draw them between ticks
+        return min(1.0, value + self._render_alpha * self._BAR_REFRESH_RATE / self._BAR_DURATION_FRAMES)
+
     def satisfaction_check(self, grid):
         gs = GameState()
         # Existing logic
@@ -349,9 +446,9 @@ class SatisfiableEntity(BaseEntity):
         # 2. If an entity_type is specified, proximity count must meet threshold
         if entity_type:
             if predicate:
-                count = self.count_entities_in_proximity(grid, entity_type, radius, predicate=lambda e: predicate(self, e))
+                count = self.count_entities_in_proximity(grid, entity_type, radius, predicate=lambda e: predicate(self, e), limit=threshold)
             else:
-                count = self.count_entities_in_proximity(grid, entity_type, radius)
+                count = self.count_entities_in_proximity(grid, entity_type, radius, limit=threshold)
             if count < threshold:
                 self.is_satisfied = 0
                 self.power_drain = 0
@@ -360,13 +457,11 @@ class SatisfiableEntity(BaseEntity):
         self.is_satisfied = 1
         # Roll for special bar if applicable
         if getattr(self, 'has_special', 0):
-            if getattr(self, 'special', None) is None and getattr(self, 'special_timer', None) is None:
-                if random.random() < getattr(self, 'special_chance', 0.1):
-                    self.special = 0.0
+            if getattr(self, 'special_timer', None) is None:
+                if _rng.random() < getattr(self, 'special_chance', 0.1):
                     self.special_timer = 0
                     self.on_special_start()
                 else:
-                    self.special = None
                     self.special_timer = None
 
     def on_sat_check_finish(self):
@@ -381,6 +476,10 @@ class SatisfiableEntity(BaseEntity):
             self.power_drain = self._intended_power_drain * 3
         # If already multiplied, do nothing
 
+# Expose the component store fields as properties (before any subclass is created)
+for _name, _prop in component_properties().items():
+    setattr(SatisfiableEntity, _name, _prop)
+
 # region Custom classes
 
 class DecorationEntity(BaseEntity):
@@ -442,21 +541,15 @@ class MonitorEntity(SatisfiableEntity):
 
     def satisfaction_check(self, grid):
         # Standard proximity check for ComputerEntity in radius 1
-        count = self.count_entities_in_proximity(
-            grid, ComputerEntity, self.satisfaction_check_radius
-        )
+        computers = neighbor_tables.neighbors(self, ComputerEntity, self.satisfaction_check_radius)
+        count = sum(1 for entity in computers if getattr(entity, 'is_satisfied', 1) == 1)
         # If any adjacent ComputerEntity is rendering, 20% chance to become unsatisfied
-        for row in grid:
-            for entity in row:
-                if (
-                    isinstance(entity, ComputerEntity)
-                    and abs(entity.x - self.x) + abs(entity.y - self.y) <= self.satisfaction_check_radius
-                    and getattr(entity, 'is_rendering', 0) == 1
-                ):
-                    if random.random() < 0.2:
-                        self.is_satisfied = 0
-                        self.state = "Mid"
-                        return
+        for entity in computers:
+            if getattr(entity, 'is_rendering', 0) == 1:
+                if _rng.random() < 0.2:
+                    self.is_satisfied = 0
+                    self.state = "Mid"
+                    return
         # Otherwise, use normal logic
         if count >= self.satisfaction_check_threshold:
             self.is_satisfied = 1
@@ -484,54 +577,54 @@ class PersonEntity(SatisfiableEntity):
         "Petr Kollarcik"
     ]
     def on_spawn(self):
-        self.person_name = random.choice(self.names)
+        self.person_name = _spawn_rng.choice(self.names)
         self.display_name = getattr(self, 'display_name', 'Person')
-        self.happiness = random.randint(1, 10)
-        self.hunger = random.randint(1, 10)
-        self.toilet_need = random.randint(1, 10)
-        self.max_temp_tolerance = random.randint(25, 35)
+        self.happiness = _spawn_rng.randint(1, 10)
+        self.hunger = _spawn_rng.randint(1, 10)
+        self.toilet_need = _spawn_rng.randint(1, 10)
+        self.max_temp_tolerance = _spawn_rng.randint(25, 35)
 
     def on_sat_check_finish(self):
         gs = GameState()
         if hasattr(gs, 'temperature') and getattr(self, 'max_temp_tolerance', None) is not None:
             if gs.temperature > self.max_temp_tolerance:
-                if random.random() < 0.3:
+                if _rng.random() < 0.3:
                     self.is_satisfied = 0
                     self.state = "Mid"
         # 0.01 chance for medical items
-        if random.random() < 0.01:
+        if _rng.random() < 0.01:
             if hasattr(gs, 'total_ibalgin') and gs.total_ibalgin > 0:
                 gs.total_ibalgin -= 1
-        if random.random() < 0.01:
+        if _rng.random() < 0.01:
             if hasattr(gs, 'total_bandages') and gs.total_bandages > 0:
                 gs.total_bandages -= 1
-        if random.random() < 0.01:
+        if _rng.random() < 0.01:
             if hasattr(gs, 'total_pcr_test') and gs.total_pcr_test > 0:
                 gs.total_pcr_test -= 1
         # 0.005 chance for cables, mouses, keyboards
-        if random.random() < 0.005:
+        if _rng.random() < 0.005:
             if hasattr(gs, 'total_cables') and gs.total_cables > 0:
                 gs.total_cables -= 1
-        if random.random() < 0.005:
+        if _rng.random() < 0.005:
             if hasattr(gs, 'total_mouses') and gs.total_mouses > 0:
                 gs.total_mouses -= 1
-        if random.random() < 0.005:
+        if _rng.random() < 0.005:
             if hasattr(gs, 'total_keyboards') and gs.total_keyboards > 0:
                 gs.total_keyboards -= 1
-        if getattr(self, 'has_coffee', 0) == 1 and random.random() < 0.2:
+        if getattr(self, 'has_coffee', 0) == 1 and _rng.random() < 0.2:
             self.has_coffee = 0
         if hasattr(self, 'hunger'):
             self.hunger = max(0, self.hunger - 0.1)
-        if getattr(self, 'has_coffee', 0) == 0 and random.random() < 0.1:
+        if getattr(self, 'has_coffee', 0) == 0 and _rng.random() < 0.1:
             if (
                 hasattr(gs, 'total_coffee_beans') and gs.total_coffee_beans > 0 and
                 EntityStats().total_coffeemachine_entities > 0
             ):
                 gs.total_coffee_beans -= 1
                 self.has_coffee = 1
-                if hasattr(gs, 'total_milk') and gs.total_milk > 0 and random.random() < 0.2:
+                if hasattr(gs, 'total_milk') and gs.total_milk > 0 and _rng.random() < 0.2:
                     gs.total_milk -= 1
-                if hasattr(gs, 'total_sugar') and gs.total_sugar > 0 and random.random() < 0.2:
+                if hasattr(gs, 'total_sugar') and gs.total_sugar > 0 and _rng.random() < 0.2:
                     gs.total_sugar -= 1
 
 class WideEntity(SatisfiableEntity):
@@ -1,8 +1,10 @@
 from .entity_base import *
-import random
+from game_core.rng import rng
 from game_other.audio import play_breaker_break_sound
 from game_core.config import resource_path
 
+_rng = rng.stream('entities')
+
 # region Tech
 class ComputerT1(ComputerEntity):
     _icon = resource_path("data/graphics/computer-basic.png")
@@ -70,6 +72,7 @@ class Artist(PersonEntity):
 
     def on_special_finish(self):
         gs = GameState()
+        self.check_project_manager_proximity()
         self.multiplier = 2 if getattr(self, 'has_project_manager', 0) else 1
         if getattr(self, 'has_coffee', 0):
             self.multiplier += 1
@@ -78,24 +81,16 @@ class Artist(PersonEntity):
         gs.increment_current_artist_progress(multiplier=self.multiplier)
         gs.calculate_render_progress_allowed()
         # 10% chance to add 1 to current_lvl_experience (with level up)
-        if hasattr(gs, 'add_experience') and random.random() < 0.1:
+        if hasattr(gs, 'add_experience') and _rng.random() < 0.1:
             gs.add_experience(1)
 
-    def check_project_manager_proximity(self, grid):
-        found = 0
-        for row in grid:
-            for entity in row:
-                if entity is not None and entity.__class__.__name__ == 'ProjectManager':
-                    if abs(entity.x - self.x) <= 4 and abs(entity.y - self.y) <= 4:
-                        found = 1
-                        break
-            if found:
-                break
-        self.has_project_manager = found
-
-    def update(self, grid):
-        super().update(grid)
-        self.check_project_manager_proximity(grid)
+    def on_sat_check_finish(self):
+        super().on_sat_check_finish()
+        self.check_project_manager_proximity()
+
+    def check_project_manager_proximity(self, grid=None):
+        # Any ProjectManager in the 4 tile box around the artist
+        self.has_project_manager = 1 if neighbor_tables.neighbors(self, ProjectManager, 4, 'chebyshev') else 0
 
 class TechnicalDirector(PersonEntity):
     _icon = resource_path("data/graphics/entities/technical-director.png")
@@ -112,11 +107,9 @@ class ProjectManager(SatisfiableEntity):
     upkeep = 2000
 
     def satisfaction_check(self, grid):
-        # Check for router in radius 30
-        router_count = self.count_entities_in_proximity(grid, 'router', 30)
-        # Check for Macbook in radius 1
-        macbook_count = self.count_entities_in_proximity(grid, Macbook, 1)
-        if router_count >= 1 and macbook_count >= 1:
+        # Check for router in radius 30, then for Macbook in radius 1
+        if (self.any_entity_in_proximity(grid, 'router', 30)
+                and self.any_entity_in_proximity(grid, Macbook, 1)):
             self.is_satisfied = 1
             self.state = "Good"
         else:
@@ -203,7 +196,7 @@ class Breaker(SatisfiableEntity):
         if count >= self.satisfaction_check_threshold:
             self.is_risky = 1
             # Roll 10% chance to break
-            if random.random() < 0.1:
+            if _rng.random() < 0.1:
                 self.has_bar1 = 0
                 self.breaker_strength = 0
                 self.is_broken = 1
@@ -226,4 +219,10 @@ class FlowerPot(DecorationEntity):
 
 
 class Cactus(DecorationEntity):
-    _icon = resource_path("data/graphics/cactus.png")
\ No newline at end of file
+    _icon = resource_path("data/graphics/cactus.png")
+# Grid icon sizes at the default cell size, packed into the texture atlas (see entity_base.draw_static)
+for _cls in list(globals().values()):
+    if isinstance(_cls, type) and issubclass(_cls, BaseEntity) and isinstance(getattr(_cls, '_icon', None), str):
+        _margin = CELL_SIZE - CELL_SIZE_INNER
+        _size = (CELL_SIZE * getattr(_cls, 'width', 1) - _margin, CELL_SIZE * getattr(_cls, 'height', 1) - _margin)
+        asset_manager.register(*(v for k, v in vars(_cls).items() if k.startswith('_icon')), sizes=[_size])
@@ -0,0 +1,97 @@
+# game_core/entity_layer.py
+# Cached surface with the static look of every entity on the grid, redrawn only where something changed.
+
+import pygame
+from game_other.profiler import profiler
+
+FULL_REDRAW_THRESHOLD = 256  # Above this many dirty areas a full redraw is cheaper than clipping each one
+
+class EntityLayer:
+    """
+    Holds draw_static() of all grid entities on one transparent grid-sized surface.
+    Tiles are marked dirty when an entity is placed/removed (see game_loop.py) or one of its
+    VISUAL_FIELDS changes (see BaseEntity.__setattr__); only those tiles are redrawn.
+    Animated parts (draw_dynamic) are drawn on top every frame by draw().
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(EntityLayer, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.surface = None
+        self.cell_size = None
+        self._dirty = []  # Grid areas (x, y, w, h) waiting for a redraw
+        self._all_dirty = True
+        self._initialized = True
+
+    def mark_dirty(self, entity):
+        self._dirty.append((entity.x, entity.y, getattr(entity, 'width', 1), getattr(entity, 'height', 1)))
+
+    def mark_area_dirty(self, x, y, w=1, h=1):
+        self._dirty.append((x, y, w, h))
+
+    def invalidate(self):
+        self._all_dirty = True
+
+    def _ensure_surface(self, grid, cell_size):
+        size = (len(grid[0]) * cell_size, len(grid) * cell_size)
+        if self.surface is None or self.cell_size != cell_size or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            self.cell_size = cell_size
+            self._all_dirty = True
+
+    def redraw_dirty(self, grid, cell_size):
+        """Bring the layer up to date. Returns the redrawn areas as layer-space pygame.Rects."""
+        self._ensure_surface(grid, cell_size)
+        dirty, self._dirty = self._dirty, []
+        dirty = set(dirty)
+        surface = self.surface
+        if self._all_dirty or len(dirty) > FULL_REDRAW_THRESHOLD:
+            self._all_dirty = False
+            surface.fill((0, 0, 0, 0))
+            from game_core.entity_registry import entity_registry
+            for entity in entity_registry.snapshot():
+                entity.draw_static(surface, (0, 0), cell_size)
+            return [surface.get_rect()]
+        grid_h, grid_w = len(grid), len(grid[0])
+        redrawn = []
+        for x, y, w, h in dirty:
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(grid_w, x + w), min(grid_h, y + h)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            rect = pygame.Rect(x0 * cell_size, y0 * cell_size, (x1 - x0) * cell_size, (y1 - y0) * cell_size)
+            surface.fill((0, 0, 0, 0), rect)
+            # Entities overlapping the area may extend past it, clip so the rest is not drawn twice
+            surface.set_clip(rect)
+            seen = set()
+            for gy in range(y0, y1):
+                for gx in range(x0, x1):
+                    entity = grid[gy][gx]
+                    if entity is not None and id(entity) not in seen:
+                        seen.add(id(entity))
+                        entity.draw_static(surface, (0, 0), cell_size)
+            surface.set_clip(None)
+            redrawn.append(rect)
+        return redrawn
+
+    def draw(self, screen, grid, camera_offset, cell_size, min_x, max_x, min_y, max_y):
+        self.redraw_dirty(grid, cell_size)
+        screen.blit(self.surface, camera_offset)
+        profiler.count('blits')
+        seen = set()
+        for gy in range(min_y, max_y):
+            for gx in range(min_x, max_x):
+                entity = grid[gy][gx]
+                if entity is not None and id(entity) not in seen:
+                    seen.add(id(entity))
+                    entity.draw_dynamic(screen, camera_offset, cell_size)
+
+# Singleton accessor
+entity_layer = EntityLayer()
@@ -0,0 +1,79 @@
+# game_core/entity_registry.py
+# Flat list of the live entities on the grid, the single place where entities enter and leave the game.
+
+from game_core.game_state import EntityStats, totals_ledger
+from game_core.spatial_index import spatial_index
+from game_core.neighbor_tables import neighbor_tables
+from game_core.entity_layer import entity_layer
+from game_core.components import component_store
+
+class EntityRegistry:
+    """
+    Every placed entity exactly once (multi-tile entities included), in a flat list with O(1)
+    swap-remove. add/remove keep the component store, spatial index, neighbor tables, totals ledger,
+    EntityStats and entity layer in sync.
+    The grid is only used for tile lookups; anything that visits all entities should iterate this.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(EntityRegistry, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.clear()
+        self._initialized = True
+
+    def clear(self):
+        self.entities = []
+        self._index = {}  # id(entity) -> position in self.entities
+        self.version = 0  # Bumped on every add/remove, lets callers cache derived lists
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __contains__(self, entity):
+        return id(entity) in self._index
+
+    def snapshot(self):
+        # Safe to iterate while entities are placed/removed (e.g. by testing_layout threads)
+        return tuple(self.entities)
+
+    def add(self, entity):
+        if id(entity) in self._index:
+            return
+        self._index[id(entity)] = len(self.entities)
+        self.entities.append(entity)
+        self.version += 1
+        component_store.attach(entity)
+        spatial_index.add(entity)
+        neighbor_tables.add(entity)
+        totals_ledger.add(entity)
+        EntityStats().add(entity)
+        entity_layer.mark_dirty(entity)
+
+    def remove(self, entity):
+        pos = self._index.pop(id(entity), None)
+        if pos is None:
+            return
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[pos] = last
+            self._index[id(last)] = pos
+        self.version += 1
+        spatial_index.remove(entity)
+        neighbor_tables.remove(entity)
+        totals_ledger.remove(entity)
+        EntityStats().remove(entity)
+        entity_layer.mark_dirty(entity)
+        component_store.detach(entity)
+
+# Singleton accessor
+entity_registry = EntityRegistry()
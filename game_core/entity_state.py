@@ -2,15 +2,11 @@
 # Stores and manages the state of all placed entities in the game.
 
 class EntityState:
+    """Handle of a placed entity. Holds no copy of its state, attribute reads go to the real entity."""
+    __slots__ = ('entity',)
+
     def __init__(self, entity):
         self.entity = entity
-        # Copy all instance attributes from the entity
-        self.__dict__.update(entity.__dict__)
-        # Optionally, copy selected class attributes if not present on the instance
-        for attr in ['icon', 'type', 'display_name']:
-            if not hasattr(self, attr) and hasattr(entity.__class__, attr):
-                setattr(self, attr, getattr(entity.__class__, attr))
-        # Do NOT set color at all
 
     def __getattr__(self, name):
         # Proxy attribute access to the real entity
@@ -21,7 +17,7 @@ class EntityState:
         if hasattr(self.entity, 'get_public_attrs'):
             return self.entity.get_public_attrs()
         # Fallback: all public instance attributes
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_') and not callable(v)}
+        return {k: v for k, v in vars(self.entity).items() if not k.startswith('_') and not callable(v)}
 
     def to_dict(self):
         # Delegate to the real entity's to_dict for robust serialization
@@ -34,37 +30,81 @@ class EntityState:
         return cls(entity)
 
 class EntityStateList:
+    """
+    Placed entities by id(entity), in placement order, plus a (x, y) -> id(entity) index covering
+    every tile of each entity's footprint. Adding, removing and looking up an entity are O(1)
+    (O(width * height) for the index), whichever tile of a multi-tile entity is given.
+    """
     def __init__(self):
-        self.entities = []
+        self._states = {}  # id(entity) -> EntityState
+        self._positions = {}  # (x, y) -> id(entity), for every tile of the footprint
+
+    @property
+    def entities(self):
+        # Copy, safe to iterate while entities are added or removed
+        return list(self._states.values())
+
+    def __len__(self):
+        return len(self._states)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __contains__(self, entity):
+        return id(entity) in self._states
 
     def add_entity(self, entity):
-        self.entities.append(EntityState(entity))
+        key = id(entity)
+        if key in self._states:
+            return
+        self._states[key] = EntityState(entity)
+        for tile in _footprint(entity):
+            self._positions[tile] = key
+
+    def remove_entity(self, entity):
+        """Remove entity, returns its EntityState (None if it is not in the list)."""
+        key = id(entity)
+        state = self._states.pop(key, None)
+        if state is not None:
+            for tile in _footprint(entity):
+                if self._positions.get(tile) == key:
+                    del self._positions[tile]
+        return state
 
     def remove_entity_at(self, x, y):
-        self.entities = [e for e in self.entities if not (e.x == x and e.y == y)]
+        """Remove the entity covering tile (x, y), returns its EntityState or None."""
+        key = self._positions.get((x, y))
+        if key is None:
+            return None
+        return self.remove_entity(self._states[key].entity)
 
     def get_entity_at(self, x, y):
-        for e in self.entities:
-            if e.x == x and e.y == y:
-                return e
-        return None
+        key = self._positions.get((x, y))
+        return self._states[key] if key is not None else None
 
     def to_list(self):
         return [e.to_dict() for e in self.entities]
 
     def clear(self):
-        self.entities.clear()
+        self._states.clear()
+        self._positions.clear()
 
     @classmethod
     def from_list(cls, data_list, entity_type_map):
-        print(f"from_list: got {len(data_list)} items. entity_type_map keys: {list(entity_type_map.keys())}")
         esl = cls()
         for data in data_list:
             entity_type = data.get('type')
-            print(f"  loading entity type: {entity_type}")
             entity_class = entity_type_map.get(entity_type)
             if entity_class:
-                esl.entities.append(EntityState.from_dict(data, entity_class))
+                esl.add_entity(entity_class.from_dict(data))
             else:
                 print(f"  WARNING: entity_type '{entity_type}' not found in entity_type_map!")
         return esl
+
+def _footprint(entity):
+    x, y = entity.x, entity.y
+    width = getattr(entity, 'width', 1)
+    height = getattr(entity, 'height', 1)
+    if width == 1 and height == 1:
+        return ((x, y),)
+    return [(x + dx, y + dy) for dy in range(height) for dx in range(width)]
@@ -0,0 +1,84 @@
+# game_core/event_scheduler.py
+# Priority queue of callbacks due at a point in game time, advanced by the simulation.
+# Replaces the wall-clock threads and threading.Timers of the gameplay events: everything runs
+# on the main thread between entity ticks, stops while the simulation is paused and speeds up with it.
+
+import heapq
+import itertools
+
+class ScheduledEvent:
+    """Handle returned by schedule()/every(), pass it to cancel()."""
+    __slots__ = ('time', 'callback', 'args', 'interval', 'cancelled')
+
+    def __init__(self, time, callback, args, interval=None):
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+
+class EventScheduler:
+    """
+    Runs callbacks at game time (seconds since the scheduler was reset). Entries live in a heap
+    ordered by (due time, insertion order), so events due on the same tick run in the order they
+    were scheduled. advance() only looks at the head of the heap while nothing is due.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(EventScheduler, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.reset()
+        self._initialized = True
+
+    def reset(self):
+        self.now = 0.0
+        self._queue = []  # (time, seq, ScheduledEvent)
+        self._seq = itertools.count()
+
+    def schedule(self, delay, callback, *args):
+        """Run callback(*args) delay seconds of game time from now."""
+        return self._push(ScheduledEvent(self.now + delay, callback, args))
+
+    def every(self, interval, callback, *args, delay=None):
+        """Run callback(*args) every interval seconds, the first time after delay (default: interval)."""
+        return self._push(ScheduledEvent(self.now + (interval if delay is None else delay), callback, args, interval))
+
+    def cancel(self, event):
+        # Lazy removal, the entry is dropped when it reaches the head of the heap
+        if event is not None:
+            event.cancelled = True
+
+    def _push(self, event):
+        heapq.heappush(self._queue, (event.time, next(self._seq), event))
+        return event
+
+    def advance(self, seconds):
+        """Move game time forward and run every event that became due, in time order."""
+        self.now += seconds
+        queue = self._queue
+        while queue and queue[0][0] <= self.now:
+            _, _, event = heapq.heappop(queue)
+            if event.cancelled:
+                continue
+            if event.interval is not None:
+                # Rescheduled before the call, so the callback can cancel its own repetition
+                event.time += event.interval
+                self._push(event)
+            event.callback(*event.args)
+
+    def next_due(self):
+        """Game time of the next event, or None when idle."""
+        queue = self._queue
+        while queue and queue[0][2].cancelled:
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
+
+# Singleton accessor
+event_scheduler = EventScheduler()
@@ -5,14 +5,22 @@ from game_core.config import GAME_AREA_WIDTH, GAME_AREA_HEIGHT, CELL_SIZE, FPS,
 from game_core.controls import *
 from game_ui.ui import *
 from game_core.entity_state import EntityStateList
+from game_core.entity_registry import entity_registry
+from game_core.simulation import Simulation
+from game_core.rng import input_log
+from game_core.entity_layer import entity_layer
+from game_other.profiler import profiler, install_font_counter
 from game_ui.hidden_info_panel import *
 import game_other.savegame as savegame
+from game_other.autosave import autosave
+from game_other.asset_manager import asset_manager
 import game_other.feature_toggle as feature_toggle
 import game_other.testing_layout as testing_layout
 import game_core.gameplay_events
 from game_ui.project_overview_panel import handle_render_queue_panel_event
 from game_ui.supplies_panel import handle_supplies_panel_event
 from game_ui.ui import draw_entity_hover_label_if_needed
+from game_ui.loading_screen import draw_loading_screen
 import random
 from game_ui.zone_panel import handle_zone_panel_event, draw_zones_only, _zone_creation_active
 
@@ -40,11 +48,16 @@ def place_entity(grid, entity_states, entity):
     for dx in range(width):
         for dy in range(height):
             grid[gy + dy][gx + dx] = entity
-    entity_states.add_entity(entity)
+    entity_registry.add(entity)
+    if entity_states is not None:
+        entity_states.add_entity(entity)
+    autosave.record_place(entity)
 
 def remove_entity(grid, entity_states, gx, gy):
     entity = grid[gy][gx]
     if entity is not None:
+        input_log.record('remove', x=gx, y=gy)
+        autosave.record_remove(gx, gy)
         width = getattr(entity, 'width', 1)
         height = getattr(entity, 'height', 1)
         ex, ey = entity.x, entity.y
@@ -53,11 +66,14 @@ def remove_entity(grid, entity_states, gx, gy):
                 if 0 <= ey + dy < GAME_AREA_HEIGHT and 0 <= ex + dx < GAME_AREA_WIDTH:
                     if grid[ey + dy][ex + dx] == entity:
                         grid[ey + dy][ex + dx] = None
-        entity_states.remove_entity_at(gx, gy)
+        entity_registry.remove(entity)
+        if entity_states is not None:
+            entity_states.remove_entity(entity)
 
 # --- Main Game Loop ---
 def run_game():
     pygame.init()
+    install_font_counter()  # Count font.render calls for the profiler panel
     # Always use monitor resolution
     info = pygame.display.Info()
     resolution = (info.current_w, info.current_h)
@@ -65,14 +81,11 @@ def run_game():
     screen = pygame.display.set_mode(resolution, flags=flags, vsync=1)
     pygame.display.set_caption("3D Artist Team Manager")
     clock = pygame.time.Clock()
-
-    # Start gameplay evennts
-    game_core.gameplay_events.start_random_gameplay_events()
-    game_core.gameplay_events.start_deterministic_gameplay_events()
+    asset_manager.preload()  # Every icon is loaded and display-converted once, before the first frame
 
     grid = create_grid()
     # Load game state if available
-    entity_states, camera_offset, _ = savegame.load_game(grid)
+    entity_states, camera_offset, _ = savegame.load_game(grid, progress=lambda loaded, total: draw_loading_screen(screen, loaded, total))
     cell_size = CELL_SIZE  # Always use config value, ignore saved value
 
     # --- Use new GameControls class for all input ---
@@ -132,49 +145,34 @@ def run_game():
     prev_camera_offset = camera_offset
     prev_cell_size = cell_size
     state = dict(grid=grid, entity_states=entity_states, camera_offset=camera_offset, cell_size=cell_size, camera_drag=game_controls.camera_drag, paint_brush=game_controls.paint_brush, selected_index=selected_index, selected_entity_type=selected_entity_type, line_start=None, erase_line_start=None, GRID_WIDTH=GAME_AREA_WIDTH, GRID_HEIGHT=GAME_AREA_HEIGHT)
-    from game_core.game_state import GameState
-    gs = GameState()
+    simulation = Simulation(grid, entity_states=entity_states)
+    state['simulation'] = simulation  # Speed keys (+/-) change its time scale
+    autosave.start(state)  # Snapshot now, then journal changes and compact every few minutes
     while running:
-        frame_start = pygame.time.get_ticks()
+        profiler.begin_frame()
         # Handle events (all input via GameControls)
-        running, _ = handle_events(state, game_controls, remove_entity, place_entity)
-        # Camera WSAD movement
-        state['camera_offset'] = game_controls.camera_drag.handle_wsad(state['camera_offset'])
-        # --- Update all entities every 2 frames ---
-        if frame_count % 2 == 0:
-            # Update each unique entity only once per frame
-            unique_entities = set()
-            for row in state['grid']:
-                for entity in row:
-                    if entity and entity not in unique_entities:
-                        unique_entities.add(entity)
-                        entity.update(state['grid'])
-            from game_core.game_state import update_totals_from_grid, EntityStats
-            update_totals_from_grid(state['grid'])
-            EntityStats().update_from_grid(state['grid'])
-        dt = clock.tick(FPS)
-        # 1 in-game day = 10 seconds, so 30 days = 300 seconds
-        seconds_per_month = 30 * 10
-        # Update total_money
-        if not hasattr(gs, '_upkeep_accumulator'):
-            gs._upkeep_accumulator = 0.0
-        deduction = gs.total_upkeep * (dt / 1000.0) / seconds_per_month
-        gs._upkeep_accumulator += deduction
-        int_deduction = int(gs._upkeep_accumulator)
-        if int_deduction > 0:
-            gs.total_money -= int_deduction
-            gs._upkeep_accumulator -= int_deduction
+        with profiler.scope('Events'):
+            running, _ = handle_events(state, game_controls, remove_entity, place_entity)
+            # Camera WSAD movement
+            state['camera_offset'] = game_controls.camera_drag.handle_wsad(state['camera_offset'])
+        with profiler.scope('Wait'):
+            dt = clock.tick(FPS)
+        # Entities, upkeep, game time and deterministic events run at the fixed simulation rate
+        with profiler.scope('Simulation'):
+            simulation.advance(dt / 1000.0)
+        SatisfiableEntity._render_alpha = simulation.alpha
+        state['tick_count'] = simulation.tick_count
         prev_camera_offset = state['camera_offset']
-        # Render
-        frame_end = pygame.time.get_ticks()
-        frame_ms = frame_end - frame_start
-        gs.game_time_seconds += dt / 1000.0
-        gs.game_time_days = int(gs.game_time_seconds // 10) + 1
-        timings = {"Frame": frame_ms}
-        render_game(state, screen, background_surface, font, timings, clock, game_controls)
+        # Render (per-phase timings are collected by the profiler)
+        render_game(state, screen, background_surface, font, None, clock, game_controls)
+        autosave.update(state)
+        profiler.end_frame()
         frame_count += 1
     # Save game state on exit
     savegame.save_game(state['entity_states'], state['camera_offset'], state['cell_size'])
+    autosave.stop()
+    if feature_toggle.RECORD_INPUT_LOG:
+        input_log.save()
     pygame.quit()
     sys.exit()
 
@@ -226,10 +224,13 @@ def update_game_logic(state, frame_count, update_game_state):
     return False
 
 def render_game(state, screen, background_surface, font, timings, clock, controls):
-    screen.fill(BG_OUTSIDE_GRID_COL)
-    screen.blit(background_surface, state['camera_offset'])
-    # Draw zones underneath entities
-    draw_zones_only(screen)
+    sync_scaled_icon_cache(state['cell_size'])
+    with profiler.scope('Background'):
+        screen.fill(BG_OUTSIDE_GRID_COL)
+        screen.blit(background_surface, state['camera_offset'])
+        profiler.count('blits')
+        # Draw zones underneath entities
+        draw_zones_only(screen)
     min_x = max(0, int(-state['camera_offset'][0] // state['cell_size']))
     max_x = min(GAME_AREA_WIDTH, int((-state['camera_offset'][0] + screen.get_width()) // state['cell_size']) + 1)
     min_y = max(0, int(-state['camera_offset'][1] // state['cell_size']))
@@ -237,11 +238,9 @@ def render_game(state, screen, background_surface, font, timings, clock, control
     grid_ref = state['grid']
     cam_offset = state['camera_offset']
     cell_sz = state['cell_size']
-    for gy in range(min_y, max_y):
-        for gx in range(min_x, max_x):
-            entity = grid_ref[gy][gx]
-            if getattr(entity, 'draw', None):
-                entity.draw(screen, cam_offset, cell_sz, static_only=False)
+    # Cached static entity look (redrawn only for dirty tiles) + animated bars on top
+    with profiler.scope('Entities'):
+        entity_layer.draw(screen, grid_ref, cam_offset, cell_sz, min_x, max_x, min_y, max_y)
     # --- Hovered entity detection ---
     mx, my = pygame.mouse.get_pos()
     gx = int((mx - cam_offset[0]) // cell_sz)
@@ -251,29 +250,31 @@ def render_game(state, screen, background_surface, font, timings, clock, control
     panel_btn_rects = {}
     # Do NOT draw construction panel here; handled in draw_all_panels
     entity_buttons = None  # Will be set by draw_all_panels if needed
-    draw_all_panels(
-        screen,
-        state['selected_index'],
-        font,
-        clock=clock,
-        draw_call_count=None,
-        tick_count=None,
-        timings=timings,
-        grid=grid_ref,
-        hovered_entity=hovered_entity,
-        selected_entity_type=state['selected_entity_type'],
-        camera_offset=cam_offset,
-        cell_size=cell_sz,
-        GRID_WIDTH=GAME_AREA_WIDTH,
-        GRID_HEIGHT=GAME_AREA_HEIGHT,
-        selected_section=state.get('selected_section', 0),
-        selected_item=state.get('selected_item', None),
-        panel_btn_rects=panel_btn_rects,
-        entity_buttons=entity_buttons,
-        controls=controls
-    )
-    state['panel_btn_rects'] = panel_btn_rects
+    with profiler.scope('UI'):
+        draw_all_panels(
+            screen,
+            state['selected_index'],
+            font,
+            clock=clock,
+            draw_call_count=profiler.last_counters.get('blits'),
+            tick_count=state.get('tick_count'),
+            timings=timings,
+            grid=grid_ref,
+            hovered_entity=hovered_entity,
+            selected_entity_type=state['selected_entity_type'],
+            camera_offset=cam_offset,
+            cell_size=cell_sz,
+            GRID_WIDTH=GAME_AREA_WIDTH,
+            GRID_HEIGHT=GAME_AREA_HEIGHT,
+            selected_section=state.get('selected_section', 0),
+            selected_item=state.get('selected_item', None),
+            panel_btn_rects=panel_btn_rects,
+            entity_buttons=entity_buttons,
+            controls=controls
+        )
+        state['panel_btn_rects'] = panel_btn_rects
 
-    draw_entity_hover_label_if_needed(screen, font)
+        draw_entity_hover_label_if_needed(screen, font)
 
-    pygame.display.flip()
+    with profiler.scope('Flip'):
+        pygame.display.flip()
@@ -1,10 +1,18 @@
-import random
+from game_core.rng import rng
+from game_other.feature_toggle import DEBUG_TOTALS_LEDGER
 
 SUPPLIES_RND_MIN = 10
 SUPPLIES_RND_MAX = 40
 SUPPLIES_MAX = 50
 
+_MISSING = object()  # Previous value of a field set for the first time
+
 class GameState:
+    """
+    Every public field has a version, bumped when an assignment changes its value, so consumers
+    can compare version(...) with the one they last saw instead of re-reading and comparing values.
+    subscribe() registers callbacks called right after one of the given fields changes.
+    """
     _instance = None
 
     def __new__(cls):
@@ -16,6 +24,8 @@ class GameState:
     def __init__(self):
         if getattr(self, '_initialized', False):
             return
+        self._versions = {}  # field -> number of times its value changed
+        self._listeners = {}  # field -> [callback(name, old, new)]
         self.game_time_seconds = 0
         self.game_time_days = 0
         self.total_money = 1000
@@ -35,6 +45,7 @@ class GameState:
         self.office_quality = 1
         self.total_decoration = 0
         self.software_choice = 0
+        self.time_scale = 1  # Simulation speed set by the speed keys, None = max (see simulation.TIME_SCALES)
         self.artist_progress_required_per_shot = 50
         self.render_progress_required_per_shot = 50
         self.artist_progress_current = 0
@@ -51,16 +62,53 @@ class GameState:
         self.current_construction_class = None
         self._initialized = True
         # supplies
-        self.total_cables = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_mouses = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_keyboards = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_coffee_beans = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_milk = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_sugar = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_ibalgin = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_bandages = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
-        self.total_pcr_test = random.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        supplies_rng = rng.stream('supplies')
+        self.total_cables = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_mouses = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_keyboards = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_coffee_beans = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_milk = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_sugar = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_ibalgin = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_bandages = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+        self.total_pcr_test = supplies_rng.randint(SUPPLIES_RND_MIN, SUPPLIES_RND_MAX)
+
+    def __setattr__(self, name, value):
+        if name[0] == '_':
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name, _MISSING)
+        object.__setattr__(self, name, value)
+        if old is _MISSING or old != value:
+            versions = self._versions
+            versions[name] = versions.get(name, 0) + 1
+            listeners = self._listeners.get(name)
+            if listeners:
+                for callback in list(listeners):
+                    callback(name, None if old is _MISSING else old, value)
+
+    def version(self, *fields):
+        """Changes of the given fields so far: different from an earlier result once any of them changed."""
+        versions = self._versions
+        return sum([versions.get(field, 0) for field in fields])
 
+    def subscribe(self, fields, callback):
+        """Call callback(name, old, new) whenever one of fields (a name or names) changes value."""
+        if isinstance(fields, str):
+            fields = (fields,)
+        for field in fields:
+            listeners = self._listeners.setdefault(field, [])
+            if callback not in listeners:
+                listeners.append(callback)
+
+    def unsubscribe(self, callback, fields=None):
+        """Stop calling callback for fields (a name or names), or for every field if None."""
+        if isinstance(fields, str):
+            fields = (fields,)
+        for field in (self._listeners if fields is None else fields):
+            listeners = self._listeners.get(field)
+            if listeners and callback in listeners:
+                listeners.remove(callback)
 
     def summarize_entities(self, grid):
         summary = []
@@ -78,13 +126,11 @@ class GameState:
 
     def _count_entities(self, grid, attr, sum_mode=False):
         count = 0
-        for row in grid:
-            for entity in row:
-                if entity is not None:
-                    if sum_mode and hasattr(entity, attr):
-                        count += getattr(entity, attr, 0)
-                    elif not sum_mode and getattr(entity, attr, 0) == 1:
-                        count += 1
+        for entity in iter_unique_entities(grid):
+            if sum_mode and hasattr(entity, attr):
+                count += getattr(entity, attr, 0)
+            elif not sum_mode and getattr(entity, attr, 0) == 1:
+                count += 1
         return count
 
     def count_employees(self, grid):
@@ -104,37 +150,21 @@ class GameState:
 
     def count_upkeep(self, grid):
         total = 0
-        for row in grid:
-            for entity in row:
-                if entity is not None and hasattr(entity, 'upkeep'):
-                    try:
-                        val = float(getattr(entity, 'upkeep', 0))
-                        if val > 0:
-                            total += val
-                    except Exception:
-                        pass
+        for entity in iter_unique_entities(grid):
+            total += TotalsLedger.upkeep_of(entity)
         return int(round(total))
 
     def count_decoration(self, grid):
         total = 0
-        for row in grid:
-            for entity in row:
-                if entity is not None and hasattr(entity, 'decoration'):
-                    try:
-                        val = float(getattr(entity, 'decoration', 0))
-                        total += val  # Sum all values, positive or negative
-                    except Exception:
-                        pass
+        for entity in iter_unique_entities(grid):
+            total += TotalsLedger.decoration_of(entity)  # Sum all values, positive or negative
         return total
 
     def update_totals_from_grid(self, grid):
-        self.total_employees = self.count_employees(grid)
-        self.total_power_drain = self.count_power_drain(grid)
-        self.total_breaker_strength = self.count_breaker_strength(grid)
-        self.total_risky_entities = self.count_risky_entities(grid)
-        self.total_broken_entities = self.count_broken_entities(grid)
-        self.total_upkeep = self.count_upkeep(grid) + 100
-        self.total_decoration = self.count_decoration(grid)
+        """Publish the incrementally maintained entity totals (see TotalsLedger) into the game state."""
+        if DEBUG_TOTALS_LEDGER:
+            totals_ledger.verify(grid)
+        totals_ledger.publish(self)
         from game_core.gameplay_events import power_outage
         power_outage.trigger()
 
@@ -189,22 +219,165 @@ class EntityStats:
         self.total_coffeemachine_entities = 0  # Track number of coffee machines
         # Add more entity counters as needed
 
-    def update_from_grid(self, grid):
-        self.reset()
+    def _apply(self, entity, sign):
         from game_core.entity_definitions import DecorationEntity, ComputerEntity, EspressoMachine
-        for row in grid:
-            for entity in row:
-                if isinstance(entity, DecorationEntity):
-                    self.total_decor_entities += 1
-                if isinstance(entity, ComputerEntity):
-                    self.total_computer_entities += 1
-                if isinstance(entity, EspressoMachine):
-                    self.total_coffeemachine_entities += 1
+        if isinstance(entity, DecorationEntity):
+            self.total_decor_entities += sign
+        if isinstance(entity, ComputerEntity):
+            self.total_computer_entities += sign
+        if isinstance(entity, EspressoMachine):
+            self.total_coffeemachine_entities += sign
         # Add more entity type checks as needed
 
+    def add(self, entity):
+        # Counters only depend on the entity class, so they are kept up to date by EntityRegistry
+        self._apply(entity, 1)
+
+    def remove(self, entity):
+        self._apply(entity, -1)
+
+    def update_from_grid(self, grid):
+        """Full recount from the grid (the registry keeps the counters current already)."""
+        self.reset()
+        for entity in iter_unique_entities(grid):
+            self._apply(entity, 1)
+
+class TotalsLedger:
+    """
+    Running per-entity contributions to the GameState totals. Entities are added/removed by
+    place_entity/remove_entity, and BaseEntity.__setattr__ reports changes of LEDGER_FIELDS
+    as deltas, so publishing the totals never has to walk the grid.
+    """
+    LEDGER_FIELDS = frozenset(('is_person', 'power_drain', 'breaker_strength', 'is_risky', 'is_broken', 'upkeep', 'decoration'))
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TotalsLedger, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.reset()
+        self._initialized = True
+
+    def reset(self):
+        self.employees = 0
+        self.power_drain = 0
+        self.breaker_strength = 0
+        self.risky_entities = 0
+        self.broken_entities = 0
+        self.upkeep = 0.0
+        self.decoration = 0.0
+
+    @staticmethod
+    def upkeep_of(entity):
+        try:
+            val = float(getattr(entity, 'upkeep', 0))
+        except Exception:
+            return 0.0
+        return val if val > 0 else 0.0
+
+    @staticmethod
+    def decoration_of(entity):
+        try:
+            return float(getattr(entity, 'decoration', 0))
+        except Exception:
+            return 0.0
+
+    def _apply(self, entity, sign):
+        self.employees += sign * (getattr(entity, 'is_person', 0) == 1)
+        self.power_drain += sign * getattr(entity, 'power_drain', 0)
+        self.breaker_strength += sign * getattr(entity, 'breaker_strength', 0)
+        self.risky_entities += sign * (getattr(entity, 'is_risky', 0) == 1)
+        self.broken_entities += sign * (getattr(entity, 'is_broken', 0) == 1)
+        self.upkeep += sign * self.upkeep_of(entity)
+        self.decoration += sign * self.decoration_of(entity)
+
+    def add(self, entity):
+        if getattr(entity, '_ledger_tracked', False):
+            return
+        self._apply(entity, 1)
+        object.__setattr__(entity, '_ledger_tracked', True)
+
+    def remove(self, entity):
+        if not getattr(entity, '_ledger_tracked', False):
+            return
+        self._apply(entity, -1)
+        object.__setattr__(entity, '_ledger_tracked', False)
+
+    def on_change(self, entity, name, value):
+        """Called before a tracked entity sets one of LEDGER_FIELDS to value."""
+        old = getattr(entity, name, 0)
+        if name == 'power_drain':
+            self.power_drain += value - old
+        elif name == 'breaker_strength':
+            self.breaker_strength += value - old
+        elif name == 'is_risky':
+            self.risky_entities += (value == 1) - (old == 1)
+        elif name == 'is_broken':
+            self.broken_entities += (value == 1) - (old == 1)
+        elif name == 'is_person':
+            self.employees += (value == 1) - (old == 1)
+        elif name == 'upkeep':
+            self.upkeep -= self.upkeep_of(entity)
+            object.__setattr__(entity, name, value)
+            self.upkeep += self.upkeep_of(entity)
+            object.__setattr__(entity, name, old)
+        elif name == 'decoration':
+            self.decoration -= self.decoration_of(entity)
+            object.__setattr__(entity, name, value)
+            self.decoration += self.decoration_of(entity)
+            object.__setattr__(entity, name, old)
+
+    def publish(self, gs):
+        gs.total_employees = self.employees
+        gs.total_power_drain = self.power_drain
+        gs.total_breaker_strength = self.breaker_strength
+        gs.total_risky_entities = self.risky_entities
+        gs.total_broken_entities = self.broken_entities
+        gs.total_upkeep = int(round(self.upkeep)) + 100
+        gs.total_decoration = self.decoration
+
+    def verify(self, grid):
+        """Debug cross-check against a full grid recount. Reports and resyncs on mismatch."""
+        gs = GameState()
+        expected = {
+            'employees': gs.count_employees(grid),
+            'power_drain': gs.count_power_drain(grid),
+            'breaker_strength': gs.count_breaker_strength(grid),
+            'risky_entities': gs.count_risky_entities(grid),
+            'broken_entities': gs.count_broken_entities(grid),
+            'upkeep': gs.count_upkeep(grid),
+            'decoration': gs.count_decoration(grid),
+        }
+        mismatches = {}
+        for k, v in expected.items():
+            current = int(round(getattr(self, k))) if k == 'upkeep' else getattr(self, k)
+            if abs(current - v) > 1e-6:
+                mismatches[k] = (current, v)
+        if mismatches:
+            print(f"TotalsLedger mismatch (ledger, recount): {mismatches}")
+            self.reset()
+            for entity in iter_unique_entities(grid):
+                self._apply(entity, 1)
+        return not mismatches
+
+def iter_unique_entities(grid):
+    """Yield each entity on the grid once, even if it occupies several tiles."""
+    seen = set()
+    for row in grid:
+        for entity in row:
+            if entity is not None and id(entity) not in seen:
+                seen.add(id(entity))
+                yield entity
+
+totals_ledger = TotalsLedger()
+
 def get_totals_dict():
     return GameState().get_totals_dict()
 
 def update_totals_from_grid(grid):
     GameState().update_totals_from_grid(grid)
-    GameState().update_totals_from_grid(grid)
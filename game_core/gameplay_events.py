@@ -1,11 +1,13 @@
-import threading
-import random
-import time
+from game_core.rng import rng
 from game_core.game_state import GameState
+from game_core.event_scheduler import event_scheduler
 import game_other.audio
 import pygame
 from game_ui.project_overview_panel import expand_render_queue_panel
 import game_ui.quest_panel as quest_panel
+from game_other.trace import trace_recorder
+
+_rng = rng.stream('events')
 
 class GamePlayEvent:
     def trigger(self):
@@ -24,16 +26,18 @@ class InternetOutage(GamePlayEvent):
             state.is_internet_online = 0
             state.is_wifi_online = 0
             self._restoring = True
+            trace_recorder.instant('InternetOutage', 'gameplay')
             game_other.audio.play_system_out_sound()
-            threading.Timer(self.RESTORE_DELAY, self.restore_internet).start()
+            event_scheduler.schedule(self.RESTORE_DELAY, self.restore_internet)
             return True
         return False
 
     def restore_internet(self):
         state = GameState()
         state.is_internet_online = 1
+        trace_recorder.instant('InternetRestored', 'gameplay')
         game_other.audio.play_system_back_sound()
-        threading.Timer(self.WIFI_RESTORE_DELAY, self.restore_wifi).start()
+        event_scheduler.schedule(self.WIFI_RESTORE_DELAY, self.restore_wifi)
         self._restoring = False
 
     def restore_wifi(self):
@@ -50,14 +54,16 @@ class NasCrashed(GamePlayEvent):
         if state.is_nas_online == 1 and not self._crashed:
             state.is_nas_online = 0
             self._crashed = True
+            trace_recorder.instant('NasCrashed', 'gameplay')
             game_other.audio.play_system_out_sound()
-            threading.Timer(self.RESTORE_DELAY, self.restore_nas).start()
+            event_scheduler.schedule(self.RESTORE_DELAY, self.restore_nas)
             return True
         return False
 
     def restore_nas(self):
         state = GameState()
         state.is_nas_online = 1
+        trace_recorder.instant('NasRestored', 'gameplay')
         game_other.audio.play_system_back_sound()
         self._crashed = False
 
@@ -69,6 +75,7 @@ class JobFinished:
         state = GameState()
         if state.total_shots_goal > 0 and state.total_shots_finished == state.total_shots_goal:
             if not self._last_project_finished:
+                trace_recorder.instant('JobFinished', 'gameplay', {'job_id': state.job_id})
                 game_other.audio.play_project_finished_sound()
                 state.current_job_finished = 1
                 self._last_project_finished = True
@@ -100,6 +107,7 @@ class JobArrived(GamePlayEvent):
         state.job_budget = 10000 * n
         state.current_job_finished = 0  # Reset for next job
         state.total_money += state.job_budget
+        trace_recorder.instant('JobArrived', 'gameplay', {'job_id': state.job_id, 'shots': n})
         game_other.audio.play_job_arrived_sound()
         expand_render_queue_panel(1000, 0)
         return True
@@ -112,18 +120,28 @@ class JobArrived(GamePlayEvent):
             self.trigger()
 
 class PowerOutage:
+    POWER_FIELDS = ('total_power_drain', 'total_breaker_strength')
+
     def __init__(self):
         self.active = False
+        self._power_version = None  # GameState version of POWER_FIELDS last checked
 
     def trigger(self):
         state = GameState()
+        # Called every time the totals are published, only re-evaluated when drain or breakers changed
+        power_version = state.version(*self.POWER_FIELDS)
+        if power_version == self._power_version:
+            return
+        self._power_version = power_version
         if state.total_power_drain > state.total_breaker_strength:
             if not self.active:
                 self.active = True
+                trace_recorder.instant('PowerOutage', 'gameplay', {'drain': state.total_power_drain, 'breaker_strength': state.total_breaker_strength})
                 game_other.audio.play_power_outage_sound()
         else:
             if self.active:
                 self.active = False
+                trace_recorder.instant('PowerRestored', 'gameplay')
                 game_other.audio.play_power_up_sound()
 
     def draw_overlay(self, surface):
@@ -136,8 +154,7 @@ class PowerOutage:
 class ClimateControl:
     def __init__(self, interval=10, start_temp=None):
         self.interval = interval  # seconds
-        self._running = False
-        self._thread = None
+        self._scheduled = None
         self._direction = 1  # 1 for up, -1 for down
         self._target = None
         self._min_up = 23
@@ -150,93 +167,87 @@ class ClimateControl:
             self._start_temp = start_temp
 
     def start(self):
-        # Disabled for now: do not start the background thread
-        # if not self._running:
-        #     self._running = True
-        #     import threading
-        #     self._thread = threading.Thread(target=self._run, daemon=True)
-        #     self._thread.start()
+        # Disabled for now: do not schedule the temperature cycle
+        # if self._scheduled is None:
+        #     state = GameState()
+        #     state.temperature = self._start_temp
+        #     self._pick_new_target(state.temperature)
+        #     self._scheduled = event_scheduler.every(self.interval, self._step)
         pass
 
     def stop(self):
-        self._running = False
+        event_scheduler.cancel(self._scheduled)
+        self._scheduled = None
 
     def _pick_new_target(self, current_temp):
-        import random
         if self._direction == 1:
-            self._target = random.randint(self._min_up, self._max_up)
+            self._target = _rng.randint(self._min_up, self._max_up)
         else:
-            self._target = random.randint(self._min_down, self._max_down)
+            self._target = _rng.randint(self._min_down, self._max_down)
 
-    def _run(self):
-        import time
-        from game_core.game_state import GameState
+    def _step(self):
         state = GameState()
-        state.temperature = self._start_temp
-        self._pick_new_target(state.temperature)
-        while self._running:
-            time.sleep(self.interval)
-            state = GameState()
-            if self._direction == 1:
-                if state.temperature < self._target:
-                    state.temperature += 1
-                else:
-                    self._direction = -1
-                    self._pick_new_target(state.temperature)
+        if self._direction == 1:
+            if state.temperature < self._target:
+                state.temperature += 1
             else:
-                if state.temperature > self._target:
-                    state.temperature -= 1
-                else:
-                    self._direction = 1
-                    self._pick_new_target(state.temperature)
+                self._direction = -1
+                self._pick_new_target(state.temperature)
+        else:
+            if state.temperature > self._target:
+                state.temperature -= 1
+            else:
+                self._direction = 1
+                self._pick_new_target(state.temperature)
 
 class OfficeQualityCheck(GamePlayEvent):
     INITIAL_DELAY = 5  # seconds
     INTERVAL = 5  # seconds
     def __init__(self):
-        self._started = False
-        self._thread = None
+        self._scheduled = None
 
     def trigger(self):
-        if not self._started:
-            self._started = True
-            threading.Thread(target=self._run_with_delay, daemon=True).start()
+        if self._scheduled is None:
+            self._scheduled = event_scheduler.every(self.INTERVAL, self.evaluate, delay=self.INITIAL_DELAY)
         return True
 
-    def _run_with_delay(self):
-        time.sleep(self.INITIAL_DELAY)
+    def stop(self):
+        event_scheduler.cancel(self._scheduled)
+        self._scheduled = None
+
+    def evaluate(self):
         from game_core.game_state import EntityStats
-        while True:
-            state = GameState()
-            stats = EntityStats()
-            num_decor = stats.total_decor_entities
-            num_computers = stats.total_computer_entities
-            # Intuitive office quality logic
-            if num_computers == 0 and num_decor == 0:
-                office_quality = 1
-            elif num_computers == 0:
-                office_quality = 2
-            elif num_decor == 0:
-                office_quality = 0
-            elif num_decor >= 2 * num_computers:
-                office_quality = 5
-            elif num_decor > num_computers:
-                office_quality = 4
-            elif num_decor == num_computers:
-                office_quality = 3
-            elif num_computers >= 2 * num_decor:
-                office_quality = 0
-            elif num_computers > num_decor:
-                office_quality = 2
-            else:
-                office_quality = 1  # fallback, should rarely hit
-            state.office_quality = office_quality
-            time.sleep(self.INTERVAL)
+        state = GameState()
+        stats = EntityStats()
+        num_decor = stats.total_decor_entities
+        num_computers = stats.total_computer_entities
+        # Intuitive office quality logic
+        if num_computers == 0 and num_decor == 0:
+            office_quality = 1
+        elif num_computers == 0:
+            office_quality = 2
+        elif num_decor == 0:
+            office_quality = 0
+        elif num_decor >= 2 * num_computers:
+            office_quality = 5
+        elif num_decor > num_computers:
+            office_quality = 4
+        elif num_decor == num_computers:
+            office_quality = 3
+        elif num_computers >= 2 * num_decor:
+            office_quality = 0
+        elif num_computers > num_decor:
+            office_quality = 2
+        else:
+            office_quality = 1  # fallback, should rarely hit
+        if office_quality != state.office_quality:
+            trace_recorder.instant('OfficeQualityChanged', 'gameplay', {'office_quality': office_quality})
+        state.office_quality = office_quality
 
 class RandomQuestArrived:
     def __init__(self, quest_list):
         self.all_quests = quest_list
-        self.active_quests = random.sample(self.all_quests, min(3, len(self.all_quests)))
+        self.active_quests = _rng.sample(self.all_quests, min(3, len(self.all_quests)))
 
     def get_active_quests(self):
         return self.active_quests
@@ -274,33 +285,30 @@ DETERMINISTIC_GAMEPLAY_EVENTS = [
 GAMEPLAY_EVENTS = RANDOM_GAMEPLAY_EVENTS + DETERMINISTIC_GAMEPLAY_EVENTS
 
 START_DELAY = 10
+DETERMINISTIC_EVENTS_START_DELAY = 2  # Seconds of game time before deterministic events start ticking
+DETERMINISTIC_EVENTS_INTERVAL = 1
+RANDOM_EVENT_MIN_DELAY = 10  # Seconds of game time between random events
+RANDOM_EVENT_MAX_DELAY = 30
+
+def _random_event():
+    situation = _rng.choice(RANDOM_GAMEPLAY_EVENTS)
+    situation.trigger()
+    event_scheduler.schedule(_rng.uniform(RANDOM_EVENT_MIN_DELAY, RANDOM_EVENT_MAX_DELAY), _random_event)
 
 def start_random_gameplay_events():
-    def random_event_loop():
-        time.sleep(random.uniform(10, 30))  # Wait a random time before first event
-        while True:
-            situation = random.choice(RANDOM_GAMEPLAY_EVENTS)
-            situation.trigger()
-            time.sleep(random.uniform(10, 30))
-    thread = threading.Thread(target=random_event_loop, daemon=True)
-    thread.start()
+    event_scheduler.schedule(_rng.uniform(RANDOM_EVENT_MIN_DELAY, RANDOM_EVENT_MAX_DELAY), _random_event)
+
+def tick_deterministic_events():
+    for event in DETERMINISTIC_GAMEPLAY_EVENTS:
+        event.trigger()
 
 def start_deterministic_gameplay_events():
-    def deterministic_event_loop():
-        time.sleep(2)  # Wait 2 seconds at game start
-        counter = 0
-        while True:
-            for event in DETERMINISTIC_GAMEPLAY_EVENTS:
-                # For OfficeQualityCheck, only trigger every 30 seconds
-                if isinstance(event, OfficeQualityCheck):
-                    if counter % 30 == 0:
-                        event.trigger()
-                else:
-                    event.trigger()
-            time.sleep(1)  # Tick every second
-            counter += 1
-    thread = threading.Thread(target=deterministic_event_loop, daemon=True)
-    thread.start()
+    event_scheduler.every(DETERMINISTIC_EVENTS_INTERVAL, tick_deterministic_events, delay=DETERMINISTIC_EVENTS_START_DELAY)
+
+def start_gameplay_events():
+    """Schedule all gameplay events on the game clock, they run while the simulation advances it."""
+    start_deterministic_gameplay_events()
+    start_random_gameplay_events()
 
 power_outage = PowerOutage()
 climate_control = ClimateControl()
@@ -0,0 +1,104 @@
+# game_core/neighbor_tables.py
+# Per-entity neighbor lists for the fixed-radius proximity rules of the satisfaction checks.
+
+from game_core.spatial_index import spatial_index, manhattan_to_footprint, chebyshev_to_footprint
+
+METRICS = {
+    'manhattan': manhattan_to_footprint,
+    'chebyshev': chebyshev_to_footprint,
+}
+
+class NeighborTables:
+    """
+    One table per (entity_type, radius, metric) rule. A table maps each placed owner entity to the
+    entities of entity_type within radius of the owner's tile. A row is computed from the spatial
+    index the first time its owner asks for it and is then patched by EntityRegistry: placing an
+    entity adds it to the rows of the owners in range, removing it drops it from every row and
+    drops its own rows.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(NeighborTables, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.clear()
+        self._initialized = True
+
+    def clear(self):
+        self._tables = {}  # (type key, radius, metric) -> {id(owner): {id(neighbor): neighbor}}
+        self._entity_types = {}  # type key -> entity_type as passed to neighbors()
+        self._owner_classes = {}  # table key -> set of owner classes with a row
+        self._referenced_by = {}  # id(neighbor) -> {(table key, id(owner)): row}
+        self._placed = set()  # ids of entities added through add()
+
+    def neighbors(self, owner, entity_type, radius, metric='manhattan'):
+        """Entities of entity_type within radius of owner, as a tuple (safe while entities are placed/removed)."""
+        type_key = tuple(entity_type) if isinstance(entity_type, list) else entity_type
+        key = (type_key, radius, metric)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = {}
+            self._entity_types[type_key] = entity_type
+            self._owner_classes[key] = set()
+        row = table.get(id(owner))
+        if row is None:
+            row = self._compute_row(owner, entity_type, radius, metric)
+            if id(owner) not in self._placed:
+                return tuple(row.values())  # Not on the grid (e.g. during placement), don't keep a row
+            table[id(owner)] = row
+            self._owner_classes[key].add(type(owner))
+            for neighbor_id in row:
+                self._referenced_by.setdefault(neighbor_id, {})[(key, id(owner))] = row
+        return tuple(row.values())
+
+    def _compute_row(self, owner, entity_type, radius, metric):
+        distance = METRICS[metric]
+        x, y = owner.x, owner.y
+        # candidates() scans the square around (x, y), which covers both metrics
+        return {
+            id(entity): entity
+            for entity in spatial_index.candidates(entity_type, x, y, radius)
+            if distance(entity, x, y) <= radius
+        }
+
+    def add(self, entity):
+        """Called by EntityRegistry after the entity was added to the spatial index."""
+        self._placed.add(id(entity))
+        ew, eh = getattr(entity, 'width', 1), getattr(entity, 'height', 1)
+        for key, table in tuple(self._tables.items()):
+            type_key, radius, metric = key
+            if not table or not spatial_index.matches(self._entity_types[type_key], entity):
+                continue
+            distance = METRICS[metric]
+            owner_classes = tuple(self._owner_classes[key])
+            for owner in spatial_index.candidates(owner_classes, entity.x, entity.y, radius + max(ew, eh) - 1):
+                row = table.get(id(owner))
+                if row is None or id(entity) in row:
+                    continue
+                if distance(entity, owner.x, owner.y) <= radius:
+                    row[id(entity)] = entity
+                    self._referenced_by.setdefault(id(entity), {})[(key, id(owner))] = row
+
+    def remove(self, entity):
+        """Called by EntityRegistry when the entity leaves the grid."""
+        entity_id = id(entity)
+        self._placed.discard(entity_id)
+        for row in self._referenced_by.pop(entity_id, {}).values():
+            row.pop(entity_id, None)
+        for key, table in tuple(self._tables.items()):
+            row = table.pop(entity_id, None)
+            if row is None:
+                continue
+            for neighbor_id in row:
+                refs = self._referenced_by.get(neighbor_id)
+                if refs is not None:
+                    refs.pop((key, entity_id), None)
+
+# Singleton accessor
+neighbor_tables = NeighborTables()
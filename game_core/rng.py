@@ -0,0 +1,166 @@
+# game_core/rng.py
+# Seeded random streams per subsystem and a log of player inputs by simulation tick.
+# A master seed plus an input log reproduces a run (benchmarks, replay of heavy save files).
+
+import json
+import os
+import random
+import time
+
+from game_other.feature_toggle import RNG_SEED, REPLAY_INPUT_LOG
+
+# Subsystems with their own stream, so e.g. an extra alert roll does not shift entity outcomes.
+# 'spawn' is drawn from when an entity is constructed (also for previews that are never built),
+# builds are logged with a snapshot of the entity, so replays do not depend on it.
+STREAMS = ('spawn', 'entities', 'events', 'supplies', 'layout', 'alerts')
+
+class RngService:
+    """
+    Hands out one random.Random per subsystem, all derived from a single master seed.
+    Streams are reseeded in place by seed(), so modules can keep a reference
+    (`_rng = rng.stream('entities')`) taken at import time.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RngService, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.master_seed = None
+        self._streams = {}
+        self._initialized = True
+        self.seed(RNG_SEED)
+
+    def seed(self, master_seed=None):
+        """Reseed every stream. None draws a fresh master seed (printed, so the run can be repeated)."""
+        if master_seed is None:
+            master_seed = random.SystemRandom().randrange(2 ** 32)
+            print(f"RNG master seed: {master_seed}")
+        self.master_seed = master_seed
+        for name, stream in self._streams.items():
+            stream.seed(self._stream_seed(name))
+
+    def _stream_seed(self, name):
+        # String seeds are hashed with sha512 by random, stable across runs and platforms
+        return f"{self.master_seed}:{name}"
+
+    def stream(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(self._stream_seed(name))
+        return stream
+
+    def get_state(self):
+        return {'master_seed': self.master_seed, 'streams': {name: s.getstate() for name, s in self._streams.items()}}
+
+    def set_state(self, state):
+        self.master_seed = state['master_seed']
+        for name, stream_state in state['streams'].items():
+            self.stream(name).setstate(stream_state)
+
+# Singleton accessor
+rng = RngService()
+
+class InputLog:
+    """
+    Records inputs that change the world together with the simulation tick they happened on:
+    'build' (BaseEntity.on_built, with a to_dict() snapshot of the entity), 'remove',
+    'resupply' and 'set' (a GameState field chosen by the player, e.g. software_choice).
+    When replaying, Simulation.step() applies the logged inputs of each tick before running it,
+    and recording is paused.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(InputLog, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.tick = 0  # Current simulation tick, kept up to date by Simulation.step()
+        self.entries = []  # [tick, action, payload]
+        self.replaying = False
+        self._replay = []
+        self._replay_index = 0
+        self._initialized = True
+
+    def record(self, action, **payload):
+        if not self.replaying:
+            self.entries.append([self.tick, action, payload])
+
+    def clear(self):
+        self.entries = []
+        self.tick = 0
+
+    def to_dict(self):
+        return {'seed': rng.master_seed, 'inputs': self.entries}
+
+    def save(self, path=None):
+        """Write the seed and the inputs as JSON (default: _output/inputs_<timestamp>.json). Returns the path."""
+        if path is None:
+            from game_other.logger import ensure_output_folder
+            path = os.path.join(ensure_output_folder(), time.strftime('inputs_%Y%m%d_%H%M%S.json'))
+        try:
+            with open(path, 'w') as log_file:
+                json.dump(self.to_dict(), log_file)
+        except Exception as e:
+            print(f"Error writing input log: {e}")
+            return None
+        print(f"Input log with {len(self.entries)} inputs written to {path}")
+        return path
+
+    def start_replay(self, data):
+        """Reseed the streams from the log and queue its inputs. data is a dict from to_dict() or a path."""
+        if isinstance(data, str):
+            with open(data) as log_file:
+                data = json.load(log_file)
+        rng.seed(data['seed'])
+        self._replay = sorted(data['inputs'], key=lambda entry: entry[0])
+        self._replay_index = 0
+        self.replaying = True
+        self.tick = 0
+
+    def apply_due(self, tick, grid, entity_states=None):
+        """Apply the replayed inputs logged for ticks up to tick."""
+        replay = self._replay
+        while self._replay_index < len(replay) and replay[self._replay_index][0] <= tick:
+            _, action, payload = replay[self._replay_index]
+            _apply_input(grid, entity_states, action, payload)
+            self._replay_index += 1
+        if self._replay_index >= len(replay):
+            self.replaying = False
+            print("Input log replay finished.")
+
+def _apply_input(grid, entity_states, action, payload):
+    from game_core.game_loop import place_entity, remove_entity, can_place_entity
+    from game_other.savegame import ENTITY_TYPE_MAP
+    if action == 'build':
+        snapshot = payload['entity']
+        entity = ENTITY_TYPE_MAP[snapshot['type']].from_dict(snapshot)
+        if can_place_entity(grid, entity, entity.x, entity.y):
+            place_entity(grid, entity_states, entity)
+            entity.on_built(is_move=payload['is_move'])
+    elif action == 'remove':
+        remove_entity(grid, entity_states, payload['x'], payload['y'])
+    elif action == 'resupply':
+        from game_ui.supplies_panel import resupply
+        resupply()
+    elif action == 'set':
+        from game_core.game_state import GameState
+        setattr(GameState(), payload['name'], payload['value'])
+    else:
+        print(f"Unknown input log action: {action}")
+
+# Singleton accessor
+input_log = InputLog()
+
+if REPLAY_INPUT_LOG:
+    input_log.start_replay(REPLAY_INPUT_LOG)
@@ -0,0 +1,125 @@
+# game_core/sat_check_scheduler.py
+# Advances the progress bars of all placed SatisfiableEntities in bulk and runs the satisfaction
+# checks of every bar that completed this tick as one batch.
+
+from game_core.components import component_store, np, NONE_SENTINEL
+from game_other.trace import trace_recorder
+
+class SatCheckScheduler:
+    """
+    Replaces SatisfiableEntity.update for entities with _batched_update (see components.py):
+    frame counters and sat-check timers of the whole office are advanced at once (vectorized with
+    NumPy when available), then the satisfaction checks of all completed bars run as one burst,
+    then the special bars are advanced. Entities with their own update() are updated one by one.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SatCheckScheduler, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.last_burst_size = 0
+        self._unbatched = ()
+        self._unbatched_version = None
+        self._initialized = True
+
+    def tick(self, grid):
+        from game_core.entity_base import SatisfiableEntity
+        duration = SatisfiableEntity._BAR_DURATION_FRAMES
+        refresh_rate = SatisfiableEntity._BAR_REFRESH_RATE
+        for entity in self._unbatched_entities():
+            entity.update(grid)
+        with component_store.lock:
+            rolled_slots, done_slots = self._advance_sat_check_bars(duration, refresh_rate)
+        owners = component_store.owners
+        completed = [owners[slot] for slot in done_slots if owners[slot] is not None]
+        self.last_burst_size = len(completed)
+        if completed:
+            with trace_recorder.span('Sat-check burst', 'simulation', {'entities': len(completed)}):
+                for entity in completed:
+                    entity.finish_sat_check_bar(grid)
+        with component_store.lock:
+            finished_slots = self._advance_special_bars(rolled_slots, duration, refresh_rate)
+        for slot in finished_slots:
+            entity = owners[slot]
+            if entity is not None:
+                entity.on_special_finish()  # Fire on_special when special completes
+
+    def _unbatched_entities(self):
+        from game_core.entity_registry import entity_registry
+        if self._unbatched_version != entity_registry.version:
+            self._unbatched = tuple(
+                e for e in entity_registry.snapshot()
+                if not getattr(e, '_batched_update', False) and getattr(e, '_needs_update', True)
+            )
+            self._unbatched_version = entity_registry.version
+        return self._unbatched
+
+    def _advance_sat_check_bars(self, duration, refresh_rate):
+        """Returns (slots whose frame counter rolled over, slots whose sat-check bar completed)."""
+        if np is not None and len(component_store):
+            batched = component_store.view('batched') == 1
+            counter = component_store.view('_progress_bar_frame_counter')
+            timer = component_store.view('bar1_timer')
+            counter[batched] += 1
+            rolled = batched & (counter >= refresh_rate)
+            counter[rolled] = 0
+            active = rolled & (timer != NONE_SENTINEL)
+            timer[active] += refresh_rate
+            done = active & (timer >= duration)
+            timer[done] = 0
+            return np.flatnonzero(rolled), np.flatnonzero(done).tolist()
+        columns = component_store.columns
+        batched = component_store.batched
+        counter = columns['_progress_bar_frame_counter']
+        timer = columns['bar1_timer']
+        rolled_slots, done_slots = [], []
+        for slot in range(len(batched)):
+            if not batched[slot]:
+                continue
+            counter[slot] += 1
+            if counter[slot] < refresh_rate:
+                continue
+            counter[slot] = 0
+            rolled_slots.append(slot)
+            if timer[slot] != NONE_SENTINEL:
+                timer[slot] += refresh_rate
+                if timer[slot] >= duration:
+                    timer[slot] = 0
+                    done_slots.append(slot)
+        return rolled_slots, done_slots
+
+    def _advance_special_bars(self, rolled_slots, duration, refresh_rate):
+        """Advance special bars of the rolled slots, returns the slots whose special bar completed."""
+        if np is not None and len(rolled_slots):
+            timer = component_store.view('special_timer')
+            eligible = (component_store.view('has_special')[rolled_slots] != 0) \
+                & (component_store.view('is_initialized')[rolled_slots] != 0) \
+                & (component_store.view('is_satisfied')[rolled_slots] != 0)
+            timer[rolled_slots[~eligible]] = NONE_SENTINEL
+            active = rolled_slots[eligible & (timer[rolled_slots] != NONE_SENTINEL)]
+            timer[active] += refresh_rate
+            finished = active[timer[active] >= duration]
+            timer[finished] = NONE_SENTINEL
+            return finished.tolist()
+        columns = component_store.columns
+        timer = columns['special_timer']
+        has_special, initialized, satisfied = columns['has_special'], columns['is_initialized'], columns['is_satisfied']
+        finished = []
+        for slot in rolled_slots:
+            if not (has_special[slot] and initialized[slot] and satisfied[slot]):
+                timer[slot] = NONE_SENTINEL
+            elif timer[slot] != NONE_SENTINEL:
+                timer[slot] += refresh_rate
+                if timer[slot] >= duration:
+                    timer[slot] = NONE_SENTINEL
+                    finished.append(slot)
+        return finished
+
+# Singleton accessor
+sat_check_scheduler = SatCheckScheduler()
@@ -0,0 +1,119 @@
+# game_core/simulation.py
+# Fixed timestep simulation of the office: entities, upkeep, game time and the gameplay event clock.
+# Has no display or mixer dependency, so it can be stepped headless (balance testing, benchmarks).
+
+import time
+
+from game_core.game_state import GameState, update_totals_from_grid
+from game_core.sat_check_scheduler import sat_check_scheduler
+from game_core.rng import input_log
+from game_core.event_scheduler import event_scheduler
+from game_other.profiler import profiler
+
+SIM_TICK_RATE = 30  # Simulation ticks per second (entities used to update every 2nd frame at 60 FPS)
+SECONDS_PER_DAY = 10  # 1 in-game day = 10 seconds
+SECONDS_PER_MONTH = 30 * SECONDS_PER_DAY  # Upkeep is charged per month
+MAX_TICKS_PER_ADVANCE = 8  # Real-time catch-up limit at 1x (scaled with the time scale), avoids a spiral after long frames
+TIME_SCALES = (1, 2, 4, 16, None)  # Game seconds per real second, None = max (as fast as the simulation runs)
+MAX_SPEED_FRAME_BUDGET = 0.1  # Real seconds of ticking per rendered frame at max speed
+
+class Simulation:
+    """
+    Steps the game at a fixed rate of tick_rate ticks per second of game time.
+    step() runs a single tick, advance(seconds) accumulates real time for the pygame loop
+    and exposes alpha (0..1) to interpolate between the last and the next tick when rendering.
+    Inputs are logged against tick_count (game_core/rng.py), a replayed log is applied here.
+    time_scale runs several ticks per frame. Everything paced by game time (days, upkeep, events)
+    keeps its pace per tick, only the real time between ticks shrinks.
+    """
+    def __init__(self, grid, tick_rate=SIM_TICK_RATE, run_events=True, entity_states=None):
+        self.grid = grid
+        self.entity_states = entity_states
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.run_events = run_events
+        self.tick_count = 0
+        self.time_scale_index = 0
+        self.alpha = 0.0
+        self._accumulator = 0.0
+        self._upkeep_accumulator = 0.0
+        if run_events:
+            from game_core.gameplay_events import start_gameplay_events
+            start_gameplay_events()
+
+    def step(self):
+        grid = self.grid
+        if input_log.replaying:
+            input_log.apply_due(self.tick_count, grid, self.entity_states)
+        # Bars of all entities advance together, completed satisfaction checks run as one batch
+        with profiler.scope('Entity tick'):
+            sat_check_scheduler.tick(grid)
+        with profiler.scope('Totals'):
+            update_totals_from_grid(grid)
+        gs = GameState()
+        self._apply_upkeep(gs)
+        gs.game_time_seconds += self.dt
+        gs.game_time_days = int(gs.game_time_seconds // SECONDS_PER_DAY) + 1
+        # Gameplay events due by now run here, on the simulation thread and clock
+        event_scheduler.advance(self.dt)
+        self.tick_count += 1
+        input_log.tick = self.tick_count
+
+    def _apply_upkeep(self, gs):
+        self._upkeep_accumulator += gs.total_upkeep * self.dt / SECONDS_PER_MONTH
+        int_deduction = int(self._upkeep_accumulator)
+        if int_deduction > 0:
+            gs.total_money -= int_deduction
+            self._upkeep_accumulator -= int_deduction
+
+    def run(self, ticks):
+        for _ in range(ticks):
+            self.step()
+
+    @property
+    def time_scale(self):
+        return TIME_SCALES[self.time_scale_index]
+
+    def set_time_scale_index(self, index):
+        self.time_scale_index = max(0, min(len(TIME_SCALES) - 1, index))
+        self._accumulator = 0.0
+        GameState().time_scale = self.time_scale
+        print(f"Simulation speed: {time_scale_label(self.time_scale)}")
+
+    def faster(self):
+        self.set_time_scale_index(self.time_scale_index + 1)
+
+    def slower(self):
+        self.set_time_scale_index(self.time_scale_index - 1)
+
+    def advance(self, seconds):
+        """Advance by real elapsed seconds (times the time scale). Returns the number of ticks run."""
+        scale = self.time_scale
+        if scale is None:
+            return self._advance_max()
+        self._accumulator += seconds * scale
+        ticks = 0
+        max_ticks = MAX_TICKS_PER_ADVANCE * scale
+        while self._accumulator >= self.dt and ticks < max_ticks:
+            self.step()
+            self._accumulator -= self.dt
+            ticks += 1
+        if self._accumulator >= self.dt:
+            self._accumulator = 0.0  # Drop the backlog instead of falling further behind
+        self.alpha = self._accumulator / self.dt
+        return ticks
+
+    def _advance_max(self):
+        # Tick for a fixed slice of real time, so one frame is rendered per MAX_SPEED_FRAME_BUDGET
+        deadline = time.perf_counter() + MAX_SPEED_FRAME_BUDGET
+        ticks = 0
+        while True:
+            self.step()
+            ticks += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.alpha = 0.0
+        return ticks
+
+def time_scale_label(time_scale):
+    return 'max' if time_scale is None else f"{time_scale}x"
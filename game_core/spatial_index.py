@@ -0,0 +1,131 @@
+# game_core/spatial_index.py
+# Per-type bucketed index of placed entities, used by proximity based satisfaction checks.
+
+BUCKET_SIZE = 8  # Grid cells per bucket side
+
+class SpatialIndex:
+    """
+    Keeps placed entities bucketed by class and by BUCKET_SIZE x BUCKET_SIZE grid cells,
+    so proximity queries only visit entities of the requested type near the query point.
+    Must be kept in sync with the grid (see place_entity/remove_entity in game_loop.py).
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SpatialIndex, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.clear()
+        self._initialized = True
+
+    def clear(self):
+        self._buckets = {}  # entity class -> {(bx, by): [entities]}
+        self._match_cache = {}  # query entity_type -> tuple of matching entity classes
+
+    def _bucket_keys(self, entity):
+        ex, ey = entity.x, entity.y
+        ew = getattr(entity, 'width', 1)
+        eh = getattr(entity, 'height', 1)
+        return {
+            (bx, by)
+            for bx in range(ex // BUCKET_SIZE, (ex + ew - 1) // BUCKET_SIZE + 1)
+            for by in range(ey // BUCKET_SIZE, (ey + eh - 1) // BUCKET_SIZE + 1)
+        }
+
+    def add(self, entity):
+        cls = type(entity)
+        buckets = self._buckets.get(cls)
+        if buckets is None:
+            buckets = self._buckets[cls] = {}
+            self._match_cache.clear()
+        for key in self._bucket_keys(entity):
+            buckets.setdefault(key, []).append(entity)
+
+    def remove(self, entity):
+        buckets = self._buckets.get(type(entity))
+        if buckets is None:
+            return
+        for key in self._bucket_keys(entity):
+            bucket = buckets.get(key)
+            if bucket is not None and entity in bucket:
+                bucket.remove(entity)
+                if not bucket:
+                    del buckets[key]
+        if not buckets:
+            del self._buckets[type(entity)]
+            self._match_cache.clear()
+
+    def _matching_classes(self, entity_type):
+        """Accepts a class, a list/tuple of classes or a type string (e.g. 'router')."""
+        key = tuple(entity_type) if isinstance(entity_type, list) else entity_type
+        classes = self._match_cache.get(key)
+        if classes is not None:
+            return classes
+        placed = tuple(self._buckets)
+        if isinstance(entity_type, type):
+            classes = tuple(cls for cls in placed if issubclass(cls, entity_type))
+        elif isinstance(entity_type, (list, tuple)) and all(isinstance(t, type) for t in entity_type):
+            classes = tuple(cls for cls in placed if issubclass(cls, tuple(entity_type)))
+        else:
+            from game_core.entity_base import to_type_from_classname
+            classes = tuple(cls for cls in placed if to_type_from_classname(cls.__name__) == entity_type)
+        self._match_cache[key] = classes
+        return classes
+
+    def matches(self, entity_type, entity):
+        """True if a query for entity_type would return the (placed) entity."""
+        return type(entity) in self._matching_classes(entity_type)
+
+    def candidates(self, entity_type, x, y, radius):
+        """Yield each entity of entity_type from the buckets overlapping the square around (x, y)."""
+        bx0, bx1 = (x - radius) // BUCKET_SIZE, (x + radius) // BUCKET_SIZE
+        by0, by1 = (y - radius) // BUCKET_SIZE, (y + radius) // BUCKET_SIZE
+        for cls in self._matching_classes(entity_type):
+            buckets = self._buckets.get(cls)
+            if not buckets:
+                continue
+            multi_tile = getattr(cls, 'width', 1) > 1 or getattr(cls, 'height', 1) > 1
+            seen = set() if multi_tile else None
+            for bx in range(bx0, bx1 + 1):
+                for by in range(by0, by1 + 1):
+                    bucket = buckets.get((bx, by))
+                    if not bucket:
+                        continue
+                    for entity in tuple(bucket):
+                        if seen is not None:
+                            if id(entity) in seen:
+                                continue
+                            seen.add(id(entity))
+                        yield entity
+
+    def query(self, entity_type, x, y, radius):
+        """Return entities of entity_type with any occupied tile within Manhattan distance radius of (x, y)."""
+        return [e for e in self.candidates(entity_type, x, y, radius) if manhattan_to_footprint(e, x, y) <= radius]
+
+    def any_within(self, entity_type, x, y, radius, predicate=None):
+        for entity in self.candidates(entity_type, x, y, radius):
+            if manhattan_to_footprint(entity, x, y) <= radius and (predicate is None or predicate(entity)):
+                return True
+        return False
+
+def manhattan_to_footprint(entity, x, y):
+    """Manhattan distance from (x, y) to the nearest tile occupied by entity."""
+    ex, ey = entity.x, entity.y
+    dx = max(ex - x, 0, x - (ex + getattr(entity, 'width', 1) - 1))
+    dy = max(ey - y, 0, y - (ey + getattr(entity, 'height', 1) - 1))
+    return dx + dy
+
+def chebyshev_to_footprint(entity, x, y):
+    """Chebyshev distance from (x, y) to the nearest tile occupied by entity."""
+    ex, ey = entity.x, entity.y
+    dx = max(ex - x, 0, x - (ex + getattr(entity, 'width', 1) - 1))
+    dy = max(ey - y, 0, y - (ey + getattr(entity, 'height', 1) - 1))
+    return max(dx, dy)
+
+# Singleton accessor
+spatial_index = SpatialIndex()
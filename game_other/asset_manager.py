@@ -0,0 +1,202 @@
+# game_other/asset_manager.py
+# Single owner of image files and fonts: PNGs are loaded (and converted to the display format) once,
+# scaled/tinted variants and font objects are cached, so draw code never touches the filesystem.
+# Images packed by data/graphics/convert/build_atlas.py are served as sub-rects of a few atlas pages.
+
+import json
+import os
+from collections import OrderedDict
+
+import pygame
+
+from game_core.config import FONT1, resource_path
+
+VARIANT_CACHE_MAX = 512  # Scaled/tinted surfaces kept, least recently used are dropped first
+ATLAS_INDEX = "data/graphics/atlas/atlas.json"  # Written by data/graphics/convert/build_atlas.py
+
+def entity_icon_paths():
+    """Every _icon* PNG of the entity classes."""
+    from game_core import entity_definitions
+    paths = []
+    for cls in vars(entity_definitions).values():
+        if isinstance(cls, type):
+            for name, value in vars(cls).items():
+                if name.startswith('_icon') and isinstance(value, str) and value.lower().endswith('.png'):
+                    paths.append(value)
+    return paths
+
+def atlas_key(path):
+    """Name of an image in the atlas index: its path relative to the game folder, with forward slashes."""
+    if os.path.isabs(path):
+        path = os.path.relpath(path, resource_path(''))
+    return path.replace(os.sep, '/')
+
+class AssetManager:
+    """
+    Images are keyed by path (as given, resource_path()-resolved or not). Modules register the
+    icons they draw with register() at import time, preload() loads those plus every entity
+    icon once the display exists (convert_alpha needs it). Images asked for later are loaded
+    on first use and reported, so missing preloads show up in the log.
+    If the atlas index exists, preload() takes the images it contains from its pages instead of
+    opening one file each, and scaled() serves the sizes registered for an image from the atlas too.
+    Surfaces handed out are shared: blit them, do not draw on them.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self._registered = []
+        self._sizes = {}  # path -> [(width, height)] the UI draws it at, packed by the atlas builder
+        self._atlas_sizes = {}  # (path, width, height) -> sub-rect of an atlas page
+        self._images = {}  # path -> Surface, None if it could not be loaded
+        self._variants = OrderedDict()  # (path, width, height, tint, alpha) -> Surface
+        self._fonts = {}  # (font file or None, size) -> Font
+        self.preloaded = False
+        self._initialized = True
+
+    def register(self, *paths, sizes=()):
+        """Declare images to load in preload(), and the fixed (width, height) sizes they are drawn at."""
+        for path in paths:
+            if path:
+                self._registered.append(path)
+                for size in sizes:
+                    path_sizes = self._sizes.setdefault(path, [])
+                    if tuple(size) not in path_sizes:
+                        path_sizes.append(tuple(size))
+
+    def asset_paths(self):
+        """Registered images and entity icons, without duplicates, in registration order."""
+        return list(dict.fromkeys(self._registered + entity_icon_paths()))
+
+    def asset_sizes(self, path):
+        return list(self._sizes.get(path, ()))
+
+    def preload(self):
+        """Load every registered image and entity icon. Call after pygame.display.set_mode()."""
+        paths = self.asset_paths()
+        from_atlas = self._load_atlas(paths)
+        for path in paths:
+            if path not in self._images:
+                self._images[path] = self._load(path)
+        self.preloaded = True
+        loaded = sum(s is not None for s in self._images.values())
+        print(f"AssetManager: preloaded {loaded} images, {from_atlas} from the atlas")
+
+    def _load_atlas(self, paths):
+        # Sub-rects share their page's pixels, blitting them is as fast as blitting a separate surface
+        index_path = resource_path(ATLAS_INDEX)
+        if not os.path.exists(index_path):
+            return 0
+        try:
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            folder = os.path.dirname(index_path)
+            pages = [self._load(os.path.join(folder, name)) for name in index['pages']]
+            images = index['images']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"AssetManager: cannot read the atlas, loading separate files: {e}")
+            return 0
+        count = 0
+        for path in paths:
+            entry = images.get(atlas_key(path))
+            if entry is None or path in self._images:
+                continue
+            for page_number, x, y, width, height in entry['rects']:
+                page = pages[page_number]
+                if page is None:
+                    break
+                surf = self._atlas_sizes[(path, width, height)] = page.subsurface((x, y, width, height))
+                if (width, height) == tuple(entry['size']):
+                    self._images[path] = surf  # Its own size, or at most MAX_IMAGE_SIZE of the builder
+            else:
+                count += 1
+        return count
+
+    def _load(self, path):
+        full_path = path if os.path.isabs(path) else resource_path(path)
+        try:
+            surf = pygame.image.load(full_path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"AssetManager: cannot load {path}: {e}")
+            return None
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return surf
+
+    def image(self, path):
+        """The image at path in the display format, None if it is missing."""
+        try:
+            return self._images[path]
+        except KeyError:
+            if self.preloaded:
+                print(f"AssetManager: {path} was not preloaded")
+            surf = self._images[path] = self._load(path)
+            return surf
+
+    def scaled(self, path, width, height, tint=None, alpha=None):
+        """
+        The image at path smoothscaled to (width, height). tint replaces its RGB with a color
+        and keeps its alpha, alpha multiplies its opacity (0-255). None if the image is missing.
+        """
+        key = (path, int(width), int(height), tint, alpha)
+        if tint is None and alpha is None:
+            surf = self.atlas_image(path, width, height)
+            if surf is not None:
+                return surf
+        surf = self._variants.get(key)
+        if surf is not None:
+            self._variants.move_to_end(key)
+            return surf
+        source = self.image(path)
+        if source is None:
+            return None
+        surf = pygame.transform.smoothscale(source, (key[1], key[2]))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        if tint is not None:
+            surf.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+            surf.fill((tint[0], tint[1], tint[2], 0), special_flags=pygame.BLEND_RGBA_ADD)
+        if alpha is not None:
+            surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        self._variants[key] = surf
+        if len(self._variants) > VARIANT_CACHE_MAX:
+            self._variants.popitem(last=False)
+        return surf
+
+    def atlas_image(self, path, width, height):
+        """The image at path pre-scaled to (width, height) in the atlas, None if the atlas has no such size."""
+        return self._atlas_sizes.get((path, int(width), int(height)))
+
+    def clear_variants(self, path=None):
+        """Drop the cached scaled variants (of one image, or all of them)."""
+        if path is None:
+            self._variants.clear()
+        else:
+            for key in [key for key in self._variants if key[0] == path]:
+                del self._variants[key]
+
+    def font(self, size, name=FONT1):
+        """Shared font object for a font file (default FONT1). Do not change its style (bold, underline...)."""
+        key = (name, int(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, key[1])
+        return font
+
+    def sys_font(self, size):
+        """Shared pygame.font.SysFont(None, size), the default system font."""
+        key = ('__sysfont__', int(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.SysFont(None, key[1])
+        return font
+
+# Singleton accessor
+asset_manager = AssetManager()
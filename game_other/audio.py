@@ -4,7 +4,15 @@ import pygame
 import sys
 from game_core.config import resource_path
 
+AUDIO_ENABLED = True  # Set to False (set_audio_enabled) for headless runs without a mixer
+
+def set_audio_enabled(enabled):
+    global AUDIO_ENABLED
+    AUDIO_ENABLED = bool(enabled)
+
 def play_random_music_wav(music_dir=None):
+    if not AUDIO_ENABLED:
+        return
     if music_dir is None:
         music_dir = resource_path(os.path.join('data', 'audio', 'music'))
     wav_files = [f for f in os.listdir(music_dir) if f.lower().endswith(('.wav', '.mp3'))]
@@ -31,6 +39,8 @@ def play_random_music_wav(music_dir=None):
     #         play_next()
 
 def play_sound_effect(default_path, sound_path=None):
+    if not AUDIO_ENABLED:
+        return
     path = resource_path(sound_path or default_path)
     try:
         sound = pygame.mixer.Sound(path)
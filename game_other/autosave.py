@@ -0,0 +1,202 @@
+# game_other/autosave.py
+# Crash-safe autosave: placements, removals and GameState changes are appended to a journal
+# next to the save file by a writer thread, and compacted into a full snapshot every few minutes.
+# load_game() restores the snapshot and replays the journal written after it.
+# The same thread writes the snapshots of save_game(), in order with the journal records.
+
+import os
+import queue
+import threading
+import time
+
+import game_other.savegame as savegame
+from game_other.save_format import (
+    encode_journal_header, encode_journal_record, place_record, decode_journal, build_entity, SaveFormatError,
+)
+
+JOURNAL_FILE = 'save.journal'
+COMPACT_INTERVAL = 5 * 60  # Seconds of real time between snapshots, the journal restarts after each
+STATE_CHECK_INTERVAL = 2.0  # Seconds of real time between GameState diffs
+
+class Autosave:
+    """
+    The main thread only encodes small records and puts them on a queue, the writer thread
+    appends them to the journal and fsyncs once per batch. Entity fields that change while an
+    entity stands (timers, broken state) are not journaled, they are restored from the last snapshot.
+    A snapshot queued while journaling restarts the journal once it is on disk; records queued
+    after it go to the new journal, records queued before it are part of it.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Autosave, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.active = False
+        self.generation = None  # Snapshot the journal applies to, stored in the save file's meta
+        self._queue = queue.Queue()
+        self._thread = None
+        self._last_state = {}
+        self._next_state_check = 0.0
+        self._next_compaction = 0.0
+        self._initialized = True
+
+    def start(self, state):
+        """Begin autosaving the world in the game loop's state dict, with a snapshot of its current state."""
+        if not savegame.ALLOW_SAVE_AND_LOAD or self.active:
+            return
+        self._start_writer()
+        self.active = True
+        self._last_state = _game_state_values()
+        self.compact(state)
+
+    def stop(self):
+        """Write out everything queued and end the writer thread."""
+        self.active = False
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def wait(self):
+        """Block until everything queued so far is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _start_writer(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._writer, name='save-writer', daemon=True)
+            self._thread.start()
+
+    def update(self, state):
+        """Called once per frame: journals GameState changes and compacts when the interval is up."""
+        if not self.active:
+            return
+        now = time.monotonic()
+        if now >= self._next_compaction:
+            self.compact(state)
+        elif now >= self._next_state_check:
+            self._next_state_check = now + STATE_CHECK_INTERVAL
+            values = _game_state_values()
+            changed = {k: v for k, v in values.items() if self._last_state.get(k) != v}
+            if changed:
+                self._last_state = values
+                self._append(['state', changed])
+
+    def compact(self, state):
+        # The writer starts a new journal once the snapshot is written (submit_snapshot)
+        savegame.save_game(state['entity_states'], state['camera_offset'], state['cell_size'])
+        self._last_state = _game_state_values()
+        now = time.monotonic()
+        self._next_compaction = now + COMPACT_INTERVAL
+        self._next_state_check = now + STATE_CHECK_INTERVAL
+
+    def submit_snapshot(self, snapshot):
+        """Queue a savegame.SaveSnapshot for writing."""
+        self._start_writer()
+        self.generation = snapshot.generation
+        self._queue.put(('snapshot', (snapshot, self.active)))
+
+    def record_place(self, entity):
+        if self.active:
+            self._append(place_record(entity, savegame.ENTITY_TYPE_NAMES))
+
+    def record_remove(self, x, y):
+        if self.active:
+            self._append(['remove', x, y])
+
+    def _append(self, record):
+        try:
+            self._queue.put(('append', encode_journal_record(record)))
+        except SaveFormatError as e:
+            print(f"Autosave: cannot journal {record[0]}: {e}")
+
+    def _writer(self):
+        journal = None
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get())
+            try:
+                for item in items:
+                    if item is None:
+                        running = False
+                        break
+                    action, payload = item
+                    if action == 'snapshot':
+                        snapshot, start_journal = payload
+                        # On failure keep appending to the old journal, it still matches the old save file
+                        if savegame.write_snapshot(snapshot) and start_journal:
+                            # Everything queued before the snapshot is in it, drop the old journal
+                            if journal is not None:
+                                journal.close()
+                            journal = open(os.path.join(savegame.ensure_save_folder(), JOURNAL_FILE), 'wb')
+                            journal.write(encode_journal_header(snapshot.generation))
+                    elif journal is not None:
+                        journal.write(payload)
+                if journal is not None:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+            except OSError as e:
+                print(f"Autosave: error writing journal: {e}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+        if journal is not None:
+            journal.close()
+
+    def replay_journal(self, grid, entity_states, generation):
+        """Apply the journal written after the snapshot with this generation, if there is one."""
+        self.generation = generation
+        path = os.path.join(savegame.ensure_save_folder(), JOURNAL_FILE)
+        if generation is None or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'rb') as journal:
+                journal_generation, records = decode_journal(journal.read())
+        except (OSError, SaveFormatError) as e:
+            print(f"Autosave: error reading journal: {e}")
+            return 0
+        if journal_generation != generation:
+            return 0  # Left over from an older snapshot, its changes are already in the save file
+        for record in records:
+            _apply_record(grid, entity_states, record)
+        print(f"Autosave: replayed {len(records)} journal records")
+        return len(records)
+
+def _game_state_values():
+    from game_core.game_state import GameState
+    gs = GameState()
+    return {k: getattr(gs, k, None) for k in savegame.SINGLETON_VARS}
+
+def _apply_record(grid, entity_states, record):
+    from game_core.game_loop import place_entity, remove_entity, can_place_entity
+    action = record[0]
+    if action == 'place':
+        cls = savegame.ENTITY_TYPE_MAP.get(record[1])
+        if cls is None:
+            print(f"Warning: unknown entity type '{record[1]}' in journal, skipped.")
+            return
+        entity = build_entity(cls, record[2])
+        if can_place_entity(grid, entity, entity.x, entity.y):
+            place_entity(grid, entity_states, entity)
+    elif action == 'remove':
+        remove_entity(grid, entity_states, record[1], record[2])
+    elif action == 'state':
+        from game_core.game_state import GameState
+        gs = GameState()
+        for k, v in record[1].items():
+            if hasattr(gs, k):
+                setattr(gs, k, v)
+    else:
+        print(f"Unknown journal record: {action}")
+
+# Singleton accessor
+autosave = Autosave()
@@ -0,0 +1,220 @@
+# game_other/benchmark.py
+# Benchmark suite: times simulation ticks, totals, rendering and save/load on reproducible office layouts.
+# Run from the project root:  python -m game_other.benchmark [--output results.json]
+# Results are printed (or written) as JSON so they can be compared across commits.
+
+import os
+import sys
+
+# Headless by default, must be set before pygame is imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keep stdout clean for the JSON results
+
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+
+import pygame
+
+DEFAULT_SEED = 1234
+
+import game_other.feature_toggle as feature_toggle
+feature_toggle.RNG_SEED = DEFAULT_SEED  # Before the game imports, so no random master seed is printed to stdout
+
+from game_other.audio import set_audio_enabled
+from game_core.config import GAME_AREA_WIDTH, GAME_AREA_HEIGHT, CELL_SIZE, GRID_EMPTY_SPACE_COL
+from game_core.entity_definitions import *
+from game_core.entity_state import EntityStateList
+from game_core.entity_registry import entity_registry
+from game_core.game_state import update_totals_from_grid
+from game_core.sat_check_scheduler import sat_check_scheduler
+from game_core.rng import rng
+from game_core.simulation import Simulation
+from game_core import game_loop
+import game_other.savegame as savegame
+import game_other.testing_layout as testing_layout
+
+BENCH_RESOLUTION = (1920, 1080)
+DEFAULT_TICKS = 300
+DEFAULT_WARMUP_TICKS = 60  # Two seconds of game time, lets the first sat-check bars complete
+DEFAULT_FRAMES = 60
+DEFAULT_IO_REPEAT = 3
+
+# Entity mix used to fill every free tile of the 'full' layouts
+FULL_LAYOUT_CLASSES = [
+    ComputerT1, ComputerT2, Macbook, BasicMonitor, AdvancedMonitor, Artist, TechnicalDirector,
+    ProjectManager, AccountManager, EspressoMachine, Outlet, Router, AirConditioner, Humidifier,
+    Fridge, Breaker, FlowerPot, Cactus,
+]
+
+# name -> (grid scale relative to the game area, layout, render)
+SCENARIOS = {
+    'empty': (1, None, True),
+    'testing_layout': (1, 'testing', True),
+    'full': (1, 'full', True),
+    'full_2x': (2, 'full', False),  # Enlarged grids are not rendered, the entity layer would be huge
+    'full_4x': (4, 'full', False),
+}
+
+def _summary(samples_ms):
+    ordered = sorted(samples_ms)
+    return {
+        'n': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered), 4),
+        'median_ms': round(statistics.median(ordered), 4),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        'min_ms': round(ordered[0], 4),
+        'max_ms': round(ordered[-1], 4),
+    }
+
+def _time_calls(fn, n):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return _summary(samples)
+
+def clear_world(entity_states=None):
+    """Remove every placed entity through the registry, so all derived indexes stay consistent."""
+    for entity in entity_registry.snapshot():
+        entity_registry.remove(entity)
+    if entity_states is not None:
+        entity_states.clear()
+
+def build_layout(layout, width, height, seed):
+    """Seeded, non-threaded version of the testing_layout spawns. Returns (grid, entity_states)."""
+    rng.seed(seed)  # All streams, so the entity rolls of the timed ticks repeat too
+    grid = [[None for _ in range(width)] for _ in range(height)]
+    entity_states = EntityStateList()
+    with contextlib.redirect_stdout(sys.stderr):
+        if layout in ('testing', 'full'):
+            testing_layout.spawn_testing_layout(grid, entity_states, width, height, threaded=False)
+        if layout == 'full':
+            testing_layout.RandomSpawn(FULL_LAYOUT_CLASSES, probability=1.0).spawn(grid, entity_states, width, height, threaded=False)
+    return grid, entity_states
+
+def bench_simulation(grid, ticks, warmup_ticks):
+    simulation = Simulation(grid, run_events=False)
+    simulation.run(warmup_ticks)
+    return {
+        'simulation_step': _time_calls(simulation.step, ticks),
+        'entity_tick': _time_calls(lambda: sat_check_scheduler.tick(grid), ticks),
+        'update_totals': _time_calls(lambda: update_totals_from_grid(grid), ticks),
+    }
+
+def bench_render(grid, entity_states, frames):
+    from game_core.controls import GameControls
+    screen = pygame.display.set_mode(BENCH_RESOLUTION)
+    cell_size = CELL_SIZE
+    background_surface = pygame.Surface((len(grid[0]) * cell_size, len(grid) * cell_size))
+    background_surface.fill(GRID_EMPTY_SPACE_COL)
+    font = pygame.font.SysFont(None, 24)
+    clock = pygame.time.Clock()
+    controls = GameControls()
+    camera_offset = [
+        -(len(grid[0]) * cell_size // 2 - screen.get_width() // 2),
+        -(len(grid) * cell_size // 2 - screen.get_height() // 2),
+    ]
+    state = dict(grid=grid, entity_states=entity_states, camera_offset=camera_offset, cell_size=cell_size, selected_index=None, selected_entity_type=None)
+    render = lambda: game_loop.render_game(state, screen, background_surface, font, {}, clock, controls)
+    first_frame = _time_calls(render, 1)  # Includes baking the entity layer
+    return {'first_frame': first_frame, 'render_frame': _time_calls(render, frames)}
+
+def bench_save_load(grid, entity_states, repeat):
+    saved = (savegame.ALLOW_SAVE_AND_LOAD, savegame.SAVE_FOLDER)
+    result = {}
+    with tempfile.TemporaryDirectory() as save_folder:
+        savegame.ALLOW_SAVE_AND_LOAD = 1
+        savegame.SAVE_FOLDER = save_folder  # Absolute, ensure_save_folder() joins it with the cwd
+        try:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                result['save'] = _time_calls(lambda: savegame.save_game(entity_states, wait=True), repeat)
+                # Time spent on the calling thread, the rest runs on the save writer thread
+                result['save_snapshot'] = _time_calls(lambda: savegame.take_snapshot(entity_states), repeat)
+                result['save_bytes'] = os.path.getsize(os.path.join(save_folder, savegame.SAVE_FILE))
+                samples = []
+                for _ in range(repeat):
+                    clear_world(entity_states)
+                    loaded_grid = [[None for _ in range(len(grid[0]))] for _ in range(len(grid))]
+                    start = time.perf_counter()
+                    entity_states, _, _ = savegame.load_game(loaded_grid)
+                    samples.append((time.perf_counter() - start) * 1000.0)
+                result['load'] = _summary(samples)
+                result['loaded_entities'] = len(entity_registry)
+        finally:
+            savegame.ALLOW_SAVE_AND_LOAD, savegame.SAVE_FOLDER = saved
+            clear_world()
+    return result
+
+def run_scenario(name, args):
+    scale, layout, render = SCENARIOS[name]
+    width, height = GAME_AREA_WIDTH * scale, GAME_AREA_HEIGHT * scale
+    clear_world()
+    start = time.perf_counter()
+    grid, entity_states = build_layout(layout, width, height, args.seed)
+    result = {
+        'grid': [width, height],
+        'entities': len(entity_registry),
+        'build_ms': round((time.perf_counter() - start) * 1000.0, 4),
+    }
+    result.update(bench_simulation(grid, args.ticks, args.warmup_ticks))
+    if render and not args.no_render:
+        result.update(bench_render(grid, entity_states, args.frames))
+    if not args.no_save:
+        result.update(bench_save_load(grid, entity_states, args.io_repeat))
+    clear_world(entity_states)
+    return result
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulation, rendering and save/load on seeded office layouts.")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--ticks', type=int, default=DEFAULT_TICKS)
+    parser.add_argument('--warmup-ticks', type=int, default=DEFAULT_WARMUP_TICKS)
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES)
+    parser.add_argument('--io-repeat', type=int, default=DEFAULT_IO_REPEAT)
+    parser.add_argument('--no-render', action='store_true')
+    parser.add_argument('--no-save', action='store_true')
+    parser.add_argument('--output', help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    set_audio_enabled(False)
+    results = {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'seed': args.seed,
+        'ticks': args.ticks,
+        'frames': args.frames,
+        'scenarios': {},
+    }
+    for name in args.scenarios:
+        print(f"Running benchmark scenario '{name}'...", file=sys.stderr)
+        results['scenarios'][name] = run_scenario(name, args)
+    pygame.quit()
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(text + '\n')
+        print(f"Benchmark results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
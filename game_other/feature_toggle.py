@@ -9,4 +9,9 @@ ALLOW_ARROW_POINTER = 0
 ALLOW_PROJECT_OVERVIEW_PANEL = 1
 ALLOW_CONSTRUCTION_PANEL = 1
 ALLOW_SUPPLIES_PANEL = 1
-ALLOW_SAVE_AND_LOAD = 0
\ No newline at end of file
+ALLOW_SAVE_AND_LOAD = 0
+DEBUG_TOTALS_LEDGER = 0  # Cross-check incremental GameState totals against a full grid recount
+ALLOW_FRAME_TRACE = 0  # Record a trace from startup (F9 toggles recording, F10 dumps it to _output)
+RNG_SEED = None  # Master seed of the game's random streams (game_core/rng.py), None picks and prints one per run
+RECORD_INPUT_LOG = 0  # Write the seed and all builds/removals to _output/inputs_<timestamp>.json on exit
+REPLAY_INPUT_LOG = None  # Path of an input log to replay, the run uses its seed
@@ -1,4 +1,5 @@
 import os
+import time
 import traceback
 
 def ensure_output_folder():
@@ -17,3 +18,7 @@ def log_crash(exception):
         crash_log.write(traceback.format_exc())
         crash_log.write("\n")
     print(f"Crash log written to {crash_log_path}")
+    # Keep the frames leading up to the crash if a trace was being recorded
+    from game_other.trace import trace_recorder
+    if trace_recorder.enabled and trace_recorder.events:
+        trace_recorder.dump(os.path.join(output_folder, time.strftime('crash_trace_%Y%m%d_%H%M%S.json')))
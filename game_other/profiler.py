@@ -0,0 +1,167 @@
+# game_other/profiler.py
+# Per-phase frame profiler: scoped perf_counter_ns timers and per-frame call counters,
+# read by the profiler panel (game_ui/profiler_panel.py).
+
+import time
+from collections import deque
+
+import pygame
+
+HISTORY_FRAMES = 300  # Rolling window for the percentiles (5 seconds at 60 FPS)
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'path', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        self.path = stack[-1] + '/' + self.name if stack else self.name
+        stack.append(self.path)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter_ns() - self.start
+        profiler = self.profiler
+        profiler._stack.pop()
+        profiler._current[self.path] = profiler._current.get(self.path, 0) + elapsed
+        if profiler.span_sink is not None:
+            profiler.span_sink(self.name, 'frame', self.start, elapsed)
+        return False
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SCOPE = _NullScope()
+
+class FrameProfiler:
+    """
+    Collects the time spent per phase in each frame. Phases are opened with
+    `with profiler.scope('Name'):` and nest, a phase opened inside another is recorded as
+    'Parent/Name'. Counters (blits, font renders) are reset every frame.
+    begin_frame()/end_frame() delimit a frame, the last HISTORY_FRAMES frames are kept.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.enabled = True
+        self.span_sink = None  # Optional callable(name, category, start_ns, duration_ns, args=None), see trace.py
+        self.reset()
+        self._initialized = True
+
+    def reset(self):
+        self.history = {}  # phase path -> deque of ns per frame
+        self.frame_history = deque(maxlen=HISTORY_FRAMES)  # Total ns per frame
+        self.counters = {}  # Counters of the frame in progress
+        self.last_counters = {}  # Counters of the last finished frame
+        self.frame_count = 0
+        self._order = {}  # phase path -> order of first appearance
+        self._current = {}
+        self._stack = []
+        self._frame_start = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def begin_frame(self):
+        self._current = {}
+        self._stack = []
+        self.counters = {}
+        self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        frame_ns = time.perf_counter_ns() - self._frame_start
+        self.frame_history.append(frame_ns)
+        if self.span_sink is not None:
+            self.span_sink('Frame', 'frame', self._frame_start, frame_ns, {'frame': self.frame_count, **self.counters})
+        current = self._current
+        for path in current:
+            if path not in self.history:
+                # Pad phases seen for the first time, so all histories stay aligned with frame_history
+                self.history[path] = deque([0] * (len(self.frame_history) - 1), maxlen=HISTORY_FRAMES)
+                self._order[path] = len(self._order)
+        for path, samples in self.history.items():
+            samples.append(current.get(path, 0))
+        self.last_counters = self.counters
+        self.frame_count += 1
+        self._frame_start = None
+
+    def phases(self):
+        """Phase paths with children right after their parent, siblings in order of first appearance."""
+        order = self._order
+        def key(path):
+            parts = path.split('/')
+            return [order.get('/'.join(parts[:i + 1]), len(order)) for i in range(len(parts))]
+        return sorted(self.history, key=key)
+
+    def percentiles(self, samples, quantiles=(0.5, 0.95, 0.99)):
+        """Nearest-rank percentiles of ns samples, in ms."""
+        if not samples:
+            return tuple(0.0 for _ in quantiles)
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(q * len(ordered)))] / 1e6 for q in quantiles)
+
+    def phase_percentiles(self, path):
+        return self.percentiles(self.history.get(path, ()))
+
+    def frame_percentiles(self):
+        return self.percentiles(self.frame_history)
+
+    def recent_mean_ms(self, path, frames=30):
+        """Mean ms of a phase over the last frames (used by the flame bar, smoother than one frame)."""
+        samples = self.history.get(path)
+        if not samples:
+            return 0.0
+        recent = list(samples)[-frames:]
+        return sum(recent) / len(recent) / 1e6
+
+    def recent_frame_ms(self, frames=30):
+        if not self.frame_history:
+            return 0.0
+        recent = list(self.frame_history)[-frames:]
+        return sum(recent) / len(recent) / 1e6
+
+# Singleton accessor
+profiler = FrameProfiler()
+
+class CountingFont(pygame.font.Font):
+    """pygame Font that reports every render() call to the profiler."""
+    def render(self, *args, **kwargs):
+        profiler.count('font_render')
+        return super().render(*args, **kwargs)
+
+def install_font_counter():
+    """
+    Route pygame.font.Font (and SysFont, which builds on it) through CountingFont, so font.render
+    calls of every font created afterwards are counted. Call once after pygame.init().
+    """
+    import pygame.sysfont
+    if pygame.font.Font is not CountingFont:
+        pygame.font.Font = CountingFont
+        pygame.sysfont.Font = CountingFont
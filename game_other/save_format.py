@@ -0,0 +1,296 @@
+# game_other/save_format.py
+# Versioned binary save format: a small header, then an (optionally compressed) body of tagged values.
+# Entities are written as a type id plus only the fields that differ from their class defaults.
+# Reading never executes code from the file, unlike unpickling.
+
+import lzma
+import struct
+import zlib
+from typing import Any, Dict, List, Tuple
+
+from game_core.components import COMPONENT_FIELD_NAMES
+
+MAGIC = b'OFSAVE'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<6sHB')  # magic, format version, compression
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+COMPRESSION_IDS = {'none': COMPRESSION_NONE, 'zlib': COMPRESSION_ZLIB, 'lzma': COMPRESSION_LZMA}
+
+class SaveFormatError(Exception):
+    pass
+
+# --- Tagged values ---
+# Field values are plain data (numbers, strings, None and lists/tuples/dicts of them)
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE, _DICT = range(9)
+_FLOAT_STRUCT = struct.Struct('<d')
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def write_value(out: bytearray, value: Any) -> None:
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))  # Zigzag
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _FLOAT_STRUCT.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode('utf-8')
+        out.append(_STR)
+        _write_varint(out, len(encoded))
+        out += encoded
+    elif isinstance(value, (list, tuple)):
+        out.append(_TUPLE if isinstance(value, tuple) else _LIST)
+        _write_varint(out, len(value))
+        for item in value:
+            write_value(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            write_value(out, key)
+            write_value(out, item)
+    else:
+        raise SaveFormatError(f"Cannot save value of type {type(value).__name__}: {value!r}")
+
+def read_value(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _INT:
+        n, pos = _read_varint(data, pos)
+        return (n >> 1) if not n & 1 else -((n + 1) >> 1), pos
+    if tag == _FLOAT:
+        return _FLOAT_STRUCT.unpack_from(data, pos)[0], pos + 8
+    if tag == _STR:
+        length, pos = _read_varint(data, pos)
+        return data[pos:pos + length].decode('utf-8'), pos + length
+    if tag == _LIST or tag == _TUPLE:
+        length, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(length):
+            item, pos = read_value(data, pos)
+            items.append(item)
+        return (tuple(items) if tag == _TUPLE else items), pos
+    if tag == _DICT:
+        length, pos = _read_varint(data, pos)
+        result = {}
+        for _ in range(length):
+            key, pos = read_value(data, pos)
+            result[key], pos = read_value(data, pos)
+        return result, pos
+    raise SaveFormatError(f"Unknown value tag {tag} at offset {pos - 1}")
+
+# --- Entity schema ---
+_MISSING = object()
+_schema_cache: Dict[type, Tuple[Tuple[str, ...], Dict[str, Any]]] = {}
+
+def entity_schema(cls: type) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+    """
+    (class fields, defaults) of an entity class: its public non-callable class attributes, including
+    the component store fields but not other properties (bar1, special and special_chance are derived).
+    """
+    schema = _schema_cache.get(cls)
+    if schema is None:
+        fields = []
+        for name in dir(cls):
+            if name.startswith('_') or name in ('color', 'type'):
+                continue
+            attr = getattr(cls, name)
+            if isinstance(attr, property):
+                if name not in COMPONENT_FIELD_NAMES:
+                    continue
+            elif callable(attr):
+                continue
+            fields.append(name)
+        defaults = {name: cls.class_default(name) for name in fields}
+        schema = _schema_cache[cls] = (tuple(fields), defaults)
+    return schema
+
+def _same(a: Any, b: Any) -> bool:
+    return type(a) is type(b) and a == b
+
+def entity_fields(entity) -> Dict[str, Any]:
+    """Fields of entity that differ from its class defaults, plus instance attributes without one."""
+    return state_fields(type(entity), entity.__dict__, lambda name: getattr(entity, name))
+
+def state_fields(cls: type, state: Dict[str, Any], get_field) -> Dict[str, Any]:
+    """
+    entity_fields() of an entity of class cls with instance attributes state (e.g. a copy of its
+    __dict__ taken earlier). get_field(name) returns the fields not in state (component store fields).
+    """
+    fields, defaults = entity_schema(cls)
+    result = {'x': state['x'], 'y': state['y']}  # Always written, the constructor needs them
+    for name, value in state.items():
+        if name not in result and not name.startswith('_') and name not in ('color', 'type'):
+            if not _same(value, defaults.get(name, _MISSING)):
+                result[name] = value
+    for name in fields:
+        if name not in result and name not in state:
+            value = get_field(name)
+            if not _same(value, defaults[name]):
+                result[name] = value
+    return result
+
+def build_entity(cls: type, fields: Dict[str, Any]):
+    """Inverse of entity_fields: fields left out are reset to the class default (on_spawn may have changed them)."""
+    entity = cls.from_dict(fields)
+    schema_fields, defaults = entity_schema(cls)
+    for name in schema_fields:
+        if name not in fields:
+            default = defaults[name]
+            if not _same(getattr(entity, name, _MISSING), default):
+                setattr(entity, name, default)
+    return entity
+
+# --- Files ---
+def encode_save(meta: Dict[str, Any], entities: List[Tuple[str, Dict[str, Any]]], compression: str = 'zlib') -> bytes:
+    """
+    meta: plain data (camera, singleton values). entities: (type string, entity_fields()) pairs.
+    Body layout: meta, type table, field-name table, entity count, then per entity:
+    type id, field count and (field id, value) pairs.
+    """
+    type_ids: Dict[str, int] = {}
+    field_ids: Dict[str, int] = {}
+    records = bytearray()
+    for type_name, fields in entities:
+        type_id = type_ids.setdefault(type_name, len(type_ids))
+        _write_varint(records, type_id)
+        _write_varint(records, len(fields))
+        for name, value in fields.items():
+            _write_varint(records, field_ids.setdefault(name, len(field_ids)))
+            write_value(records, value)
+    body = bytearray()
+    write_value(body, meta)
+    write_value(body, list(type_ids))
+    write_value(body, list(field_ids))
+    _write_varint(body, len(entities))
+    body += records
+    compression_id = COMPRESSION_IDS[compression]
+    if compression_id == COMPRESSION_ZLIB:
+        body = zlib.compress(bytes(body), 6)
+    elif compression_id == COMPRESSION_LZMA:
+        body = lzma.compress(bytes(body))
+    return HEADER.pack(MAGIC, FORMAT_VERSION, compression_id) + bytes(body)
+
+def is_binary_save(data: bytes) -> bool:
+    return data[:len(MAGIC)] == MAGIC
+
+class SaveReader:
+    """
+    Decodes a save file lazily: the header, meta and tables up front, entities while iterating
+    entities(), so a loader can place them in chunks. Raises SaveFormatError for foreign, newer or corrupt files.
+    """
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size or not is_binary_save(data):
+            raise SaveFormatError("Not a save file")
+        _, version, compression_id = HEADER.unpack_from(data)
+        if version > FORMAT_VERSION:
+            raise SaveFormatError(f"Save format version {version} is newer than supported ({FORMAT_VERSION})")
+        body = data[HEADER.size:]
+        try:
+            if compression_id == COMPRESSION_ZLIB:
+                body = zlib.decompress(body)
+            elif compression_id == COMPRESSION_LZMA:
+                body = lzma.decompress(body)
+            elif compression_id != COMPRESSION_NONE:
+                raise SaveFormatError(f"Unknown compression {compression_id}")
+            self.meta, pos = read_value(body, 0)
+            self._type_table, pos = read_value(body, pos)
+            self._field_table, pos = read_value(body, pos)
+            self.count, self._pos = _read_varint(body, pos)
+        except (IndexError, zlib.error, lzma.LZMAError, UnicodeDecodeError) as e:
+            raise SaveFormatError(f"Corrupt save file: {e}") from e
+        self._body = body
+
+    def entities(self, type_map: Dict[str, type]):
+        """Yields the saved entities in order, rebuilt with build_entity()."""
+        body, pos = self._body, self._pos
+        type_table, field_table = self._type_table, self._field_table
+        try:
+            for _ in range(self.count):
+                type_id, pos = _read_varint(body, pos)
+                n_fields, pos = _read_varint(body, pos)
+                fields = {}
+                for _ in range(n_fields):
+                    field_id, pos = _read_varint(body, pos)
+                    fields[field_table[field_id]], pos = read_value(body, pos)
+                cls = type_map.get(type_table[type_id])
+                if cls is None:
+                    print(f"Warning: unknown entity type '{type_table[type_id]}' in save file, skipped.")
+                    continue
+                yield build_entity(cls, fields)
+        except (IndexError, UnicodeDecodeError) as e:
+            raise SaveFormatError(f"Corrupt save file: {e}") from e
+
+def decode_save(data: bytes, type_map: Dict[str, type]) -> Tuple[Dict[str, Any], List[Any]]:
+    """Returns (meta, entities). Raises SaveFormatError for foreign, newer or corrupt files."""
+    reader = SaveReader(data)
+    return reader.meta, list(reader.entities(type_map))
+
+# --- Journal ---
+# Append-only log of changes made after a snapshot: a header naming the snapshot generation it
+# applies to, then length-prefixed records. A record cut short by a crash ends the journal.
+JOURNAL_MAGIC = b'OFJRNL'
+JOURNAL_HEADER = struct.Struct('<6sHI')  # magic, format version, snapshot generation
+
+def encode_journal_header(generation: int) -> bytes:
+    return JOURNAL_HEADER.pack(JOURNAL_MAGIC, FORMAT_VERSION, generation)
+
+def encode_journal_record(record: List[Any]) -> bytes:
+    body = bytearray()
+    write_value(body, record)
+    out = bytearray()
+    _write_varint(out, len(body))
+    return bytes(out + body)
+
+def place_record(entity, type_names: Dict[type, str]) -> List[Any]:
+    return ['place', type_names[type(entity)], entity_fields(entity)]
+
+def decode_journal(data: bytes) -> Tuple[int, List[List[Any]]]:
+    """Returns (snapshot generation, records). Raises SaveFormatError if the header is not a journal's."""
+    if len(data) < JOURNAL_HEADER.size or data[:len(JOURNAL_MAGIC)] != JOURNAL_MAGIC:
+        raise SaveFormatError("Not a journal file")
+    _, version, generation = JOURNAL_HEADER.unpack_from(data)
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Journal format version {version} is newer than supported ({FORMAT_VERSION})")
+    records = []
+    pos = JOURNAL_HEADER.size
+    try:
+        while pos < len(data):
+            length, body_start = _read_varint(data, pos)
+            if body_start + length > len(data):
+                break  # Torn write at the end
+            record, _ = read_value(data[body_start:body_start + length], 0)
+            records.append(record)
+            pos = body_start + length
+    except (IndexError, UnicodeDecodeError, SaveFormatError) as e:
+        print(f"Warning: journal is corrupt after {len(records)} records ({e}), ignoring the rest.")
+    return generation, records
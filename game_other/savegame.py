@@ -1,20 +1,33 @@
 # Standard library imports
 import os
 import inspect
-from typing import Optional, Tuple, List, Any
+from typing import Callable, Optional, Tuple, List, Any
 
 # Local imports
 from game_core.entity_state import EntityStateList
 from game_core.entity_definitions import to_type_from_classname, BaseEntity
 from game_core import entity_definitions
-import dill
+from game_core.entity_registry import entity_registry
 from game_other.feature_toggle import ALLOW_SAVE_AND_LOAD
+from game_other.trace import trace_recorder
+from game_other.save_format import encode_save, state_fields, SaveReader, SaveFormatError
 
 # Constants
 SAVE_FOLDER = '_save'
-SAVE_FILE = 'save.pkl'
+SAVE_FILE = 'save.sav'
+LEGACY_SAVE_FILE = 'save.pkl'  # dill pickle written before the binary format, still read once if no SAVE_FILE exists
+SAVE_COMPRESSION = 'zlib'  # 'none', 'zlib' or 'lzma' (smallest, slowest)
+LOAD_CHUNK_SIZE = 250  # Entities placed between two progress reports
 DEFAULT_CELL_SIZE = 50
 DEFAULT_CAMERA_OFFSET = [0, 0]
+# Selected global singleton (GameState) variables that are saved
+SINGLETON_VARS = [
+    'game_time_seconds', 'game_time_days', 'total_money', 'total_upkeep', 'total_power_drain',
+    'total_breaker_strength', 'total_employees', 'total_risky_entities',
+    'total_broken_entities', 'is_internet_online', 'is_wifi_online', 'is_nas_online',
+    'render_progress_current', 'render_progress_goal', 'total_shots_goal',
+    'total_shots_finished', 'jobs_finished', 'job_id'
+]
 
 # Build a type map from all subclasses of BaseEntity using class name
 # This allows automatic mapping of entity type strings to their classes for save/load
@@ -27,6 +40,7 @@ def _build_entity_type_map() -> dict:
     }
 
 ENTITY_TYPE_MAP = _build_entity_type_map()
+ENTITY_TYPE_NAMES = {cls: type_name for type_name, cls in ENTITY_TYPE_MAP.items()}
 
 def ensure_save_folder() -> str:
     """Ensure the save folder exists and return its path."""
@@ -38,55 +52,155 @@ def ensure_save_folder() -> str:
 def save_game(
     entity_states: EntityStateList,
     camera_offset: Optional[List[int]] = None,
-    cell_size: Optional[int] = None
+    cell_size: Optional[int] = None,
+    wait: bool = False
 ) -> None:
     if not ALLOW_SAVE_AND_LOAD:
         print("Save/load is disabled by feature toggle.")
         return
-    """Save the current game state to disk, including camera position, zoom level, and selected global singleton variables."""
+    """
+    Save the current game state to disk, including camera position, zoom level, and selected global singleton variables.
+    Only the snapshot is taken on the calling thread, encoding and writing run on the save writer thread
+    (wait=True blocks until the file is on disk).
+    """
+    from game_other.autosave import autosave
+    with trace_recorder.span('save_game', 'io', {'entities': len(entity_states.entities)}):
+        snapshot = take_snapshot(entity_states, camera_offset, cell_size)
+    autosave.submit_snapshot(snapshot)
+    if wait:
+        autosave.wait()
+
+class SaveSnapshot:
+    """Copy of everything save_game writes, taken on the main thread and immutable afterwards."""
+    __slots__ = ('meta', 'entities', 'columns', 'generation')
+
+    def __init__(self, meta, entities, columns, generation):
+        self.meta = meta
+        self.entities = entities  # [(entity class, copy of its __dict__)]
+        self.columns = columns  # Copies of the component store columns, indexed by the entities' _slot
+        self.generation = generation
+
+def take_snapshot(
+    entity_states: EntityStateList,
+    camera_offset: Optional[List[int]] = None,
+    cell_size: Optional[int] = None
+) -> SaveSnapshot:
+    """
+    Copies the entities' instance attributes (plain values) and the component store columns,
+    which costs a dict copy per entity instead of building its save fields.
+    """
     from game_core.game_state import GameState
-    save_folder = ensure_save_folder()
-    save_path = os.path.join(save_folder, SAVE_FILE)
+    from game_core.components import component_store
     gs = GameState()
-    # Select which singleton variables to save
-    singleton_vars = [
-        'game_time_seconds', 'game_time_days', 'total_money', 'total_upkeep', 'total_power_drain',
-        'total_breaker_strength', 'total_employees', 'total_risky_entities',
-        'total_broken_entities', 'is_internet_online', 'is_wifi_online', 'is_nas_online',
-        'render_progress_current', 'render_progress_goal', 'total_shots_goal',
-        'total_shots_finished', 'jobs_finished', 'job_id'
-    ]
-    singleton_data = {k: getattr(gs, k, None) for k in singleton_vars}
-    save_data = {
-        'entities': entity_states.to_list(),
-        'camera_offset': camera_offset if camera_offset is not None else DEFAULT_CAMERA_OFFSET,
+    singleton_data = {k: getattr(gs, k, None) for k in SINGLETON_VARS}
+    # Random id of this snapshot, the autosave journal written after it carries the same id
+    journal_generation = int.from_bytes(os.urandom(4), 'little')
+    meta = {
+        'camera_offset': list(camera_offset if camera_offset is not None else DEFAULT_CAMERA_OFFSET),
         'cell_size': cell_size if cell_size is not None else DEFAULT_CELL_SIZE,
-        'singleton': singleton_data
+        'singleton': singleton_data,
+        'journal_generation': journal_generation
     }
+    entities = []
+    for entity_state in entity_states.entities:
+        entity = entity_state.entity
+        state = entity.__dict__.copy()
+        if state.get('_detached') is not None:
+            state['_detached'] = dict(state['_detached'])  # Not placed, the component values live here
+        entities.append((type(entity), state))
+    return SaveSnapshot(meta, entities, component_store.copy_columns(), journal_generation)
+
+def write_snapshot(snapshot: SaveSnapshot) -> bool:
+    """Encode a snapshot and replace the save file with it atomically. Runs on the save writer thread."""
+    from game_core.components import column_value
+    save_path = os.path.join(ensure_save_folder(), SAVE_FILE)
+    columns = snapshot.columns
     try:
-        with open(save_path, 'wb') as save_file:
-            dill.dump(save_data, save_file)
+        with trace_recorder.span('save_game/write', 'io', {'entities': len(snapshot.entities)}):
+            entities = []
+            for cls, state in snapshot.entities:
+                slot = state.get('_slot', -1)
+                def get_field(name):
+                    if name not in columns:
+                        return getattr(cls, name)  # Class attribute the entity did not override
+                    if slot < 0:
+                        return state['_detached'][name]
+                    return column_value(name, columns[name], slot)
+                entities.append((ENTITY_TYPE_NAMES[cls], state_fields(cls, state, get_field)))
+            data = encode_save(snapshot.meta, entities, SAVE_COMPRESSION)
+            # Write next to the save file, then rename over it: a crash leaves either the old or the new file
+            temp_path = save_path + '.tmp'
+            with open(temp_path, 'wb') as save_file:
+                save_file.write(data)
+                save_file.flush()
+                os.fsync(save_file.fileno())
+            os.replace(temp_path, save_path)
+            _fsync_folder(os.path.dirname(save_path))
         print(f"Game saved to {save_path}")
+        return True
     except Exception as e:
         print(f"Error saving game: {e}")
+        return False
+
+def _fsync_folder(folder):
+    # Makes the rename durable on POSIX, directories cannot be opened on Windows
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 def load_game(
-    grid: List[List[Any]]
+    grid: List[List[Any]],
+    progress: Optional[Callable[[int, int], None]] = None
 ) -> Tuple[EntityStateList, List[int], int]:
     if not ALLOW_SAVE_AND_LOAD:
         print("Save/load is disabled by feature toggle.")
         return EntityStateList(), DEFAULT_CAMERA_OFFSET.copy(), DEFAULT_CELL_SIZE
-    """Load the game state from disk and populate the grid. Also restore selected global singleton variables."""
-    from game_core.game_state import GameState
+    """
+    Load the game state from disk and populate the grid. Also restore selected global singleton variables
+    and replay the autosave journal written after the snapshot.
+    Entities are decoded and placed in chunks, progress(loaded, total) is called after each chunk.
+    """
+    from game_other.autosave import autosave
     save_folder = ensure_save_folder()
     save_path = os.path.join(save_folder, SAVE_FILE)
     if not os.path.exists(save_path):
+        legacy_path = os.path.join(save_folder, LEGACY_SAVE_FILE)
+        if os.path.exists(legacy_path):
+            return _load_legacy_game(grid, legacy_path, progress)
         print("No save file found. Starting with an empty state.")
         return EntityStateList(), DEFAULT_CAMERA_OFFSET.copy(), DEFAULT_CELL_SIZE
 
+    entity_states = EntityStateList()
+    try:
+        with trace_recorder.span('load_game', 'io'):
+            with open(save_path, 'rb') as save_file:
+                reader = SaveReader(save_file.read())
+            _restore_singletons(reader.meta)
+            _place_loaded_entities(grid, entity_states, reader.entities(ENTITY_TYPE_MAP), reader.count, progress)
+    except (OSError, SaveFormatError) as e:
+        print(f"Error loading save file: {e}")
+        _unplace_loaded_entities(grid, entity_states)
+        return EntityStateList(), DEFAULT_CAMERA_OFFSET.copy(), DEFAULT_CELL_SIZE
+
+    meta = reader.meta
+    autosave.replay_journal(grid, entity_states, meta.get('journal_generation'))
+    print(f"Game loaded from {save_path}")
+    return entity_states, meta.get('camera_offset', DEFAULT_CAMERA_OFFSET.copy()), meta.get('cell_size', DEFAULT_CELL_SIZE)
+
+def _load_legacy_game(grid, save_path, progress=None):
+    # Pickles can run arbitrary code when loaded, only read the file this game wrote before the binary format
+    import dill
     try:
-        with open(save_path, 'rb') as save_file:
-            data = dill.load(save_file)
+        with trace_recorder.span('load_game', 'io'):
+            with open(save_path, 'rb') as save_file:
+                data = dill.load(save_file)
     except Exception as e:
         print(f"Error loading save file: {e}")
         return EntityStateList(), DEFAULT_CAMERA_OFFSET.copy(), DEFAULT_CELL_SIZE
@@ -98,19 +212,62 @@ def load_game(
     entities_data = data['entities'] if 'entities' in data else data
     camera_offset = data.get('camera_offset', DEFAULT_CAMERA_OFFSET.copy())
     cell_size = data.get('cell_size', DEFAULT_CELL_SIZE)
-    # Restore singleton variables if present
+    _restore_singletons(data)
+    entity_states = EntityStateList()
+    _place_loaded_entities(grid, entity_states, _legacy_entities(entities_data), len(entities_data), progress)
+    print(f"Game loaded from legacy save {save_path}, it is replaced by {SAVE_FILE} on the next save")
+    return entity_states, camera_offset, cell_size
+
+def _legacy_entities(entities_data):
+    for data in entities_data:
+        entity_class = ENTITY_TYPE_MAP.get(data.get('type'))
+        if entity_class is None:
+            print(f"Warning: unknown entity type '{data.get('type')}' in save file, skipped.")
+            continue
+        yield entity_class.from_dict(data)
+
+def _restore_singletons(data):
+    """Restore the saved singleton variables, if present."""
+    from game_core.game_state import GameState
     singleton_data = data.get('singleton', {})
     gs = GameState()
     for k, v in singleton_data.items():
         if hasattr(gs, k):
             setattr(gs, k, v)
-    entity_states = EntityStateList.from_list(entities_data, ENTITY_TYPE_MAP)
+
+def _place_loaded_entities(grid, entity_states, entities, total, progress=None):
+    """
+    Place entities as they are decoded, in one pass: every tile of their footprint, the entity registry
+    (and with it the spatial index, neighbor tables and totals) and entity_states.
+    """
+    grid_height, grid_width = len(grid), len(grid[0])
+    loaded = 0
+    with trace_recorder.span('load_game/restore_entities', 'io', {'entities': total}):
+        for entity in entities:
+            x, y = entity.x, entity.y
+            width = getattr(entity, 'width', 1)
+            height = getattr(entity, 'height', 1)
+            if 0 <= x and x + width <= grid_width and 0 <= y and y + height <= grid_height:
+                for dy in range(height):
+                    row = grid[y + dy]
+                    for dx in range(width):
+                        row[x + dx] = entity
+                entity_registry.add(entity)
+                entity_states.add_entity(entity)
+            else:
+                print(f"Warning: Entity at ({x}, {y}) out of grid bounds. Skipping grid placement.")
+            loaded += 1
+            if progress is not None and loaded % LOAD_CHUNK_SIZE == 0:
+                progress(loaded, total)
+    if progress is not None:
+        progress(total, total)
+
+def _unplace_loaded_entities(grid, entity_states):
+    # A save that turns out corrupt halfway is not loaded at all
     for entity_state in entity_states.entities:
-        entity = entity_state.entity  # Use the real entity object
-        y, x = entity.y, entity.x
-        if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
-            grid[y][x] = entity
-        else:
-            print(f"Warning: Entity at ({x}, {y}) out of grid bounds. Skipping grid placement.")
-    print(f"Game loaded from {save_path}")
-    return entity_states, camera_offset, cell_size
+        entity = entity_state.entity
+        for dy in range(getattr(entity, 'height', 1)):
+            for dx in range(getattr(entity, 'width', 1)):
+                grid[entity.y + dy][entity.x + dx] = None
+        entity_registry.remove(entity)
+    entity_states.clear()
@@ -0,0 +1,63 @@
+# game_other/text_cache.py
+# Shared LRU cache of rendered text: panels redraw the same labels and values every frame,
+# text_cache.render() only calls font.render() for strings not drawn recently.
+
+from collections import OrderedDict
+
+from game_other.profiler import profiler
+
+TEXT_CACHE_MAX = 1024  # Rendered strings kept, least recently used are dropped first
+
+class TextCache:
+    """
+    Surfaces are keyed by (font object, text, antialias, color, background). Fonts are the shared
+    ones of the asset manager, so the same font and size is the same key everywhere; a font's
+    style (bold, underline...) must not change after its first render.
+    Surfaces handed out are shared: blit them, do not draw on them.
+    Hits and misses are counted per frame in the profiler ('text_cache_hit', 'text_cache_miss').
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._initialized = True
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments and result as font.render(), from the cache when possible."""
+        if not isinstance(color, tuple):
+            color = tuple(color)  # pygame.Color is not hashable
+        if background is not None and not isinstance(background, tuple):
+            background = tuple(background)
+        key = (font, text, antialias, color, background)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            profiler.count('text_cache_hit')
+            return surf
+        surf = font.render(text, antialias, color, background)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > TEXT_CACHE_MAX:
+            self._surfaces.popitem(last=False)
+        self.misses += 1
+        profiler.count('text_cache_miss')
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+# Singleton accessor
+text_cache = TextCache()
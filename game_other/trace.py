@@ -0,0 +1,117 @@
+# game_other/trace.py
+# Opt-in ring buffer of timing events, dumped in the Chrome trace_event JSON format
+# (open the file in chrome://tracing or ui.perfetto.dev).
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from game_other.feature_toggle import ALLOW_FRAME_TRACE
+from game_other.logger import ensure_output_folder
+
+TRACE_BUFFER_EVENTS = 200000  # About a minute of frames with all phases at 60 FPS
+
+class TraceRecorder:
+    """
+    Keeps the last TRACE_BUFFER_EVENTS trace events. Spans are stored as complete ('X') events
+    and one-off happenings as instant ('i') events, with perf_counter_ns timestamps.
+    Recording is off unless enabled (ALLOW_FRAME_TRACE or enable()); while off every call is a no-op.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TraceRecorder, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.enabled = False
+        self.events = deque(maxlen=TRACE_BUFFER_EVENTS)
+        self._initialized = True
+        if ALLOW_FRAME_TRACE:
+            self.enable()
+
+    def enable(self):
+        from game_other.profiler import profiler
+        self.enabled = True
+        profiler.span_sink = self.complete  # Every profiler scope becomes a span
+
+    def disable(self):
+        from game_other.profiler import profiler
+        self.enabled = False
+        if profiler.span_sink == self.complete:
+            profiler.span_sink = None
+
+    def clear(self):
+        self.events.clear()
+
+    def complete(self, name, category, start_ns, duration_ns, args=None):
+        """Record a span that started at start_ns (time.perf_counter_ns) and lasted duration_ns."""
+        if self.enabled:
+            self.events.append(('X', name, category, start_ns, duration_ns, threading.get_ident(), args))
+
+    def instant(self, name, category, args=None):
+        if self.enabled:
+            self.events.append(('i', name, category, time.perf_counter_ns(), 0, threading.get_ident(), args))
+
+    def span(self, name, category, args=None):
+        """Context manager recording its body as a span."""
+        return _TraceSpan(self, name, category, args)
+
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        main_thread = threading.main_thread().ident
+        trace_events = []
+        for phase, name, category, start_ns, duration_ns, tid, args in tuple(self.events):
+            event = {'name': name, 'cat': category, 'ph': phase, 'ts': start_ns / 1000.0, 'pid': pid, 'tid': tid}
+            if phase == 'X':
+                event['dur'] = duration_ns / 1000.0
+            else:
+                event['s'] = 't'  # Instant scoped to its thread
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+        # Name the threads so the viewer shows "main" instead of a bare thread id
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for tid in {e['tid'] for e in trace_events}:
+            thread_name = 'main' if tid == main_thread else names.get(tid, f'thread {tid}')
+            trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path=None):
+        """Write the buffer as Chrome trace JSON (default: _output/trace_<timestamp>.json). Returns the path."""
+        if path is None:
+            path = os.path.join(ensure_output_folder(), time.strftime('trace_%Y%m%d_%H%M%S.json'))
+        try:
+            with open(path, 'w') as trace_file:
+                json.dump(self.to_chrome_trace(), trace_file)
+        except Exception as e:
+            print(f"Error writing trace: {e}")
+            return None
+        print(f"Trace with {len(self.events)} events written to {path}")
+        return path
+
+class _TraceSpan:
+    __slots__ = ('recorder', 'name', 'category', 'args', 'start')
+
+    def __init__(self, recorder, name, category, args):
+        self.recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.complete(self.name, self.category, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+# Singleton accessor
+trace_recorder = TraceRecorder()
@@ -1,9 +1,12 @@
 import pygame
 import time
-import random
+from game_core.rng import rng
 from game_core.entity_definitions import BaseEntity, ComputerEntity, ProjectManager, Artist
 from game_core.config import *
 from game_core.game_state import GameState
+from game_other.text_cache import text_cache
+
+_rng = rng.stream('alerts')
 
 # --- Configurable constants ---
 INFO_PANEL_WIDTH_FRAC = 0.15  # Fraction of screen width for info panel
@@ -73,7 +76,7 @@ def check_alerts(grid, screen_width):
         raise ValueError("screen_width must be provided to check_alerts for correct alert animation.")
     panel_width = get_alert_panel_width(screen_width)
     if now - _last_alert_time >= ALERT_INTERVAL:
-        cond, msg, alert_type = random.choice(ALERT_CONDITIONS)
+        cond, msg, alert_type = _rng.choice(ALERT_CONDITIONS)
         if cond(grid):
             if not _visible_alerts or _visible_alerts[0][0] != msg:
                 # Insert new alert at the top, with y_offset and x_offset for animation
@@ -115,7 +118,7 @@ def draw_alert_panel(surface, font, screen_width, screen_height):
         x = panel_x + x_offset
         alert_col = ALERT_TYPE_COLORS.get(alert_type, STATUS_MID_COL)
         if font is not None:
-            text = font.render(alert, True, (255, 255, 255))
+            text = text_cache.render(font, alert, True, (255, 255, 255))
             text_rect = text.get_rect()
             # Add padding to the text background
             padding_x = 32
@@ -4,6 +4,8 @@ import threading
 import time
 import random
 from game_core.config import resource_path
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 # Cache for the baked arrow pointer surface
 _baked_arrow_pointer = None
@@ -15,6 +17,7 @@ ARROW_LABEL_COLOR = (255, 255, 0)
 ARROW_LABEL_FONT_SIZE = 40
 
 ARROW_IMAGE_PATH = resource_path("data/graphics/arrow.png")
+asset_manager.register(ARROW_IMAGE_PATH, sizes=[(120, 120)])
 
 # Shake effect parameters
 SHAKE_AMPLITUDE = 2  # pixels
@@ -43,24 +46,21 @@ def bake_arrow_pointer():
         arrow_rng.randint(-SHAKE_AMPLITUDE, SHAKE_AMPLITUDE)
     )
     # Draw arrow image if available
-    try:
-        arrow_img = pygame.image.load(ARROW_IMAGE_PATH).convert_alpha()
-        arrow_img = pygame.transform.smoothscale(arrow_img, (120, 120))
+    arrow_img = asset_manager.scaled(ARROW_IMAGE_PATH, 120, 120)
+    if arrow_img is not None:  # If image not found, skip
         img_rect = arrow_img.get_rect(center=(ARROW_CANVAS_WIDTH // 2 + arrow_offset[0], ARROW_CANVAS_HEIGHT // 2 - 40 + arrow_offset[1]))
         surface.blit(arrow_img, img_rect)
-    except Exception:
-        pass  # If image not found, skip
-    label_font = pygame.font.Font(None, ARROW_LABEL_FONT_SIZE)
+    label_font = asset_manager.font(ARROW_LABEL_FONT_SIZE, name=None)
     # Row 1
     row1 = "THIS IS YOUR PROJECT"
-    row1_surf = label_font.render(row1, True, ARROW_LABEL_COLOR)
+    row1_surf = text_cache.render(label_font, row1, True, ARROW_LABEL_COLOR)
     # Row 2
     row2 = "FINISH IT FAST"
-    row2_surf = label_font.render(row2, True, ARROW_LABEL_COLOR)
+    row2_surf = text_cache.render(label_font, row2, True, ARROW_LABEL_COLOR)
     # Row 3
     row3 = "(click the panel to unfold)"
-    row3_font = pygame.font.Font(None, 28)
-    row3_surf = row3_font.render(row3, True, ARROW_LABEL_COLOR)
+    row3_font = asset_manager.font(28, name=None)
+    row3_surf = text_cache.render(row3_font, row3, True, ARROW_LABEL_COLOR)
     # Use cached shake offsets for text
     row1_offset = _last_shake_offsets[0]
     row2_offset = _last_shake_offsets[1]
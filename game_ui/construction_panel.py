@@ -5,6 +5,8 @@ from game_core import entity_definitions
 from game_core.entity_base import *
 from game_core.entity_definitions import *
 from game_core.config import BASE_COL, UI_BG1_COL, adjust_color, FONT1, CURRENCY_SYMBOL
+from game_other.asset_manager import asset_manager, entity_icon_paths
+from game_other.text_cache import text_cache
 
 # --- Constants ---
 BG_COLOR = UI_BG1_COL
@@ -175,31 +177,30 @@ class EntityButton:
             pygame.draw.rect(surface, self.BG_COL_SELECTED, self.rect, border_radius=self.ROUNDING)
         # Draw icon
         if self.icon_path:
-            try:
-                icon_surf = pygame.image.load(self.icon_path).convert_alpha()
-                icon_surf = pygame.transform.smoothscale(icon_surf, (self.icon_width, self.icon_height))
+            icon_surf = asset_manager.scaled(self.icon_path, self.icon_width, self.icon_height)
+            if icon_surf is not None:
                 icon_rect = icon_surf.get_rect(center=(self.rect.centerx, self.rect.top + self.icon_top_margin + self.icon_height//2))
                 surface.blit(icon_surf, icon_rect)
-            except Exception as e:
-                print(f"Error loading icon {self.icon_path}: {e}")
         # Draw price/rental with fixed font size
-        entity_font = pygame.font.Font(FONT1, self.FONT_SIZE)
+        entity_font = asset_manager.font(self.FONT_SIZE)
         col = text_color if text_color is not None else self.TEXT_COL
         if self.purchase_cost == 0:
             upkeep = getattr(self.entity_class, 'upkeep', None)
             if upkeep is not None:
-                upkeep_surf = entity_font.render(f"-{CURRENCY_SYMBOL}{upkeep} / mo", True, col)
+                upkeep_surf = text_cache.render(entity_font, f"-{CURRENCY_SYMBOL}{upkeep} / mo", True, col)
                 upkeep_rect = upkeep_surf.get_rect(center=(self.rect.centerx, self.rect.bottom + 20 - self.LABEL_BOTTOM_MARGIN))
                 surface.blit(upkeep_surf, upkeep_rect)
             else:
-                cost_surf = entity_font.render("(monthly)", True, col)
+                cost_surf = text_cache.render(entity_font, "(monthly)", True, col)
                 cost_rect = cost_surf.get_rect(center=(self.rect.centerx, self.rect.bottom + 20 - self.LABEL_BOTTOM_MARGIN))
                 surface.blit(cost_surf, cost_rect)
         elif self.purchase_cost not in (None, 0):
-            cost_surf = entity_font.render(f"{CURRENCY_SYMBOL}{self.purchase_cost}", True, col)
+            cost_surf = text_cache.render(entity_font, f"{CURRENCY_SYMBOL}{self.purchase_cost}", True, col)
             cost_rect = cost_surf.get_rect(center=(self.rect.centerx, self.rect.bottom + 20 - self.LABEL_BOTTOM_MARGIN))
             surface.blit(cost_surf, cost_rect)
 
+asset_manager.register(*entity_icon_paths(), sizes=[(EntityButton.DEFAULT_ICON_WIDTH, EntityButton.DEFAULT_ICON_HEIGHT)])
+
 class Background:
     DEFAULT_COLOR = adjust_color(BASE_COL, white_factor=0.0, exposure=1)
     DEFAULT_WIDTH = EntityButton.DEFAULT_WIDTH * ENTITY_BUTTON_COUNT + ENTITY_BUTTON_COUNT * BUTTON_SPACING + 40  # Panel width matches entity button count
@@ -248,7 +249,7 @@ class Background:
 def draw_button(surface, rect, color, label=None, font=None, text_color=TEXT_COLOR):
     pygame.draw.rect(surface, color, rect)
     if label and font:
-        text_surf = font.render(label, True, text_color)
+        text_surf = text_cache.render(font, label, True, text_color)
         text_rect = text_surf.get_rect(center=rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -277,13 +278,10 @@ def get_entity_labels_icons_costs(entity_classes, num_buttons):
 def draw_icon(surface, icon_path, btn_rect, icon_width, icon_height, icon_top_margin):
     if not icon_path:
         return
-    try:
-        icon_surf = pygame.image.load(icon_path).convert_alpha()
-        icon_surf = pygame.transform.smoothscale(icon_surf, (icon_width, icon_height))
+    icon_surf = asset_manager.scaled(icon_path, icon_width, icon_height)
+    if icon_surf is not None:
         icon_rect = icon_surf.get_rect(center=(btn_rect.centerx, btn_rect.top + icon_top_margin + icon_height//2))
         surface.blit(icon_surf, icon_rect)
-    except Exception as e:
-        print(f"Error loading icon {icon_path}: {e}")
 
 _baked_panel_cache = {
     'surface': None,
@@ -293,6 +291,13 @@ _baked_panel_cache = {
     'size': None,
 }
 
+def construction_panel_rect(surface, extend_below=0):
+    # Same placement as draw_construction_panel
+    background = Background(extend_below=extend_below)
+    x = (surface.get_width() - background.width) // 2
+    y = int(surface.get_height() * (1 - ONSCREEN_BOTTOM_MARGIN) - background.height)
+    return pygame.Rect(x, y, background.width, background.height)
+
 def draw_construction_panel(surface, selected_section=0, selected_item=None, font=None, x=None, y=None, width=None, height=100, number_of_entity_buttons=ENTITY_BUTTON_COUNT, extend_below=0):
     """
     Draws a new construction panel with two rows:
@@ -338,7 +343,7 @@ def draw_construction_panel(surface, selected_section=0, selected_item=None, fon
         btn_rect = pygame.Rect(section_btns_x_offset + i * section_btn_w + 2, SECTION_BUTTONS_TOP_MARGIN, section_btn_w - 4, section_btn_h - 4)
         selected = (i == selected_section)
         color = SectionButton.BG_COL_SELECTED if selected else SectionButton.BG_COL
-        section_font = pygame.font.Font(FONT1, SectionButton.FONT_SIZE)
+        section_font = asset_manager.font(SectionButton.FONT_SIZE)
         draw_button(panel_surf, btn_rect, color, label, section_font)
         section_buttons.append(SectionButton(btn_rect.move(x, y), label, selected, height=section_btn_h - 4, width=btn_rect.width))
 
@@ -371,7 +376,7 @@ def draw_construction_panel(surface, selected_section=0, selected_item=None, fon
             icon_height=EntityButton.DEFAULT_ICON_HEIGHT,
             icon_top_margin=EntityButton.DEFAULT_ICON_TOP_MARGIN,
         )
-        entity_font = pygame.font.Font(FONT1, EntityButton.FONT_SIZE)
+        entity_font = asset_manager.font(EntityButton.FONT_SIZE)
         entity_button.draw(panel_surf, entity_font)
         # For event handling, store the button rect relative to the main surface
         entity_buttons.append(EntityButton(
@@ -406,8 +411,8 @@ def draw_entity_hover_label(surface, entity_class, mouse_pos, font=None):
     if entity_class is None:
         return
     display_name = getattr(entity_class, 'display_name', entity_class.__name__)
-    font = pygame.font.Font(FONT1, 20)
-    text_surf = font.render(display_name, True, (255,255,255))
+    font = asset_manager.font(20)
+    text_surf = text_cache.render(font, display_name, True, (255,255,255))
     text_rect = text_surf.get_rect()
     # Expand the background rect more for padding
     bg_rect = text_rect.inflate(24, 14)  # Wider and taller for more padding
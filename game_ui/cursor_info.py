@@ -1,6 +1,8 @@
 import pygame
 from game_core.game_state import GameState
 from game_core.config import FONT1, CURRENCY_SYMBOL, CELL_SIZE_INNER
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
     
 class NameLabel:
     def __init__(self, display_name, font, pad_x=10, pad_y=6):
@@ -8,7 +10,7 @@ class NameLabel:
         self.font = font
         self.pad_x = pad_x
         self.pad_y = pad_y
-        self.surf = self.font.render(self.display_name, True, (255, 255, 255))
+        self.surf = text_cache.render(self.font, self.display_name, True, (255, 255, 255))
         self.width = self.surf.get_width()
         self.height = self.surf.get_height()
 
@@ -24,10 +26,10 @@ class DetailLabel:
         self.pad_y = pad_y
         # Use font_size if provided, otherwise default to 15
         if font_size is not None:
-            self.font = pygame.font.Font(FONT1, font_size)
+            self.font = asset_manager.font(font_size)
         else:
-            self.font = pygame.font.Font(FONT1, 15)
-        self.surf = self.font.render(f"{self.label}{self.value}", True, self.color)
+            self.font = asset_manager.font(15)
+        self.surf = text_cache.render(self.font, f"{self.label}{self.value}", True, self.color)
         self.width = self.surf.get_width()
         self.height = self.surf.get_height()
 
@@ -46,7 +48,7 @@ class EntityInfo:
         self.display_name = getattr(entity, 'display_name', type(entity).__name__)
         self.purchase_cost = getattr(entity, 'purchase_cost', None)
         # Always use FONT_SIZE for the name font size
-        self.font = pygame.font.Font(FONT1, self.FONT_SIZE)
+        self.font = asset_manager.font(self.FONT_SIZE)
         self.name = NameLabel(self.display_name, self.font)
         # Only show cost and money if purchase_cost > 0
         if isinstance(self.purchase_cost, (int, float)) and self.purchase_cost > 0:
@@ -87,7 +89,7 @@ class EntityInfo:
 def draw_cursor_construction_overlay(surface, selected_entity_type, camera_offset, cell_size, GRID_W, GRID_H, grid, pickup_offset=(0, 0)):
     entity_type = GameState().current_construction_class
     if not callable(entity_type): return
-    from game_core.entity_definitions import get_icon_surface
+    from game_core.entity_definitions import get_icon_surface, get_scaled_icon_surface
     from game_core.game_loop import can_place_entity  # Use the correct area-aware function
     mx, my = pygame.mouse.get_pos()
     mouse_gx, mouse_gy = int((mx - camera_offset[0]) // cell_size), int((my - camera_offset[1]) // cell_size)
@@ -104,7 +106,7 @@ def draw_cursor_construction_overlay(surface, selected_entity_type, camera_offse
         margin = (cell_size - CELL_SIZE_INNER)
         icon_w = cell_size * width - margin
         icon_h = cell_size * height - margin
-        icon_scaled = pygame.transform.smoothscale(icon, (int(icon_w), int(icon_h))).copy()
+        icon_scaled = get_scaled_icon_surface(icon_path, icon_w, icon_h, alpha=128)
         ix = gx * cell_size + camera_offset[0] + (cell_size * width - icon_w) // 2
         iy = gy * cell_size + camera_offset[1] + (cell_size * height - icon_h) // 2
         if not hasattr(draw_cursor_construction_overlay, 'last_cell'):
@@ -124,7 +126,6 @@ def draw_cursor_construction_overlay(surface, selected_entity_type, camera_offse
         rect = pygame.Surface((highlight_w, highlight_h), pygame.SRCALPHA)
         pygame.draw.rect(rect, color, rect.get_rect(), border_radius=4)
         surface.blit(rect, (highlight_x, highlight_y))
-        icon_scaled.fill((255,255,255,128), special_flags=pygame.BLEND_RGBA_MULT)
         surface.blit(icon_scaled, (ix, iy))
         EntityInfo(preview, cell_size).draw(surface, ix, iy)
 
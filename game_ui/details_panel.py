@@ -1,5 +1,7 @@
 import pygame
-from game_core.config import UI_BG1_COL
+from game_core.config import UI_BG1_COL, BASE_COL, adjust_color
+from game_other.asset_manager import asset_manager, entity_icon_paths
+from game_other.text_cache import text_cache
 
 MARGIN_FROM_TOP = 10  # Move all content down by this many pixels
 ROWS_SPACING = 10    # Space between rows (icon, name, person_name, status, attributes)
@@ -9,6 +11,7 @@ DETAILS_PANEL_HEIGHT = 160
 ROUNDING = 12  # px, for rounded corners
 BORDER_WIDTH = 3  # px, for border thickness
 ONSCREEN_TOP_MARGIN = 0.6  # Ratio for top margin placement of details panel (10% from top)
+PROPERTY_ICON_TINT = adjust_color(BASE_COL, white_factor=0.0, exposure=3)  # Color of the property row icons
 # --- Status message logic migrated from info_panel.py ---
 def draw_status_by_state(surface, font, hovered_entity, box_x, box_y, icon_size):
     """Draws a status message based on the entity's state."""
@@ -84,7 +87,7 @@ def _draw_status(surface, font, messages, color, entity, attr_name=None, box_x=0
             _draw_status._last_ok_message = random.choice(messages)
             _draw_status._last_hovered_entity_id = entity_id
         y_offset = 0  # Already positioned by y argument
-        msg_text = font.render(_draw_status._last_ok_message, True, color)
+        msg_text = text_cache.render(font, _draw_status._last_ok_message, True, color)
         msg_rect = msg_text.get_rect(topleft=(box_x, box_y + y_offset))
         surface.blit(msg_text, msg_rect)
 
@@ -104,22 +107,16 @@ class Header:
             icon_path = icon_path()
         else:
             icon_path = getattr(self.entity, '_icon', None)
-        icon_surf = None
-        if icon_path:
-            try:
-                icon_surf = pygame.image.load(icon_path).convert_alpha()
-                icon_surf = pygame.transform.smoothscale(icon_surf, (64, 64))
-                surface.blit(icon_surf, (self.x + 16, self.y + MARGIN_FROM_TOP + ROWS_SPACING))
-                self.icon_rect = pygame.Rect(self.x + 16, self.y + MARGIN_FROM_TOP + ROWS_SPACING, 64, 64)
-            except Exception:
-                self.icon_rect = None
+        icon_surf = asset_manager.scaled(icon_path, 64, 64) if icon_path else None
+        if icon_surf is not None:
+            surface.blit(icon_surf, (self.x + 16, self.y + MARGIN_FROM_TOP + ROWS_SPACING))
+            self.icon_rect = pygame.Rect(self.x + 16, self.y + MARGIN_FROM_TOP + ROWS_SPACING, 64, 64)
+        else:
+            self.icon_rect = None
         entity_name = getattr(self.entity, 'display_name', self.entity.__class__.__name__)
         if self.font:
-            try:
-                big_font = pygame.font.Font(self.font.get_name(), 32)
-            except Exception:
-                big_font = pygame.font.SysFont(None, 32)
-            name_surf = big_font.render(entity_name, True, TEXT_COL)
+            big_font = asset_manager.sys_font(32)
+            name_surf = text_cache.render(big_font, entity_name, True, TEXT_COL)
             name_rect = name_surf.get_rect(topleft=(self.x + 96, self.y + MARGIN_FROM_TOP + ROWS_SPACING))
             surface.blit(name_surf, name_rect)
             self.name_rect = name_rect
@@ -134,6 +131,8 @@ ENTITY_PROPERTY_CONFIG = [
     ("toilet_need", "Toilet need", lambda v: 'Desperate' if v >= 9 else 'Needs break' if v >= 5 else 'Fine', "data/graphics/details_panel/toilet.png"),
     # Add more as needed
 ]
+asset_manager.register(*(row[3] for row in ENTITY_PROPERTY_CONFIG if len(row) > 3))
+asset_manager.register(*entity_icon_paths(), sizes=[(64, 64)])  # Header icon
 
 class EntityPropertyRow:
     """Renders a single property row (icon + label header, then value on next line) for an entity."""
@@ -156,30 +155,16 @@ class EntityPropertyRow:
         value_y = self.y + 22  # Space for header
         # Draw icon and header
         if self.icon_path:
-            try:
-                icon_surf = pygame.image.load(self.icon_path).convert_alpha()
-                icon_surf = pygame.transform.smoothscale(icon_surf, (self.ICON_SIZE, self.ICON_SIZE))
-                from game_core.config import BASE_COL, adjust_color
-                tint_col = adjust_color(BASE_COL, white_factor=0.0, exposure=3)
-                # Use surfarray to apply color to RGB, keep alpha from icon
-                import numpy as np
-                arr_icon = pygame.surfarray.pixels3d(icon_surf)
-                arr_alpha = pygame.surfarray.pixels_alpha(icon_surf)
-                arr_icon[:, :, 0] = tint_col[0]
-                arr_icon[:, :, 1] = tint_col[1]
-                arr_icon[:, :, 2] = tint_col[2]
-                # No need to touch alpha, just blit
-                del arr_icon, arr_alpha
+            # Icon drawn in the header color, keeping its alpha
+            icon_surf = asset_manager.scaled(self.icon_path, self.ICON_SIZE, self.ICON_SIZE, tint=PROPERTY_ICON_TINT)
+            if icon_surf is not None:
                 surface.blit(icon_surf, (self.x, header_y + (35 - self.ICON_SIZE) // 2))
                 icon_offset = self.ICON_SIZE + 6
-            except Exception:
-                pass
         # Use adjusted color for header
-        from game_core.config import BASE_COL, adjust_color
         header_label = f"{self.display_label}:"
         header_font = self.font
         header_col = adjust_color(BASE_COL, white_factor=0.0, exposure=3)
-        header_surf = header_font.render(header_label, True, header_col)
+        header_surf = text_cache.render(header_font, header_label, True, header_col)
         surface.blit(header_surf, (self.x + icon_offset, header_y))
         # Draw value on next line, using the same font size as header
         if hasattr(self.entity, self.prop_name):
@@ -188,7 +173,7 @@ class EntityPropertyRow:
                 value_str = self.value_to_str(value)
             else:
                 value_str = str(value)
-            value_surf = self.font.render(value_str, True, TEXT_COL)
+            value_surf = text_cache.render(self.font, value_str, True, TEXT_COL)
             surface.blit(value_surf, (self.x + icon_offset, value_y))
             self.rect = pygame.Rect(self.x, self.y, max(header_surf.get_width(), value_surf.get_width()) + icon_offset, self.FIXED_ROW_HEIGHT)
         else:
@@ -1,6 +1,8 @@
 import pygame
 from game_core.config import BASE_COL, UI_BG1_COL, adjust_color
 from game_core.game_state import GameState
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 PANEL_WIDTH = 1320
 PANEL_HEIGHT = 35
@@ -11,6 +13,8 @@ BAR_BG_COLOR = (60, 60, 70)
 BORDER_RADIUS = 1
 BAR_EMPTY_COLOR = adjust_color(BASE_COL, white_factor=0, exposure=2)
 
+EXPERIENCE_PANEL_FIELDS = ('total_level', 'current_lvl_experience')  # GameState fields shown
+
 class ExperiencePanel:
     def __init__(self, level=1, current_exp=0, max_exp=100, progress=0.0, font=None):
         self.level = level
@@ -69,7 +73,7 @@ class TextOverlay:
         self.current_exp = current_exp
         self.max_exp = max_exp
         # Use the common font size
-        self.font = pygame.font.SysFont(None, self.FONT_SIZE)
+        self.font = asset_manager.sys_font(self.FONT_SIZE)
         self.x = x
         self.y = y
         self.width = width
@@ -85,7 +89,7 @@ class TextOverlay:
         except Exception:
             left_value = self.level
         left_text = f"Level {left_value}"
-        left_surf = self.font.render(left_text, True, (255, 255, 255))
+        left_surf = text_cache.render(self.font, left_text, True, (255, 255, 255))
         left_rect = left_surf.get_rect(midleft=(self.x + self.LEFT_MARGIN, text_y))
         # Middle: rank text based on level
         rank_names = [
@@ -99,12 +103,12 @@ class TextOverlay:
         ]
         rank_index = max(0, min(left_value - 1, len(rank_names) - 1))
         rank_text = rank_names[rank_index]
-        mid_surf = self.font.render(rank_text, True, (255, 255, 255))
+        mid_surf = text_cache.render(self.font, rank_text, True, (255, 255, 255))
         mid_rect = mid_surf.get_rect(center=(self.x + self.width // 2, text_y))
         # Right: XX %
         percent = int(100 * self.current_exp / self.max_exp) if self.max_exp > 0 else 0
         right_text = f"{percent} %"
-        right_surf = self.font.render(right_text, True, (255, 255, 255))
+        right_surf = text_cache.render(self.font, right_text, True, (255, 255, 255))
         right_rect = right_surf.get_rect(midright=(self.x + self.width - self.RIGHT_MARGIN, text_y))
         # Blit all
         surface.blit(left_surf, left_rect)
@@ -112,6 +116,9 @@ class TextOverlay:
         surface.blit(right_surf, right_rect)
 
 
+def experience_panel_rect(surface):
+    return pygame.Rect((surface.get_width() - PANEL_WIDTH) // 2, surface.get_height() - PANEL_HEIGHT, PANEL_WIDTH, PANEL_HEIGHT)
+
 def draw_experience_panel(surface, font=None):
     """
     Draws the experience panel (header and bar) using the ExperiencePanel and Header classes.
@@ -125,7 +132,7 @@ def draw_experience_panel(surface, font=None):
     current_lvl_exp = getattr(gs, 'current_lvl_experience', 0)
     progress = min(1.0, current_lvl_exp / max_exp) if max_exp > 0 else 0.0
     if font is None:
-        font = pygame.font.SysFont(None, 28)
+        font = asset_manager.sys_font(28)
     surf_w, surf_h = surface.get_width(), surface.get_height()
     x = (surf_w - PANEL_WIDTH) // 2
     y = surf_h - PANEL_HEIGHT  # Align to bottom edge
@@ -1,8 +1,9 @@
 import pygame
-from game_core.entity_definitions import get_icon_surface
+from game_other.asset_manager import asset_manager
 from collections import Counter
 from game_core.config import UI_BG1_COL, TEXT1_COL
 from game_ui.details_panel import ROWS_SPACING
+from game_other.text_cache import text_cache
 
 MARGIN_FROM_TOP = 10
 OVERVIEW_PANEL_WIDTH = 400
@@ -62,13 +63,12 @@ def draw_overview_panel(surface, font, x, y, width=OVERVIEW_PANEL_WIDTH, height=
                 icon_x = start_x + col * spacing_x
                 icon_y = start_y + row * spacing_y
                 icon_path = icon_paths.get(cls)
-                icon_surf = get_icon_surface(icon_path) if icon_path else None
+                icon_surf = asset_manager.scaled(icon_path, icon_size, icon_size) if icon_path else None
                 if icon_surf:
-                    icon_surf = pygame.transform.smoothscale(icon_surf, (icon_size, icon_size))
                     icon_rect = icon_surf.get_rect(topleft=(icon_x, icon_y))
                     surface.blit(icon_surf, icon_rect)
                 # Draw count in bottom right corner
-                count_text = font.render(str(count), True, (255, 255, 255))
+                count_text = text_cache.render(font, str(count), True, (255, 255, 255))
                 count_rect = count_text.get_rect(bottomright=(icon_x + icon_size - 2, icon_y + icon_size - 2))
                 bg_rect = count_rect.inflate(6, 4)
                 pygame.draw.rect(surface, (0, 0, 0), bg_rect)
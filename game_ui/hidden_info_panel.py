@@ -1,5 +1,7 @@
 import pygame
 import math
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 # hidden_info_panel.py (renamed from entity_state_panel.py)
 # Helper function to display the contents of entity_states in the top right corner for debugging.
@@ -19,7 +21,7 @@ def draw_hidden_info_panel(surface, font=None, hovered_entity=None, x_offset=5,
     if not ENTITY_PANEL_VISIBLE:
         return
     if font is None:
-        font = pygame.font.SysFont(None, font_size)
+        font = asset_manager.sys_font(font_size)
     entity_lines = []
     # Show hovered entity info
     if hovered_entity is not None:
@@ -63,7 +65,7 @@ def draw_hidden_info_panel(surface, font=None, hovered_entity=None, x_offset=5,
         max_line_width = 0
         total_height = 0
         for line in reversed(col_lines):
-            img = font.render(line, True, (200, 220, 255))
+            img = text_cache.render(font, line, True, (200, 220, 255))
             rendered_imgs.append(img)
             max_line_width = max(max_line_width, img.get_width())
             total_height += img.get_height() + 1
@@ -0,0 +1,36 @@
+# loading_screen.py
+# Progress bar shown while a save file is loaded, drawn from savegame.load_game's progress callback.
+
+import pygame
+from game_core.config import BASE_COL, UI_BORDER1_COL, TEXT1_COL, STATUS_INIT_COL, adjust_color
+from game_other.text_cache import text_cache
+
+LS_BG_COLOR = adjust_color(BASE_COL, white_factor=0.0, exposure=1.2)
+LS_BAR_BG_COLOR = adjust_color(BASE_COL, white_factor=0.0, exposure=1.6)
+LS_BAR_COLOR = STATUS_INIT_COL
+LS_TEXT_COLOR = TEXT1_COL
+LS_FONT_SIZE = 36
+LS_BAR_WIDTH = 480
+LS_BAR_HEIGHT = 24
+LS_TEXT_GAP = 16
+
+_font = None
+
+def draw_loading_screen(screen, loaded, total):
+    global _font
+    if _font is None:
+        _font = pygame.font.SysFont(None, LS_FONT_SIZE)
+    # Keep the window responsive, input is not handled until the game loop starts
+    pygame.event.pump()
+    screen.fill(LS_BG_COLOR)
+    bar = pygame.Rect(0, 0, LS_BAR_WIDTH, LS_BAR_HEIGHT)
+    bar.center = screen.get_rect().center
+    pygame.draw.rect(screen, LS_BAR_BG_COLOR, bar, border_radius=4)
+    if total > 0:
+        filled = bar.copy()
+        filled.width = int(bar.width * min(loaded, total) / total)
+        pygame.draw.rect(screen, LS_BAR_COLOR, filled, border_radius=4)
+    pygame.draw.rect(screen, UI_BORDER1_COL, bar, width=1, border_radius=4)
+    text = text_cache.render(_font, f"Loading studio... {loaded} / {total}", True, LS_TEXT_COLOR)
+    screen.blit(text, text.get_rect(midbottom=(bar.centerx, bar.top - LS_TEXT_GAP)))
+    pygame.display.flip()
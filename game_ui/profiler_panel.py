@@ -1,17 +1,19 @@
 # profiler_panel.py (moved from profiler.py)
 # Place your profiling utilities here. If you have custom profiling code, paste it below.
 
-import time
 import pygame
+from game_core.config import FPS
+from game_other.profiler import profiler
+from game_other.text_cache import text_cache
 
-# Draws a profiler panel showing FPS, draw calls, and tick count in the top left area of the screen
+# Draws a profiler panel showing FPS, draw calls, tick count and per-phase frame timings in the top left area of the screen
 DP_FONT_SIZE = 25
 DP_ROW_SPACING = 20
 DP_BG_COLOR = (0, 0, 100, int(0.7 * 255))  # RGBA: blue, 70% opacity
 DP_TEXT_COLOR = (180, 180, 180)
 DP_PAD_X = 16
 DP_PAD_Y = 16
-DP_WIDTH = 250
+DP_WIDTH = 330
 
 _profiler_panel_visible = False
 
@@ -19,54 +21,100 @@ def handle_profiler_panel_toggle():
     global _profiler_panel_visible
     _profiler_panel_visible = not _profiler_panel_visible
 
-def _get_ms_history():
-    if not hasattr(_get_ms_history, 'history'):
-        _get_ms_history.history = []  # list of (timestamp, ms)
-    return _get_ms_history.history
+FLAME_BAR_HEIGHT = 14
+FLAME_BAR_GAP = 2
+FLAME_COLORS = [
+    (220, 120, 60), (80, 170, 220), (120, 200, 90), (200, 90, 170),
+    (230, 200, 70), (100, 110, 230), (90, 210, 180), (210, 80, 80),
+]
 
-def draw_profiler_panel(screen, clock, font, draw_call_count=None, tick_count=None, timings=None):
-    if not _profiler_panel_visible:
+def _phase_color(path):
+    # Children share their top-level phase's hue, slightly darker
+    top = path.split('/', 1)[0]
+    base = FLAME_COLORS[sum(map(ord, top)) % len(FLAME_COLORS)]
+    if '/' in path:
+        shade = 0.6 + 0.4 * ((sum(map(ord, path)) % 5) / 5)
+        return tuple(int(c * shade) for c in base)
+    return base
+
+def _draw_flame_bar(surf, x, y, width, phases):
+    """Stacked bar of the mean phase times of the recent frames: top-level phases, their children below."""
+    frame_ms = profiler.recent_frame_ms()
+    scale_ms = max(frame_ms, 1000.0 / FPS)  # Full width is at least one frame budget
+    if scale_ms <= 0:
         return
+    pygame.draw.rect(surf, (30, 30, 60), (x, y, width, FLAME_BAR_HEIGHT * 2 + FLAME_BAR_GAP))
+    starts = {}  # parent path -> x of its next child
+    px = x
+    for path in phases:
+        depth = path.count('/')
+        if depth > 1:
+            continue
+        w = int(width * profiler.recent_mean_ms(path) / scale_ms)
+        if depth == 0:
+            starts[path] = px
+            if w > 0:
+                pygame.draw.rect(surf, _phase_color(path), (px, y, w, FLAME_BAR_HEIGHT))
+            px += w
+        else:
+            parent = path.rsplit('/', 1)[0]
+            cx = starts.get(parent)
+            if cx is None:
+                continue
+            if w > 0:
+                pygame.draw.rect(surf, _phase_color(path), (cx, y + FLAME_BAR_HEIGHT + FLAME_BAR_GAP, w, FLAME_BAR_HEIGHT))
+            starts[parent] = cx + w
+    # Frame budget marker
+    budget_x = x + int(width * (1000.0 / FPS) / scale_ms)
+    pygame.draw.line(surf, (255, 255, 255), (budget_x, y - 2), (budget_x, y + FLAME_BAR_HEIGHT * 2 + FLAME_BAR_GAP + 2))
+
+def draw_profiler_panel(screen, clock, font, draw_call_count=None, tick_count=None, timings=None):
     """
-    Draws a profiler panel showing FPS, draw calls, tick count, and timings in the top left area of the screen.
+    Draws a profiler panel in the top left area of the screen: FPS, rolling p50/p95/p99 of the frame
+    and of every profiled phase (see game_other/profiler.py), per-frame counters and a stacked flame bar.
     Renders both the background and text onto a semi-transparent surface, then blits it to the main screen.
     """
-    w, h = screen.get_width(), screen.get_height()
+    if not _profiler_panel_visible:
+        return
     px = 0  # Absolute top-left
     py = 0  # Absolute top-left
     rows = [
         (f"FPS: {int(clock.get_fps())}", DP_TEXT_COLOR)
     ]
-    total_ms = None
     if draw_call_count is not None:
         rows.append((f"Draw calls: {draw_call_count}", DP_TEXT_COLOR))
     if tick_count is not None:
         rows.append((f"Tick: {tick_count}", DP_TEXT_COLOR))
+    font_renders = profiler.last_counters.get('font_render')
+    if font_renders is not None:
+        rows.append((f"Font renders: {font_renders}", DP_TEXT_COLOR))
+    text_hits = profiler.last_counters.get('text_cache_hit', 0)
+    text_misses = profiler.last_counters.get('text_cache_miss', 0)
+    if text_hits or text_misses:
+        rows.append((f"Text cache: {text_hits} hits / {text_misses} misses", DP_TEXT_COLOR))
+    rows.append((f"UI layer bakes: {profiler.last_counters.get('ui_bakes', 0)}", DP_TEXT_COLOR))
     if timings:
         for label, ms in timings.items():
             rows.append((f"{label}: {ms:.2f} ms", DP_TEXT_COLOR))
-        total_ms = sum(timings.values())
-        rows.append((f"Total: {total_ms:.2f} ms", DP_TEXT_COLOR))
-        # --- ms in last 10s ---
-        ms_history = _get_ms_history()
-        now = int(time.time())
-        # Only add a new record if the second has changed
-        if not ms_history or ms_history[-1][0] != now:
-            ms_history.append((now, total_ms))
-        # Keep only the last 10 seconds
-        ms_history[:] = [(t, ms) for t, ms in ms_history if now - t < 10]
-        if ms_history:
-            avg_ms = sum(ms for t, ms in ms_history) / len(ms_history)
-            rows.append((f"ms in last 10s: {avg_ms:.2f}", DP_TEXT_COLOR))
-    ph = DP_PAD_Y + len(rows) * DP_ROW_SPACING + 10  # Add 10px padding after last row
+    rows.append(("p50 / p95 / p99 ms", DP_TEXT_COLOR))
+    p50, p95, p99 = profiler.frame_percentiles()
+    rows.append((f"Frame: {p50:.2f} / {p95:.2f} / {p99:.2f}", DP_TEXT_COLOR))
+    phases = profiler.phases()
+    for path in phases:
+        depth = path.count('/')
+        p50, p95, p99 = profiler.phase_percentiles(path)
+        name = path.rsplit('/', 1)[-1]
+        rows.append((f"{'  ' * depth}{name}: {p50:.2f} / {p95:.2f} / {p99:.2f}", _phase_color(path)))
+    flame_height = FLAME_BAR_HEIGHT * 2 + FLAME_BAR_GAP
+    ph = DP_PAD_Y + len(rows) * DP_ROW_SPACING + 10 + flame_height + DP_PAD_Y  # Flame bar below the last row
     pw = DP_WIDTH
     surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
     surf.fill(DP_BG_COLOR)
     y = DP_PAD_Y
     for text, color in rows:
         if text:
-            text_surf = font.render(text, True, color)
+            text_surf = text_cache.render(font, text, True, color)
             surf.blit(text_surf, (DP_PAD_X, y))
         y += DP_ROW_SPACING
+    _draw_flame_bar(surf, DP_PAD_X, y + 10, pw - 2 * DP_PAD_X, phases)
     screen.blit(surf, (px, py))
-
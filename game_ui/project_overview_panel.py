@@ -4,6 +4,8 @@ import random
 from game_core.entity_definitions import *
 from game_core.config import *
 from game_core.game_state import GameState
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 PANEL_WIDTH = 1000
 PROGRESS_BAR_WIDTH = int(PANEL_WIDTH * 0.48)
@@ -90,12 +92,12 @@ class BaseItem:
             surface.blit(grad_surf, (bar_x, bar_y))
         # Draw progress number in the center of the bar as integer value (0-partitions)
         value = int(self.progress * self.partitions)
-        progress_text = font.render(f"{value} / {self.partitions}", True, TEXT1_COL)
+        progress_text = text_cache.render(font, f"{value} / {self.partitions}", True, TEXT1_COL)
         progress_rect = progress_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         surface.blit(progress_text, progress_rect)
         # Draw the name only if requested (for compatibility)
         if draw_name:
-            name_text = font.render(self.name, True, TEXT1_COL)
+            name_text = text_cache.render(font, self.name, True, TEXT1_COL)
             name_rect = name_text.get_rect(topleft=(bar_x + 10, bar_y - 4 - name_text.get_height()))
             surface.blit(name_text, name_rect)
 
@@ -147,17 +149,17 @@ class MinizedStatusBar:
         shots_in_queue = gs.total_shots_finished + gs.total_shots_goal
         # Title (centered)
         title_str = f"Project overview - {gs.total_shots_finished} / {shots_in_queue} shots finished"
-        title_text = self.font.render(title_str, True, TEXT1_COL)
+        title_text = text_cache.render(self.font, title_str, True, TEXT1_COL)
         title_rect = title_text.get_rect(midtop=(self.width // 2, y + 7))
         surface.blit(title_text, title_rect)
         # Artist work (left, same row)
         artist_str = f"Artist work: {gs.artist_progress_current} / {gs.artist_progress_goal}"
-        artist_text = self.font.render(artist_str, True, TEXT1_COL)
+        artist_text = text_cache.render(self.font, artist_str, True, TEXT1_COL)
         artist_rect = artist_text.get_rect(midleft=(20, title_rect.centery))
         surface.blit(artist_text, artist_rect)
         # Render work (right, same row)
         render_str = f"Render work: {gs.render_progress_current} / {gs.render_progress_goal}"
-        render_text = self.font.render(render_str, True, TEXT1_COL)
+        render_text = text_cache.render(self.font, render_str, True, TEXT1_COL)
         render_rect = render_text.get_rect(midright=(self.width - 20, title_rect.centery))
         surface.blit(render_text, render_rect)
 
@@ -170,10 +172,10 @@ class ProjectHeadline:
     def __init__(self, width, font=None):
         self.width = width
         self.text = random.choice(self.HEADLINES)
-        self.font = pygame.font.Font(FONT1, self.FONT_SIZE)
+        self.font = asset_manager.font(self.FONT_SIZE)
 
     def draw(self, surface, y=0):
-        text_surf = self.font.render(self.text, True, TEXT1_COL)
+        text_surf = text_cache.render(self.font, self.text, True, TEXT1_COL)
         text_rect = text_surf.get_rect(midtop=(self.width // 2, y))
         surface.blit(text_surf, text_rect)
 
@@ -182,13 +184,13 @@ class ProjectBudget:
     def __init__(self, width, font=None):
         self.width = width
         # Always use FONT_SIZE for the headline, ignore passed font size
-        self.font = pygame.font.Font(FONT1, self.FONT_SIZE)
+        self.font = asset_manager.font(self.FONT_SIZE)
 
     def draw(self, surface, y=0):
         gs = GameState()
         budget = getattr(gs, 'job_budget', 0)
         budget_str = f"Budget: {CURRENCY_SYMBOL}{budget}"
-        text = self.font.render(budget_str, True, TEXT1_COL)
+        text = text_cache.render(self.font, budget_str, True, TEXT1_COL)
         rect = text.get_rect(midtop=(self.width // 2, y))
         surface.blit(text, rect)
 
@@ -224,19 +226,19 @@ def bake_project_overview_panel(font, screen_width, resource_panel_height):
     pygame.draw.rect(panel_surface, UI_BG1_COL, (0, 0, panel_width, panel_height))
     pygame.draw.rect(panel_surface, UI_BORDER1_COL, (0, 0, panel_width, panel_height), 2)
     # Header
-    header_font = pygame.font.Font(FONT1, font.get_height() if font else 24)
+    header_font = asset_manager.font(font.get_height() if font else 24)
     header = MinizedStatusBar(panel_width, header_font)
     header.draw(panel_surface, y=0)
     # Draw ProjectHeadline (left) and ProjectBudget (right) on the same row
     project_headline = ProjectHeadline(panel_width, header_font)
     project_budget = ProjectBudget(panel_width, header_font)
     # Render headline centered
-    headline_surf = project_headline.font.render(project_headline.text, True, TEXT1_COL)
+    headline_surf = text_cache.render(project_headline.font, project_headline.text, True, TEXT1_COL)
     headline_rect = headline_surf.get_rect(midtop=(panel_width // 2, HEADER_TOP_MARGIN))
     panel_surface.blit(headline_surf, headline_rect)
     # Render budget centered below headline
     budget_str = f"Budget: {CURRENCY_SYMBOL}{getattr(gs, 'job_budget', 0)}"
-    budget_surf = project_budget.font.render(budget_str, True, TEXT1_COL)
+    budget_surf = text_cache.render(project_budget.font, budget_str, True, TEXT1_COL)
     budget_rect = budget_surf.get_rect(midtop=(panel_width // 2, headline_rect.bottom + 8))  # 8px gap
     panel_surface.blit(budget_surf, budget_rect)
     # RenderQueueItems with progress
@@ -272,7 +274,7 @@ def bake_project_overview_panel(font, screen_width, resource_panel_height):
         left_item = artist_items[idx]
         y = ITEMS_TOP_MARGIN + idx * (RQI_HEIGHT + ITEMS_SPACING) + 50
         # Draw shot name at the start of the row, vertically centered
-        shot_name_text = header_font.render(left_item.name, True, TEXT1_COL)
+        shot_name_text = text_cache.render(header_font, left_item.name, True, TEXT1_COL)
         shot_name_rect = shot_name_text.get_rect(midleft=(SHOT_NAME_LEFT_MARGIN, y + RQI_HEIGHT // 2))
         panel_surface.blit(shot_name_text, shot_name_rect)
         # Draw left bar centered at 35% of panel width
@@ -295,6 +297,26 @@ def bake_project_overview_panel(font, screen_width, resource_panel_height):
     _last_artist_progress = artist_progress_current
     return panel_surface
 
+# GameState fields shown (the panel also writes total_shots_finished while baking, see get_progress_items)
+PROJECT_OVERVIEW_FIELDS = (
+    'job_id', 'job_budget', 'total_shots_goal', 'total_shots_finished', 'artist_progress_current',
+    'artist_progress_goal', 'render_progress_current', 'render_progress_goal',
+)
+
+def project_overview_panel_rect(screen_width, resource_panel_height):
+    # Tallest the panel gets before the next frame, it only grows or shrinks towards the target height
+    height = max(_render_queue_panel_current_height, _render_queue_panel_target_height)
+    return pygame.Rect((screen_width - PANEL_WIDTH) // 2, resource_panel_height, PANEL_WIDTH, height)
+
+def project_overview_panel_key():
+    return _render_queue_panel_expanded, _render_queue_panel_target_height
+
+def project_overview_panel_animating():
+    if _render_queue_panel_anim_start_time is not None:
+        return True
+    # draw_project_overview_panel starts an animation when the job changes while unfolded
+    return _render_queue_panel_expanded and _last_baked_panel_job_id != GameState().job_id
+
 def draw_project_overview_panel(surface, font, screen_width, resource_panel_height, render_queue_items=None):
     global _render_queue_panel_expanded, _render_queue_panel_current_height, _render_queue_panel_target_height, _render_queue_panel_anim_start_time, _last_baked_panel_job_id
     panel_x = (screen_width - PANEL_WIDTH) // 2
@@ -1,5 +1,7 @@
 import pygame
 from game_core.config import UI_BG1_COL, TEXT1_COL
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 QUEST_PANEL_WIDTH = 280
 QUEST_PANEL_RIGHT_MARGIN = 50  # Offset from the right edge in pixels
@@ -30,8 +32,7 @@ class QuestItem:
             current_line = ""
             for word in words:
                 test_line = current_line + (" " if current_line else "") + word
-                test_surf = font.render(test_line, True, (200, 200, 200))
-                if test_surf.get_width() > max_width:
+                if font.size(test_line)[0] > max_width:
                     if current_line:
                         lines.append(current_line)
                     current_line = word
@@ -44,10 +45,10 @@ class QuestItem:
     def draw(self, surface, y=None, width=QUEST_PANEL_WIDTH, header_font=None, text_font=None):
         surf_w, surf_h = surface.get_width(), surface.get_height()
         if header_font is None:
-            header_font = pygame.font.SysFont(None, 28)
+            header_font = asset_manager.sys_font(28)
         if text_font is None:
-            text_font = pygame.font.SysFont(None, 24)
-        header_surf = header_font.render(self.header, True, (255, 255, 255))
+            text_font = asset_manager.sys_font(24)
+        header_surf = text_cache.render(header_font, self.header, True, (255, 255, 255))
         x = surf_w - width - QUEST_PANEL_RIGHT_MARGIN  # Panel starts QUEST_PANEL_WIDTH+margin from the right
         if y is None:
             y = int(surf_h * 0.5 - (header_surf.get_height() + 10 + len(self.get_wrapped_objective_lines(text_font, width))*24) // 2)
@@ -64,8 +65,7 @@ class QuestItem:
             lines = []
             for word in words:
                 test_line = current_line + (" " if current_line else "") + word
-                test_surf = text_font.render(test_line, True, (200, 200, 200))
-                if test_surf.get_width() > width:
+                if text_font.size(test_line)[0] > width:
                     if current_line:
                         lines.append(current_line)
                     current_line = word
@@ -82,7 +82,7 @@ class QuestItem:
                     text_x = check_x + checkmark.size + 7  # was +5, now +8 for +3px
                 else:
                     text_x = x + 15 + checkmark.size + 7  # was +5, now +8 for +3px
-                text_surf = text_font.render(line, True, (200, 200, 200))
+                text_surf = text_cache.render(text_font, line, True, (200, 200, 200))
                 surface.blit(text_surf, (text_x, line_y))
                 line_y += 24
 
@@ -92,10 +92,10 @@ class Header:
 
     def draw(self, surface, y, font=None):
         if font is None:
-            font = pygame.font.SysFont(None, 28)
+            font = asset_manager.sys_font(28)
         surf_w = surface.get_width()
         x = surf_w - QUEST_PANEL_WIDTH - QUEST_PANEL_RIGHT_MARGIN
-        header_surf = font.render(self.text, True, TEXT1_COL)
+        header_surf = text_cache.render(font, self.text, True, TEXT1_COL)
         # Draw background using UI_BG1_COL, extending to the far right (including margin)
         bg_rect = pygame.Rect(x - 8, y - 4, QUEST_PANEL_WIDTH + 8 + QUEST_PANEL_RIGHT_MARGIN, header_surf.get_height() + 8)
         bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
@@ -107,8 +107,8 @@ def draw_quest_panel(surface, active_deterministic, active_random):
     surf_h = surface.get_height()
     start_y = int(surf_h * ONSCREEN_TOP_MARGIN)  # Start at defined top margin ratio of the screen height
     y = start_y
-    text_font = pygame.font.SysFont(None, 24)
-    header_font = pygame.font.SysFont(None, 28)
+    text_font = asset_manager.sys_font(24)
+    header_font = asset_manager.sys_font(28)
     # Draw Main Quest header
     if active_deterministic:
         main_header = Header("Main Story:")
@@ -178,6 +178,17 @@ random_quests = [
 active_quests = []
 random_active_quests = []
 
+def quest_state(qs):
+    return [(q.header, q.completed, tuple((o.get('desc'), o.get('current'), o.get('required')) for o in q.objectives)) for q in qs]
+
+def quest_panel_key():
+    # Quests are not GameState fields, the compositor compares their state
+    return tuple(map(tuple, (quest_state(active_quests), quest_state(random_active_quests))))
+
+def quest_panel_rect(surface):
+    panel_width = QUEST_PANEL_WIDTH + QUEST_PANEL_RIGHT_MARGIN
+    return pygame.Rect(surface.get_width() - panel_width, 0, panel_width, surface.get_height())
+
 class QuestPanelCache:
     def __init__(self, width, height):
         self.width = width
@@ -192,8 +203,6 @@ class QuestPanelCache:
 
     def update_if_needed(self, deterministic, random):
         # Compare quest lists by id and completion state
-        def quest_state(qs):
-            return [(q.header, q.completed, tuple((o.get('desc'), o.get('current'), o.get('required')) for o in q.objectives)) for q in qs]
         if (self.last_deterministic != quest_state(deterministic) or
             self.last_random != quest_state(random)):
             self.dirty = True
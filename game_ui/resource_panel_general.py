@@ -1,9 +1,12 @@
 import pygame
 from game_core.config import *
 from game_core.game_state import GameState
+from game_core.simulation import time_scale_label
 from game_core.config import get_font1
+from game_other.asset_manager import asset_manager
 from typing import Optional, Tuple, Dict, Any
 import colorsys
+from game_other.text_cache import text_cache
 
 _font_cache: Dict[int, pygame.font.Font] = {}
 def get_cached_font(size: int) -> pygame.font.Font:
@@ -19,7 +22,7 @@ RESOURCE_PANEL_CELLS = {
         "label": "Day",
         "icon": resource_path("data/graphics/resource_panel/day.png"),
         "value_getter": lambda gs: int(gs.game_time_days),
-        "format": lambda v, gs: str(v),
+        "format": lambda v, gs: str(v) if gs.time_scale == 1 else f"{v}  {time_scale_label(gs.time_scale)}",
     },
     (0, 3): {
         "key": "temperature",
@@ -126,6 +129,15 @@ PROBLEM_PANEL_CELLS = {
     },
     # Add more as needed
 }
+asset_manager.register(*(cell.get("icon") for cells in (RESOURCE_PANEL_CELLS, PROBLEM_PANEL_CELLS) for cell in cells.values()))
+# GameState fields shown; the day and temperature change every tick, resource_panel_key() has them as displayed
+RESOURCE_PANEL_FIELDS = (
+    'time_scale', 'total_power_drain', 'total_breaker_strength', 'total_employees', 'total_money',
+    'total_upkeep', 'office_quality', 'total_risky_entities', 'total_broken_entities',
+)
+
+def resource_panel_key(gs):
+    return int(gs.game_time_days), round(gs.temperature, 1)
 
 class BasicCell:
     cell_width = 200
@@ -138,14 +150,8 @@ class BasicCell:
         self.label_text_size = int(label_text_size)
         self.icon = None
         if isinstance(icon, str):
-            loaded_icon = pygame.image.load(icon).convert_alpha()
-            loaded_icon = pygame.transform.smoothscale(loaded_icon, (36, 36))
-            color = self.ICON_COLOR
-            colored_icon = pygame.Surface(loaded_icon.get_size(), pygame.SRCALPHA)
-            colored_icon.fill(color)  # Fill with color, alpha 0
-            alpha = pygame.surfarray.pixels_alpha(loaded_icon)
-            pygame.surfarray.pixels_alpha(colored_icon)[:, :] = alpha[:, :]
-            self.icon = colored_icon
+            # Icon in ICON_COLOR, keeping its alpha
+            self.icon = asset_manager.scaled(icon, 36, 36, tint=self.ICON_COLOR)
         self.surface = self._create_surface()
         self.value_surface = None
         self.last_value = None
@@ -171,7 +177,7 @@ class BasicCell:
             for line in lines:
                 text_width, text_height = label_font.size(line)
                 x = 0 + icon_offset
-                surf = label_font.render(line, True, TEXT1_COL)
+                surf = text_cache.render(label_font, line, True, TEXT1_COL)
                 surface.blit(surf, (x, y))
                 y += text_height
         return surface
@@ -208,7 +214,7 @@ class BasicCell:
         font = self.get_value_font(base_font)
         x, y = self.get_value_pos(font, value_str)
         self.value_surface = pygame.Surface((self.cell_width, self.cell_height), pygame.SRCALPHA)
-        value_surf = font.render(value_str, True, color)
+        value_surf = text_cache.render(font, value_str, True, color)
         self.value_surface.blit(value_surf, (x, y))
 
     def blit_to(self, target_surface: pygame.Surface, pos: Tuple[int, int]):
@@ -244,7 +250,7 @@ class Header:
         surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         surface.fill(UI_BG1_COL)
         pygame.draw.rect(surface, UI_BORDER1_COL, surface.get_rect(), 2)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=(self.width//2, self.height//2 + 2))
         surface.blit(text_surf, text_rect)
         return surface
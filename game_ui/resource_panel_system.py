@@ -1,7 +1,18 @@
 import pygame
 from game_core.config import UI_BG1_COL, UI_BORDER1_COL, TEXT1_COL, resource_path
 from game_core.game_state import GameState
+from game_other.asset_manager import asset_manager
 from typing import Optional, Tuple
+from game_other.text_cache import text_cache
+
+SYSTEM_ICONS = (
+    resource_path("data/graphics/internet.png"),
+    resource_path("data/graphics/nas.png"),
+    resource_path("data/graphics/wifi.png"),
+    resource_path("data/graphics/storage.png"),
+)
+asset_manager.register(*SYSTEM_ICONS)
+SYSTEM_PANEL_FIELDS = ('is_internet_online', 'is_nas_online')  # GameState fields shown, see get_system_panel_state
 
 def get_cached_font(size: int):
     from game_core.config import get_font1
@@ -34,7 +45,7 @@ class SystemCell:
             label_font = get_cached_font(self.label_text_size)
             surf = pygame.Surface((self.cell_width, self.cell_height), pygame.SRCALPHA)
             surf.fill((0,0,0,0))
-            text_surf = label_font.render(str(label), True, self.text_color)
+            text_surf = text_cache.render(label_font, str(label), True, self.text_color)
             rect = text_surf.get_rect(midleft=(x_offset, self.cell_height//2))
             surf.blit(text_surf, rect)
             self.dynamic_text_surface = surf
@@ -46,17 +57,12 @@ class SystemCell:
             target_surface.blit(self.dynamic_text_surface, pos)
 
 def get_system_panel_cells(font=None):
-    icon_files = [
-        resource_path("data/graphics/internet.png"),
-        resource_path("data/graphics/nas.png"),
-        resource_path("data/graphics/wifi.png"),
-        resource_path("data/graphics/storage.png"),
-    ]
+    icon_files = SYSTEM_ICONS
     system_labels = [
         "Connected", "Running",
         "WiFi OK", "15 / 25 TB"
     ]
-    system_icons = [pygame.image.load(fname).convert_alpha() for fname in icon_files]
+    system_icons = [asset_manager.image(fname) for fname in icon_files]
     def get_internet_label():
         gs = GameState()
         return "Online" if getattr(gs, 'is_internet_online', True) else "Offline"
@@ -78,29 +84,12 @@ def update_icon_surfaces(is_internet_online, is_nas_online, font: Optional[pygam
     Tint and cache the icon surfaces for the current is_internet_online and is_nas_online state.
     This should be called only at game start and when either state changes.
     """
-    icon_files = [
-        resource_path("data/graphics/internet.png"),
-        resource_path("data/graphics/nas.png"),
-        resource_path("data/graphics/wifi.png"),
-        resource_path("data/graphics/storage.png"),
-    ]
+    icon_files = SYSTEM_ICONS
     icon_size = 40
-    if not hasattr(update_icon_surfaces, "_icon_cache"):
-        update_icon_surfaces._icon_cache = [pygame.image.load(fname).convert_alpha() for fname in icon_files]
-    system_icons = update_icon_surfaces._icon_cache
-    def tint_icon(icon, color):
-        icon = pygame.transform.smoothscale(icon, (icon_size, icon_size))
-        tinted = icon.copy()
-        arr = pygame.surfarray.pixels3d(tinted)
-        arr[:, :, 0] = color[0]
-        arr[:, :, 1] = color[1]
-        arr[:, :, 2] = color[2]
-        del arr
-        return tinted
     ONLINE = (0, 255, 0)
     OFFLINE = (0, 0, 0)
     icon_surfaces = []
-    for idx, icon in enumerate(system_icons):
+    for idx, icon_file in enumerate(icon_files):
         if idx == 0:  # internet.png
             color = ONLINE if is_internet_online else OFFLINE
         elif idx == 1:  # nas.png
@@ -109,7 +98,7 @@ def update_icon_surfaces(is_internet_online, is_nas_online, font: Optional[pygam
             color = ONLINE if is_internet_online else OFFLINE
         else:
             color = ONLINE
-        icon_surfaces.append(tint_icon(icon, color))
+        icon_surfaces.append(asset_manager.scaled(icon_file, icon_size, icon_size, tint=color))
     update_icon_surfaces._icon_surfaces = icon_surfaces
     update_icon_surfaces._icon_state = (is_internet_online, is_nas_online)
 
@@ -184,7 +173,7 @@ class Header:
         surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         surface.fill(UI_BG1_COL)
         pygame.draw.rect(surface, UI_BORDER1_COL, surface.get_rect(), 2)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=(self.width//2, self.height//2 + 2))
         surface.blit(text_surf, text_rect)
         return surface
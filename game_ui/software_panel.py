@@ -2,9 +2,17 @@ import pygame
 import math
 import time
 from game_core.config import UI_BG1_COL, resource_path
+from game_other.asset_manager import asset_manager
 from game_other.audio import play_software_select_sound
+from game_other.text_cache import text_cache
 
 SOFTWARE_BUTTON_SIZE = 70
+SOFTWARE_ICONS = (
+    "data/graphics/software_panel/houdini.png",
+    "data/graphics/software_panel/blender.png",
+    "data/graphics/software_panel/c4d.png",
+)
+asset_manager.register(*SOFTWARE_ICONS)
 
 class Selected:
     def __init__(self, size=40, color=(0, 255, 180)):
@@ -53,13 +61,9 @@ class SoftwareButton:
         self.icon = None
         self.desc_text = desc_text
         if icon_path:
-            try:
-                icon_img = pygame.image.load(resource_path(icon_path)).convert_alpha()
-                # Scale icon to fit nicely inside the hexagon
-                icon_size = int(self.size * 1.1)
-                self.icon = pygame.transform.smoothscale(icon_img, (icon_size, icon_size))
-            except Exception as e:
-                print(f"Failed to load icon: {icon_path} - {e}")
+            # Scale icon to fit nicely inside the hexagon
+            icon_size = int(self.size * 1.1)
+            self.icon = asset_manager.scaled(icon_path, icon_size, icon_size)
 
     def get_hexagon_points(self):
         x, y = self.center
@@ -159,9 +163,9 @@ class Description:
             pygame.draw.rect(surface, self.color, (self.x, self.y - self.height, rect_w, self.height))
             # Draw text if rectangle is at least 100px wide
             if rect_w > 100:
-                font = pygame.font.SysFont(None, 28)
+                font = asset_manager.sys_font(28)
                 text = self.text
-                text_surf = font.render(text, True, (255, 255, 255))
+                text_surf = text_cache.render(font, text, True, (255, 255, 255))
                 text_rect = text_surf.get_rect()
                 text_rect.topleft = (self.x + 20, self.y - self.height + 10)
                 # Only blit if at least part of the text is visible
@@ -173,12 +177,10 @@ class Description:
                     surface.blit(text_surf, text_rect)
                     surface.set_clip(prev_clip)
 
-def draw_software_panel(surface, size=SOFTWARE_BUTTON_SIZE, color=UI_BG1_COL, margin_ratio=0.05, cache={}, mouse_pos=None, mouse_pressed=False, selected_idx=None):
-    surf_w, surf_h = surface.get_width(), surface.get_height()
+def _software_panel_layout(surf_w, surf_h, size):
     spacing = 2
     dx = size * math.sqrt(3) + spacing
     dy = size * 1.5 + spacing / 2
-    icon_path = "data/graphics/software_panel/c4d.png"
     # Calculate button centers (relative to panel)
     btn_centers = [
         (0, dy),
@@ -192,13 +194,22 @@ def draw_software_panel(surface, size=SOFTWARE_BUTTON_SIZE, color=UI_BG1_COL, ma
     max_y = max(c[1] for c in btn_centers) + size
     panel_w = int(max_x - min_x)
     panel_h = int(max_y - min_y)
-    # Use a cache key based on size, color, icon_path
-    cache_key = (size, color, icon_path)
-    offset_x = -min_x
-    offset_y = -min_y
     # Place 10% from left and 10% from bottom
     x = int(surf_w * 0.04)
     y = int(surf_h * 0.96) - panel_h
+    return btn_centers, -min_x, -min_y, pygame.Rect(x, y, panel_w, panel_h)
+
+def software_panel_rect(surface, size=SOFTWARE_BUTTON_SIZE):
+    """Screen area of the software buttons (the description box follows the mouse, outside of it)."""
+    return _software_panel_layout(surface.get_width(), surface.get_height(), size)[3]
+
+def draw_software_panel(surface, size=SOFTWARE_BUTTON_SIZE, color=UI_BG1_COL, margin_ratio=0.05, cache={}, mouse_pos=None, mouse_pressed=False, selected_idx=None):
+    surf_w, surf_h = surface.get_width(), surface.get_height()
+    icon_path = "data/graphics/software_panel/c4d.png"
+    btn_centers, offset_x, offset_y, layout_rect = _software_panel_layout(surf_w, surf_h, size)
+    x, y, panel_w, panel_h = layout_rect
+    # Use a cache key based on size, color, icon_path
+    cache_key = (size, color, icon_path)
     # Compute absolute button centers (on main surface)
     abs_btn_centers = [
         (btn_centers[0][0] + offset_x, btn_centers[0][1] + offset_y),
@@ -262,13 +273,17 @@ def draw_software_panel(surface, size=SOFTWARE_BUTTON_SIZE, color=UI_BG1_COL, ma
                 cache['selected_idx'] = i
                 # Set software_choice in GameState singleton
                 from game_core.game_state import GameState
+                from game_core.rng import input_log
                 gs = GameState()
+                prev_choice = gs.software_choice
                 if i == 2:  # C4D
                     gs.software_choice = 1
                 elif i == 1:  # Blender
                     gs.software_choice = 2
                 elif i == 0:  # Houdini
                     gs.software_choice = 3
+                if gs.software_choice != prev_choice:
+                    input_log.record('set', name='software_choice', value=gs.software_choice)
                 # Play software select sound only on new click
                 if not prev_mouse_pressed:
                     play_software_select_sound()
@@ -1,9 +1,12 @@
 import pygame
 pygame.font.init()
 from game_core.config import UI_BG1_COL, UI_BORDER1_COL, BASE_COL, adjust_color, get_font1, resource_path
+from game_other.asset_manager import asset_manager
 from game_core.game_state import GameState, SUPPLIES_RND_MAX, SUPPLIES_MAX
+from game_core.rng import input_log
 from game_other.audio import play_purchase_sound
 from game_core.config import CURRENCY_SYMBOL
+from game_other.text_cache import text_cache
 
 FOLDED_WIDTH = 80
 FOLDED_HEIGHT = 80
@@ -24,7 +27,7 @@ def draw_progress_bar_with_label(surface, label, progress, font, x, y, bar_width
         text = f"{value} / {max_value} {label}"
     else:
         text = f"{filled} / {num_cells} {label}"
-    text_surf = font.render(text, True, text_color)
+    text_surf = text_cache.render(font, text, True, text_color)
     surface.blit(text_surf, (x, y))
     bar_y = y + text_surf.get_height() + 2
     # Use float division for cell_w
@@ -76,7 +79,7 @@ class ExpandingPanelContent:
     def draw(self, surface, x, y, icon_width=0, icon_height=0):
         header_x = x + 20
         header_y = y + 20
-        header_surf = self.header_font.render(self.header, True, self.header_color)
+        header_surf = text_cache.render(self.header_font, self.header, True, self.header_color)
         surface.blit(header_surf, (header_x, header_y))
         text_y = header_y + header_surf.get_height() + 12
         bar_width = UNFOLDED_WIDTH * 0.9
@@ -238,17 +241,13 @@ class IconButton:
         panel_rect = pygame.Rect(self.x, y, self.button_width, self.button_height)
         pygame.draw.rect(surface, UI_BG1_COL, panel_rect, border_radius=ROUNDING)
         pygame.draw.rect(surface, UI_BORDER1_COL, panel_rect, width=3, border_radius=ROUNDING)
-        icon_path = resource_path(self.icon_path) if self.icon_path else resource_path('data/graphics/supplies_panel/supplies.png')
-        icon = None
+        icon_path = self.icon_path or 'data/graphics/supplies_panel/supplies.png'
         icon_size = min(self.button_width, self.button_height) - 16
         icon_x = self.x + (self.button_width - icon_size) // 2
         icon_y = y + (self.button_height - icon_size) // 2
-        try:
-            icon = pygame.image.load(icon_path).convert_alpha()
-            icon = pygame.transform.smoothscale(icon, (icon_size, icon_size))
+        icon = asset_manager.scaled(icon_path, icon_size, icon_size)
+        if icon is not None:
             surface.blit(icon, (icon_x, icon_y))
-        except Exception:
-            pass
         # Draw indicators to the right of the button (below the expanding panel)
         self.indicators.draw(surface)
         # Draw the expanded content area to the right using ExpandingPanel (draw after indicators so it covers them)
@@ -275,7 +274,7 @@ class ResupplyButton:
             color = adjust_color(BASE_COL, white_factor=0.0, exposure=1)
         text_color = adjust_color(BASE_COL, white_factor=0.0, exposure=3)
         pygame.draw.rect(surface, color, self.rect, border_radius=2)
-        text_surf = self.font.render(self.label, True, text_color)
+        text_surf = text_cache.render(self.font, self.label, True, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -290,7 +289,7 @@ class ResupplyButton:
         pygame.draw.rect(surface, second_color, second_rect, border_radius=2)
         price = get_resupply_price()
         price_font = get_font1(14)
-        price_surf = price_font.render(f"{price}{CURRENCY_SYMBOL}", True, second_text_color)
+        price_surf = text_cache.render(price_font, f"{price}{CURRENCY_SYMBOL}", True, second_text_color)
         price_rect = price_surf.get_rect(center=second_rect.center)
         surface.blit(price_surf, price_rect)
 
@@ -332,6 +331,8 @@ panel_configs = [
         'icon_path': 'data/graphics/supplies_panel/medicine.png',
     }
 ]
+asset_manager.register(*(cfg['icon_path'] for cfg in panel_configs))
+SUPPLIES_PANEL_FIELDS = tuple(line['attr'] for cfg in panel_configs for line in cfg['lines'])  # GameState fields shown
 
 def get_panel_progress_and_values(lines):
     gs = GameState()
@@ -364,6 +365,22 @@ def get_resupply_price():
                     total_missing += missing
     return total_missing * 10
 
+def resupply():
+    """Buy all supplies back up to SUPPLIES_MAX. Also called when replaying an input log."""
+    input_log.record('resupply')
+    gs = GameState()
+    price = get_resupply_price()
+    gs.total_money -= price
+    gs.total_cables = SUPPLIES_MAX
+    gs.total_mouses = SUPPLIES_MAX
+    gs.total_keyboards = SUPPLIES_MAX
+    gs.total_coffee_beans = SUPPLIES_MAX
+    gs.total_milk = SUPPLIES_MAX
+    gs.total_sugar = SUPPLIES_MAX
+    gs.total_ibalgin = SUPPLIES_MAX
+    gs.total_bandages = SUPPLIES_MAX
+    gs.total_pcr_test = SUPPLIES_MAX
+
 def create_panels(surface):
     panels = []
     panel_spacing = FOLDED_HEIGHT * 1.1
@@ -398,18 +415,7 @@ def handle_supplies_panel_event(event, surface):
         resupply_button = ResupplyButton(SUPPLIES_PANEL_X, first_panel_y - 10 - 50)  # 30 is button height
     if resupply_button.handle_event(event):
         play_purchase_sound()
-        gs = GameState()
-        price = get_resupply_price()
-        gs.total_money -= price
-        gs.total_cables = SUPPLIES_MAX
-        gs.total_mouses = SUPPLIES_MAX
-        gs.total_keyboards = SUPPLIES_MAX
-        gs.total_coffee_beans = SUPPLIES_MAX
-        gs.total_milk = SUPPLIES_MAX
-        gs.total_sugar = SUPPLIES_MAX
-        gs.total_ibalgin = SUPPLIES_MAX
-        gs.total_bandages = SUPPLIES_MAX
-        gs.total_pcr_test = SUPPLIES_MAX
+        resupply()
         update_panel_contents()
         return True
     clicked_idx = None
@@ -445,6 +451,18 @@ def update_panel_contents():
                 panel.content.progress_values = progress_values
                 panel.content.value_pairs = value_pairs
 
+def supplies_panel_rect(surface):
+    """Screen area of the supplies panel: the left strip the buttons and their unfolded panels use."""
+    return pygame.Rect(SUPPLIES_PANEL_X, 0, FOLDED_WIDTH + UNFOLDED_WIDTH, surface.get_height())
+
+def supplies_panel_key():
+    # Inputs other than SUPPLIES_PANEL_FIELDS: hover, which panels are unfolded and their drawing order
+    hovered = resupply_button.hovered if resupply_button is not None else False
+    return hovered, tuple((id(panel), panel.expanded) for panel in panels)
+
+def supplies_panel_animating():
+    return any(panel.expanding_panel.animating for panel in panels)
+
 def draw_supplies_panel(surface):
     global panels, resupply_button
     if not panels or len(panels) != len(panel_configs):
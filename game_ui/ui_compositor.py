@@ -0,0 +1,106 @@
+# game_ui/ui_compositor.py
+# Retained UI layers: each panel is baked into its own cached surface and re-baked only when the
+# GameState fields (or other inputs) it declares change, or while it animates. Field changes are
+# read from the GameState field versions, the values themselves are not compared.
+# draw_all_panels() hands the panels to the compositor in drawing order, every frame.
+
+import pygame
+
+from game_core.game_state import GameState
+from game_other.profiler import profiler
+
+class UILayer:
+    __slots__ = ('name', 'surface', 'pos', 'signature', 'result', 'bakes')
+
+    def __init__(self, name):
+        self.name = name
+        self.surface = None  # Baked pixels, cropped to what the panel drew
+        self.pos = (0, 0)
+        self.signature = None  # Inputs of the last bake
+        self.result = None  # What the panel's draw function returned on its last bake
+        self.bakes = 0
+
+class UICompositor:
+    """
+    A panel is baked by drawing it, at its screen position, into a transparent screen-sized canvas
+    clipped to the panel's rect; the drawn part is cropped and kept. pygame copies what is blitted
+    onto fully transparent pixels, so the layer blitted onto the screen looks the same as the panel
+    drawn straight onto it.
+    A layer is re-baked when its signature changes: the GameState version of its state_fields,
+    its key and the screen size. While animating is true the panel draws straight onto the screen instead.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(UICompositor, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        self.enabled = True  # False: every panel draws straight onto the screen (immediate mode)
+        self._layers = {}  # name -> UILayer
+        self._canvas = None
+        self._initialized = True
+
+    def layer(self, surface, name, draw, rect, state_fields=(), key=None, animating=False):
+        """
+        Blit panel `name` onto surface, re-baking it first if its inputs changed.
+        draw(target): draws the panel onto target (screen coordinates), returns anything.
+        rect: screen area the panel draws into, nothing outside it is kept.
+        state_fields: GameState attribute names the panel shows. key: other inputs (hashable).
+        Returns what draw returned when the panel was last drawn.
+        """
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = self._layers[name] = UILayer(name)
+        if animating or not self.enabled:
+            layer.signature = None  # Bake again once the animation is over
+            layer.result = draw(surface)
+            return layer.result
+        gs = GameState()
+        signature = (gs.version(*state_fields), key, surface.get_size())
+        if signature != layer.signature:
+            self._bake(surface, layer, draw, pygame.Rect(rect))
+            layer.signature = signature
+        if layer.surface is not None:
+            surface.blit(layer.surface, layer.pos)
+            profiler.count('blits')
+        return layer.result
+
+    def _bake(self, surface, layer, draw, rect):
+        size = surface.get_size()
+        if self._canvas is None or self._canvas.get_size() != size:
+            self._canvas = pygame.Surface(size, pygame.SRCALPHA)
+        canvas = self._canvas
+        rect = rect.clip(canvas.get_rect())
+        canvas.set_clip(rect)
+        canvas.fill((0, 0, 0, 0), rect)
+        layer.result = draw(canvas)
+        canvas.set_clip(None)
+        drawn = canvas.subsurface(rect).get_bounding_rect()
+        if drawn.width and drawn.height:
+            drawn.move_ip(rect.topleft)
+            layer.surface = canvas.subsurface(drawn).copy()
+            layer.pos = drawn.topleft
+        else:
+            layer.surface = None
+        layer.bakes += 1
+        profiler.count('ui_bakes')
+
+    def invalidate(self, name=None):
+        """Re-bake one layer (or all of them) on their next draw, for inputs they do not declare."""
+        if name is None:
+            layers = self._layers.values()
+        else:
+            layers = [self._layers[name]] if name in self._layers else []
+        for layer in layers:
+            layer.signature = None
+
+    def layers(self):
+        return list(self._layers.values())
+
+# Singleton accessor
+ui_compositor = UICompositor()
@@ -1,6 +1,8 @@
 import pygame
 from typing import Optional
 from game_core.zone_state import zone_state
+from game_other.asset_manager import asset_manager
+from game_other.text_cache import text_cache
 
 ZONE_BUTTON_COLOR = (80, 180, 255)
 ZONE_BUTTON_HOVER_COLOR = (120, 220, 255)
@@ -17,7 +19,7 @@ class ZoneButton:
         self.rect = pygame.Rect(0, 0, self.WIDTH, self.HEIGHT)
         self.rect.center = center_pos
         self.text = text
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = asset_manager.sys_font(36)
         self.color = ZONE_BUTTON_COLOR
         self.hover_color = ZONE_BUTTON_HOVER_COLOR
         self.border_color = ZONE_BUTTON_BORDER_COLOR
@@ -30,7 +32,7 @@ class ZoneButton:
         color = self.hover_color if is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=ZONE_BUTTON_RADIUS)
         pygame.draw.rect(surface, self.border_color, self.rect, 3, border_radius=ZONE_BUTTON_RADIUS)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -229,13 +231,13 @@ def draw_zone_info_overlay(surface: pygame.Surface):
     if not zones:
         return
     info_lines = [format_zone_info(z) for z in zones]
-    font = pygame.font.SysFont(None, 32)
+    font = asset_manager.sys_font(32)
     width = max(font.size(line)[0] for line in info_lines) + 40
     height = len(info_lines) * font.get_height() + 30
     surf = pygame.Surface((width, height), pygame.SRCALPHA)
     surf.fill((30, 30, 30, 220))
     for i, line in enumerate(info_lines):
-        text = font.render(line, True, (255, 255, 255))
+        text = text_cache.render(font, line, True, (255, 255, 255))
         surf.blit(text, (20, 15 + i * font.get_height()))
     x = (surface.get_width() - width) // 2
     y = (surface.get_height() - height) // 2